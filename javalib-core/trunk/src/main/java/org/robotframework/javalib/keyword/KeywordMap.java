@@ -23,6 +23,7 @@ import org.apache.commons.collections.functors.TruePredicate;
 import org.apache.commons.collections.functors.UniquePredicate;
 import org.apache.commons.collections.map.HashedMap;
 import org.apache.commons.collections.map.PredicatedMap;
+import org.robotframework.javalib.util.KeywordNameNormalizer;
 
 /**
  * A data structure for keywords and related values, such as instances or
@@ -70,13 +71,7 @@ public class KeywordMap {
         if (keywordName == null) {
             return null;
         }
-        keywordName = keywordName.toLowerCase().trim();
-        keywordName = keywordName.replaceAll(" ", "");
-        keywordName = keywordName.replaceAll("_", "");
-        keywordName = keywordName.replaceAll("\t", "");
-        keywordName = keywordName.replaceAll("\r", "");
-        keywordName = keywordName.replaceAll("\n", "");
-        return keywordName;
+        return KeywordNameNormalizer.normalizeName(keywordName);
     }
     
     /**
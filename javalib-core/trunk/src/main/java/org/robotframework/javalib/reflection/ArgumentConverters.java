@@ -0,0 +1,140 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *  
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.robotframework.javalib.reflection;
+
+import java.util.Arrays;
+import java.util.List;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+
+/**
+ * Registry of converters from Robot's string arguments to keyword parameter
+ * types. Converters for numbers, booleans, characters and lists are
+ * registered by default, and libraries can register their own.
+ */
+public class ArgumentConverters {
+    private static final Map<Class<?>, IArgumentConverter> converters = new ConcurrentHashMap<Class<?>, IArgumentConverter>();
+
+    static {
+        register(new StringConverter("int") {
+            Object convert(String argument) {
+                return Integer.valueOf(argument.trim());
+            }
+        }, int.class, Integer.class);
+        register(new StringConverter("long") {
+            Object convert(String argument) {
+                return Long.valueOf(argument.trim());
+            }
+        }, long.class, Long.class);
+        register(new StringConverter("short") {
+            Object convert(String argument) {
+                return Short.valueOf(argument.trim());
+            }
+        }, short.class, Short.class);
+        register(new StringConverter("byte") {
+            Object convert(String argument) {
+                return Byte.valueOf(argument.trim());
+            }
+        }, byte.class, Byte.class);
+        register(new StringConverter("double") {
+            Object convert(String argument) {
+                return Double.valueOf(argument.trim());
+            }
+        }, double.class, Double.class);
+        register(new StringConverter("float") {
+            Object convert(String argument) {
+                return Float.valueOf(argument.trim());
+            }
+        }, float.class, Float.class);
+        register(new StringConverter("boolean") {
+            Object convert(String argument) {
+                if ("true".equalsIgnoreCase(argument.trim()))
+                    return Boolean.TRUE;
+                if ("false".equalsIgnoreCase(argument.trim()))
+                    return Boolean.FALSE;
+                throw new IllegalArgumentException();
+            }
+        }, boolean.class, Boolean.class);
+        register(new StringConverter("char") {
+            Object convert(String argument) {
+                if (argument.length() != 1)
+                    throw new IllegalArgumentException();
+                return Character.valueOf(argument.charAt(0));
+            }
+        }, char.class, Character.class);
+        register(new IArgumentConverter() {
+            public Object convert(Object argument) {
+                if (argument instanceof Object[])
+                    return Arrays.asList((Object[]) argument);
+                return argument;
+            }
+        }, List.class);
+    }
+
+    /**
+     * Registers a converter for the given parameter types, replacing the
+     * earlier converter for them. Affects keywords created after this call.
+     */
+    public static void register(IArgumentConverter converter, Class<?>... parameterTypes) {
+        for (Class<?> parameterType : parameterTypes)
+            converters.put(parameterType, converter);
+    }
+
+    /**
+     * @return converter for the parameter type, or <code>null</code> if
+     *         arguments are passed as they are
+     */
+    public static IArgumentConverter getConverter(Class<?> parameterType) {
+        return converters.get(parameterType);
+    }
+
+    /**
+     * Resolves converters for all the parameters of a method at once.
+     *
+     * @return converters in parameter order, or <code>null</code> if none of
+     *         the parameters needs conversion
+     */
+    public static IArgumentConverter[] getConverters(Class<?>[] parameterTypes) {
+        IArgumentConverter[] parameterConverters = new IArgumentConverter[parameterTypes.length];
+        boolean found = false;
+        for (int i = 0; i < parameterTypes.length; i++) {
+            parameterConverters[i] = getConverter(parameterTypes[i]);
+            found |= parameterConverters[i] != null;
+        }
+        return found ? parameterConverters : null;
+    }
+
+    private static abstract class StringConverter implements IArgumentConverter {
+        private final String typeName;
+
+        StringConverter(String typeName) {
+            this.typeName = typeName;
+        }
+
+        public Object convert(Object argument) {
+            if (!(argument instanceof String))
+                return argument;
+            try {
+                return convert((String) argument);
+            } catch (IllegalArgumentException e) {
+                throw new IllegalArgumentException("Argument '" + argument + "' cannot be converted to " + typeName, e);
+            }
+        }
+
+        abstract Object convert(String argument);
+    }
+}
@@ -19,10 +19,12 @@ package org.robotframework.javalib.reflection;
 import org.robotframework.javalib.util.ArrayUtil;
 
 public class ArgumentGrouper implements IArgumentGrouper {
-    private final Class<?>[] parameterTypes;
+    private final int parameterCount;
+    private final boolean lastArgIsAnArray;
 
     public ArgumentGrouper(Class<?>[] parameterTypes) {
-        this.parameterTypes = parameterTypes;
+        this.parameterCount = parameterTypes.length;
+        this.lastArgIsAnArray = parameterCount > 0 && parameterTypes[parameterCount - 1].isArray();
     }
 
     public Object[] groupArguments(Object[] ungroupedArguments) {
@@ -38,8 +40,8 @@ public class ArgumentGrouper implements IArgumentGrouper {
     }
     
     private boolean shouldNotGroupArguments(Object[] ungroupedArguments) {
-        return ungroupedArguments == null || parameterTypes.length == 0 ||
-            parameterTypes.length == ungroupedArguments.length && !lastArgIsAnArray();
+        return ungroupedArguments == null || parameterCount == 0 ||
+            parameterCount == ungroupedArguments.length && !lastArgIsAnArray;
     }
     
     private String[] asStrings(Object[] ungroupedArguments) {
@@ -62,14 +64,10 @@ public class ArgumentGrouper implements IArgumentGrouper {
     }
 
     private Object[] extractBeginningOfArguments(Object[] ungroupedArguments) {
-        return ArrayUtil.copyOfRange(ungroupedArguments, 0, parameterTypes.length - 1);
+        return ArrayUtil.copyOfRange(ungroupedArguments, 0, parameterCount - 1);
     }
 
     private Object[] extractRestOfArguments(Object[] ungroupedArguments) {
-        return ArrayUtil.copyOfRange(ungroupedArguments, parameterTypes.length - 1, ungroupedArguments.length);
-    }
-
-    private boolean lastArgIsAnArray() {
-        return parameterTypes[parameterTypes.length - 1].isArray();
+        return ArrayUtil.copyOfRange(ungroupedArguments, parameterCount - 1, ungroupedArguments.length);
     }
 }
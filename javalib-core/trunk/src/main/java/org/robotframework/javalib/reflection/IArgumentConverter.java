@@ -0,0 +1,27 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *  
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.robotframework.javalib.reflection;
+
+public interface IArgumentConverter {
+    /**
+     * Converts a keyword argument to the type of the keyword's parameter.
+     * Arguments that are already of the right type are returned as they are.
+     *
+     * @throws IllegalArgumentException if the argument cannot be converted
+     */
+    Object convert(Object argument);
+}
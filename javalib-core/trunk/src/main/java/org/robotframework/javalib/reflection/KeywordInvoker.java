@@ -30,10 +30,14 @@ public class KeywordInvoker implements IKeywordInvoker {
 
     private final Method method;
     private final Object obj;
+    private final IArgumentConverter[] argumentConverters;
+    private volatile IArgumentGrouper argumentGrouper;
 
     public KeywordInvoker(Object obj, Method method) {
         this.obj = obj;
         this.method = method;
+        this.argumentConverters = ArgumentConverters.getConverters(method.getParameterTypes());
+        makeAccessible(method);
     }
 
     public String[] getParameterNames() {
@@ -45,8 +49,8 @@ public class KeywordInvoker implements IKeywordInvoker {
 
     public Object invoke(Object[] args) {
         try {
-            Object[] groupedArguments = createArgumentGrouper().groupArguments(args);
-            return method.invoke(obj, groupedArguments);
+            Object[] groupedArguments = getArgumentGrouper().groupArguments(args);
+            return method.invoke(obj, convertArguments(groupedArguments));
         } catch (Exception e) {
             throw new RuntimeException(e);
         }
@@ -56,10 +60,48 @@ public class KeywordInvoker implements IKeywordInvoker {
         return method.getAnnotation(RobotKeyword.class).value();
     }
 
+    // The grouper depends only on the method, so it is created once and reused
+    private IArgumentGrouper getArgumentGrouper() {
+        if (argumentGrouper == null)
+            argumentGrouper = createArgumentGrouper();
+        return argumentGrouper;
+    }
+
     IArgumentGrouper createArgumentGrouper() {
         return new ArgumentGrouper(method.getParameterTypes());
     }
 
+    // Converts a copy so that the caller's arguments are not modified
+    private Object[] convertArguments(Object[] arguments) {
+        if (argumentConverters == null || arguments == null)
+            return arguments;
+        Object[] converted = arguments;
+        int count = Math.min(arguments.length, argumentConverters.length);
+        for (int i = 0; i < count; i++) {
+            if (argumentConverters[i] == null)
+                continue;
+            Object argument = argumentConverters[i].convert(arguments[i]);
+            if (argument != arguments[i]) {
+                if (converted == arguments) {
+                    converted = new Object[arguments.length];
+                    System.arraycopy(arguments, 0, converted, 0, arguments.length);
+                }
+                converted[i] = argument;
+            }
+        }
+        return converted;
+    }
+
+    // Skips the access checks on each call, and allows calling public methods
+    // of non-public classes
+    private void makeAccessible(Method method) {
+        try {
+            method.setAccessible(true);
+        } catch (SecurityException e) {
+            // Invoking works without it when the method is accessible
+        }
+    }
+
     private String[] getParameterNamesFromParanamer() {
         try {
             return parameterNames.lookupParameterNames(method);
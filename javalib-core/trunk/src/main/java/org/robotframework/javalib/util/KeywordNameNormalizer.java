@@ -16,7 +16,14 @@
 
 package org.robotframework.javalib.util;
 
+import java.util.Locale;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.ConcurrentMap;
+
 public class KeywordNameNormalizer implements IKeywordNameNormalizer {
+    private static final int MAX_CACHED_NAMES = 10000;
+    private static final ConcurrentMap<String, String> cache = new ConcurrentHashMap<String, String>();
+
     /**
      * Normalizes a keyword name. Removes spaces and special characters.
      * Converts all letters to lower case.
@@ -25,12 +32,61 @@ public class KeywordNameNormalizer implements IKeywordNameNormalizer {
      * @return normalized keyword name
      */
     public String normalize(String keywordName) {
-        keywordName = keywordName.toLowerCase().trim();
-        keywordName = keywordName.replaceAll(" ", "");
-        keywordName = keywordName.replaceAll("_", "");
-        keywordName = keywordName.replaceAll("\t", "");
-        keywordName = keywordName.replaceAll("\r", "");
-        keywordName = keywordName.replaceAll("\n", "");
-        return keywordName;
+        return normalizeName(keywordName);
+    }
+
+    /**
+     * Same as {@link #normalize(String)}. Normalized names are cached, up to
+     * a fixed number of names, because the same names are normalized on
+     * every keyword call.
+     */
+    public static String normalizeName(String keywordName) {
+        String normalized = cache.get(keywordName);
+        if (normalized == null) {
+            normalized = normalizeUncached(keywordName);
+            if (cache.size() < MAX_CACHED_NAMES)
+                cache.putIfAbsent(keywordName, normalized);
+        }
+        return normalized;
+    }
+
+    private static String normalizeUncached(String keywordName) {
+        int start = 0;
+        int end = keywordName.length();
+        while (start < end && keywordName.charAt(start) <= ' ')
+            start++;
+        while (end > start && keywordName.charAt(end - 1) <= ' ')
+            end--;
+        boolean changed = start > 0 || end < keywordName.length();
+        StringBuilder normalized = new StringBuilder(end - start);
+        for (int i = start; i < end; i++) {
+            char c = keywordName.charAt(i);
+            if (c > 127)
+                return normalizeNonAscii(keywordName);
+            if (c >= 'A' && c <= 'Z') {
+                normalized.append((char) (c + ('a' - 'A')));
+                changed = true;
+            } else if (isRemoved(c)) {
+                changed = true;
+            } else {
+                normalized.append(c);
+            }
+        }
+        return changed ? normalized.toString() : keywordName;
+    }
+
+    private static boolean isRemoved(char c) {
+        return c == ' ' || c == '_' || c == '\t' || c == '\r' || c == '\n';
+    }
+
+    private static String normalizeNonAscii(String keywordName) {
+        String lowerCase = keywordName.toLowerCase(Locale.ENGLISH).trim();
+        StringBuilder normalized = new StringBuilder(lowerCase.length());
+        for (int i = 0; i < lowerCase.length(); i++) {
+            char c = lowerCase.charAt(i);
+            if (!isRemoved(c))
+                normalized.append(c);
+        }
+        return normalized.toString();
     }
 }
@@ -0,0 +1,42 @@
+package org.robotframework.javalib.reflection;
+
+import java.util.Arrays;
+import java.util.List;
+
+import junit.framework.TestCase;
+
+public class ArgumentConvertersTest extends TestCase {
+    public void testConvertsStringsToPrimitivesAndWrappers() throws Exception {
+        assertEquals(42, ArgumentConverters.getConverter(int.class).convert("42"));
+        assertEquals(42L, ArgumentConverters.getConverter(Long.class).convert("42"));
+        assertEquals(1.5, ArgumentConverters.getConverter(double.class).convert("1.5"));
+        assertEquals(Boolean.FALSE, ArgumentConverters.getConverter(boolean.class).convert("False"));
+        assertEquals('x', ArgumentConverters.getConverter(char.class).convert("x"));
+    }
+
+    public void testReturnsOtherThanStringArgumentsAsTheyAre() throws Exception {
+        Integer value = new Integer(7);
+        assertSame(value, ArgumentConverters.getConverter(int.class).convert(value));
+    }
+
+    public void testConvertsArraysToLists() throws Exception {
+        Object converted = ArgumentConverters.getConverter(List.class).convert(new Object[] { "a", "b" });
+        assertEquals(Arrays.asList("a", "b"), converted);
+    }
+
+    public void testInvalidBooleanIsNotConverted() throws Exception {
+        try {
+            ArgumentConverters.getConverter(boolean.class).convert("yes");
+            fail();
+        } catch (IllegalArgumentException e) {
+            assertEquals("Argument 'yes' cannot be converted to boolean", e.getMessage());
+        }
+    }
+
+    public void testResolvesNoConvertersForStringParameters() throws Exception {
+        assertNull(ArgumentConverters.getConverters(new Class[] { String.class, String[].class }));
+        IArgumentConverter[] converters = ArgumentConverters.getConverters(new Class[] { String.class, int.class });
+        assertNull(converters[0]);
+        assertSame(ArgumentConverters.getConverter(int.class), converters[1]);
+    }
+}
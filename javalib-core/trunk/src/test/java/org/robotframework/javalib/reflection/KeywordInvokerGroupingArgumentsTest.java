@@ -56,6 +56,23 @@ public class KeywordInvokerGroupingArgumentsTest extends KeywordInvokerTestCase
         invoker.invoke(providedArguments);
     }
 
+    public void testCreatesArgumentGrouperOnlyOnce() throws Exception {
+        Object[] providedArguments = new Object[] { "arg1", "arg2" };
+        argumentGrouper.expects(exactly(2)).method("groupArguments")
+            .will(returnValue(new Object[] { "arg1", new String[] { "arg2" }}));
+        final int[] createdGroupers = new int[1];
+        IKeywordInvoker invoker = new KeywordInvoker(this, getMethod("someMethod")) {
+            IArgumentGrouper createArgumentGrouper() {
+                createdGroupers[0]++;
+                return (IArgumentGrouper) argumentGrouper.proxy();
+            }
+        };
+
+        invoker.invoke(providedArguments);
+        invoker.invoke(providedArguments);
+        assertEquals(1, createdGroupers[0]);
+    }
+
     private IKeywordInvoker createKeywordInvokerWithMockArgumentGrouper(String methodName) {
         Method method = getMethod(methodName);
         return new KeywordInvoker(this, method) {
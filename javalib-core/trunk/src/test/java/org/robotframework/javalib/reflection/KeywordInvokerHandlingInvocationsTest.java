@@ -21,6 +21,27 @@ public class KeywordInvokerHandlingInvocationsTest extends KeywordInvokerTestCas
         }
     }
 
+    public void testConvertsArgumentsToParameterTypes() throws Exception {
+        KeywordInvoker invoker = new KeywordInvoker(this, getMethod("keywordWithTypedArguments"));
+        Object[] args = new String[] { "2", " 3", "TRUE" };
+        assertEquals(5L, invoker.invoke(args));
+        assertEquals(" 3", args[1]);
+    }
+
+    public void testFailsWhenArgumentCannotBeConverted() throws Exception {
+        KeywordInvoker invoker = new KeywordInvoker(this, getMethod("keywordWithTypedArguments"));
+        try {
+            invoker.invoke(new String[] { "two", "3", "true" });
+            fail();
+        } catch (RuntimeException e) {
+            assertEquals("Argument 'two' cannot be converted to int", e.getCause().getMessage());
+        }
+    }
+
+    public long keywordWithTypedArguments(int first, Long second, boolean add) {
+        return add ? first + second : first - second;
+    }
+
     public void testGetsAnnotationValue() throws Exception {
         assertEquals("documentation", keywordInvoker.getDocumentation());
     }
@@ -1,5 +1,7 @@
 package org.robotframework.javalib.util;
 
+import java.util.Locale;
+
 import org.robotframework.javalib.util.IKeywordNameNormalizer;
 import org.robotframework.javalib.util.KeywordNameNormalizer;
 
@@ -11,4 +13,28 @@ public class KeywordNameNormalizerTest extends TestCase {
         String normalized = normalizer.normalize("sOmE string\tWI TH\rwHitespa ce\nandnewlinesandUnder_Scores");
         assertEquals("somestringwithwhitespaceandnewlinesandunderscores", normalized);
     }
+
+    public void testNormalizesNonAsciiCharacters() throws Exception {
+        IKeywordNameNormalizer normalizer = new KeywordNameNormalizer();
+        assertEquals("\u00e4\u00e4nest\u00e4keyword", normalizer.normalize(" \u00c4\u00e4nest\u00e4_Keyword\n"));
+    }
+
+    public void testReturnsSameInstanceForNormalizedName() throws Exception {
+        String name = "alreadynormalized";
+        assertSame(name, KeywordNameNormalizer.normalizeName(name));
+    }
+
+    public void testTrimsOtherControlCharactersOnlyFromEnds() throws Exception {
+        assertEquals("a\fb", KeywordNameNormalizer.normalizeName("\fA\fB\f"));
+    }
+
+    public void testNormalizesNonAsciiNamesIndependentlyOfLocale() throws Exception {
+        Locale defaultLocale = Locale.getDefault();
+        Locale.setDefault(new Locale("tr"));
+        try {
+            assertEquals("inf\u00f6keyword", KeywordNameNormalizer.normalizeName("INF\u00d6 Keyword"));
+        } finally {
+            Locale.setDefault(defaultLocale);
+        }
+    }
 }
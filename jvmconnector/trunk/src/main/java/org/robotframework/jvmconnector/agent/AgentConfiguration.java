@@ -18,16 +18,30 @@
 package org.robotframework.jvmconnector.agent;
 
 import java.util.ArrayList;
+import java.util.LinkedHashMap;
 import java.util.List;
+import java.util.Map;
+
+import org.robotframework.jvmconnector.server.ExecutionPolicies;
 
 public class AgentConfiguration {
 
     private Integer port;
+    private Integer notifyPort;
+    private String token;
+    private String transport;
+    private String handles;
+    private Map<String, String> policies = new LinkedHashMap<String, String>();
     private List<String> jars = new ArrayList<String>();
 
     public AgentConfiguration(String arguments) {
         List<String> splittedArguments = split(arguments);
-        parsePort(splittedArguments);
+        port = parseIntegerOption(splittedArguments, "port");
+        notifyPort = parseIntegerOption(splittedArguments, "notify");
+        token = parseOption(splittedArguments, "token");
+        transport = parseOption(splittedArguments, "transport");
+        handles = parseOption(splittedArguments, "handles");
+        parsePolicies(splittedArguments);
         parseJars(splittedArguments);
     }
 
@@ -63,22 +77,42 @@ public class AgentConfiguration {
         return items.remove(items.size()-1);
     }
 
-    private void parsePort(List<String> arguments) {
+    private Integer parseIntegerOption(List<String> arguments, String name) {
+        String value = parseOption(arguments, name);
+        return value == null ? null : Integer.valueOf(value);
+    }
+
+    private String parseOption(List<String> arguments, String name) {
         for (String item : arguments) {
-            if (isPort(item)) {
-                port = Integer.valueOf(item.substring(5));
-                return;
-            }
+            if (isOption(item, name))
+                return item.substring(name.length() + 1);
         }
+        return null;
     }
 
-    private boolean isPort(String item) {
-        return item.toLowerCase().contains("port");
+    private boolean isOption(String item, String name) {
+        return item.toLowerCase().startsWith(name + "=");
+    }
+
+    private void parsePolicies(List<String> arguments) {
+        for (String item : arguments) {
+            if (isOption(item, "policy"))
+                parsePolicy(item.substring("policy".length() + 1));
+        }
+    }
+
+    private void parsePolicy(String value) {
+        int separator = value.lastIndexOf('=');
+        if (separator == -1)
+            policies.put(ExecutionPolicies.DEFAULT, value);
+        else
+            policies.put(value.substring(0, separator), value.substring(separator + 1));
     }
 
     private void parseJars(List<String> arguments) {
         for (String item : arguments)
-            if (!isPort(item))
+            if (!isOption(item, "port") && !isOption(item, "notify") && !isOption(item, "token")
+                && !isOption(item, "transport") && !isOption(item, "policy") && !isOption(item, "handles"))
                 jars.add(item);
     }
 
@@ -86,13 +120,38 @@ public class AgentConfiguration {
         return port;
     }
 
+    public Integer getNotifyPort() {
+        return notifyPort;
+    }
+
+    public String getToken() {
+        return token;
+    }
+
+    public String getTransport() {
+        return transport;
+    }
+
+    public String getHandles() {
+        return handles;
+    }
+
+    /**
+     * Returns the execution policies given with <code>POLICY=library=policy</code>
+     * options. A policy given without a library name is the default policy.
+     */
+    public Map<String, String> getPolicies() {
+        return policies;
+    }
+
     public List<String> getJars() {
         return jars;
     }
 
     @Override
     public String toString() {
-        return this.getClass().getName() + "[port=" + port + ", jars=" + jars.toString() + "]";
+        return this.getClass().getName() + "[port=" + port + ", notifyPort=" + notifyPort + ", token=" + token
+            + ", transport=" + transport + ", handles=" + handles + ", policies=" + policies + ", jars=" + jars.toString() + "]";
     }
 
     @Override
@@ -101,6 +160,11 @@ public class AgentConfiguration {
         int result = 1;
         result = prime * result + ((jars == null) ? 0 : jars.hashCode());
         result = prime * result + ((port == null) ? 0 : port.hashCode());
+        result = prime * result + ((notifyPort == null) ? 0 : notifyPort.hashCode());
+        result = prime * result + ((token == null) ? 0 : token.hashCode());
+        result = prime * result + ((transport == null) ? 0 : transport.hashCode());
+        result = prime * result + ((handles == null) ? 0 : handles.hashCode());
+        result = prime * result + ((policies == null) ? 0 : policies.hashCode());
         return result;
     }
 
@@ -123,6 +187,31 @@ public class AgentConfiguration {
                 return false;
         } else if (!port.equals(other.port))
             return false;
+        if (notifyPort == null) {
+            if (other.notifyPort != null)
+                return false;
+        } else if (!notifyPort.equals(other.notifyPort))
+            return false;
+        if (token == null) {
+            if (other.token != null)
+                return false;
+        } else if (!token.equals(other.token))
+            return false;
+        if (transport == null) {
+            if (other.transport != null)
+                return false;
+        } else if (!transport.equals(other.transport))
+            return false;
+        if (handles == null) {
+            if (other.handles != null)
+                return false;
+        } else if (!handles.equals(other.handles))
+            return false;
+        if (policies == null) {
+            if (other.policies != null)
+                return false;
+        } else if (!policies.equals(other.policies))
+            return false;
         return true;
     }
 }
@@ -21,6 +21,9 @@ import java.util.List;
 import java.util.jar.JarFile;
 
 import org.robotframework.jvmconnector.common.DataBasePaths;
+import org.robotframework.jvmconnector.server.ExecutionPolicies;
+import org.robotframework.jvmconnector.server.ObjectHandleTable;
+import org.robotframework.jvmconnector.server.RmiInfoAnnouncer;
 import org.robotframework.jvmconnector.server.RmiService;
 
 public class RmiServiceAgent {
@@ -30,7 +33,10 @@ public class RmiServiceAgent {
     public static void premain(String agentArguments, Instrumentation inst) {
         AgentConfiguration conf = new AgentConfiguration(agentArguments);
         setClasspath(conf.getJars(), inst);
-        startRmiService(conf.getPort());
+        RmiService rmiService = new RmiService(new ExecutionPolicies(conf.getPolicies()),
+            new ObjectHandleTable(conf.getHandles()));
+        String rmiInfo = startRmiService(rmiService, conf.getPort(), conf.getToken(), conf.getTransport());
+        announce(rmiInfo, conf.getNotifyPort());
     }
 
     static void setClasspath(List<String> jars, final Instrumentation inst) {
@@ -55,10 +61,16 @@ public class RmiServiceAgent {
         return appenderFactory.create(inst);
     }
 
-    private static void startRmiService(Integer port) {
+    private static String startRmiService(RmiService rmiService, Integer port, String token, String transport) {
         if (port != null)
-            new RmiService().start(port);
-        else
-            new RmiService().start(launched);
+            return rmiService.start(port, transport);
+        if (token != null)
+            return rmiService.start(new DataBasePaths(true).getLaunchedFile(token), transport);
+        return rmiService.start(launched, transport);
+    }
+
+    private static void announce(String rmiInfo, Integer notifyPort) {
+        if (notifyPort != null)
+            new RmiInfoAnnouncer(notifyPort).announce(rmiInfo);
     }
 }
@@ -0,0 +1,152 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+package org.robotframework.jvmconnector.client;
+
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.IOException;
+import java.lang.reflect.InvocationHandler;
+import java.lang.reflect.Method;
+import java.lang.reflect.Proxy;
+import java.net.Socket;
+import java.util.LinkedList;
+import java.util.regex.Matcher;
+import java.util.regex.Pattern;
+
+import org.robotframework.jvmconnector.server.BinaryCodec;
+import org.robotframework.jvmconnector.server.BinaryTransportServer;
+import org.robotframework.jvmconnector.server.LibraryImporter;
+import org.springframework.remoting.RemoteAccessException;
+import org.springframework.remoting.RemoteConnectFailureException;
+
+/**
+ * Client side of the binary transport. Calls to the returned
+ * {@link LibraryImporter} are sent over a persistent socket. Concurrent calls
+ * open additional sockets, which are kept for later calls. If a call fails,
+ * the kept sockets are closed and new ones are opened for the next calls.
+ * Failures are reported with {@link RemoteAccessException} like with RMI,
+ * and failing to open a socket with {@link RemoteConnectFailureException}.
+ *
+ * @see BinaryTransportServer
+ */
+public class BinaryTransportClient implements InvocationHandler {
+    private static final Pattern URL = Pattern.compile(BinaryTransportServer.SCHEME + "://([^:/]+):(\\d{1,5})/?");
+
+    private final String host;
+    private final int port;
+    private final BinaryCodec codec = new BinaryCodec();
+    private final LinkedList<Connection> idleConnections = new LinkedList<Connection>();
+
+    public static LibraryImporter connect(String url) {
+        Matcher matcher = URL.matcher(url);
+        if (!matcher.matches())
+            throw new IllegalArgumentException("Invalid binary transport url '" + url + "'");
+        BinaryTransportClient client = new BinaryTransportClient(matcher.group(1), Integer.parseInt(matcher.group(2)));
+        return (LibraryImporter) Proxy.newProxyInstance(LibraryImporter.class.getClassLoader(),
+            new Class[] { LibraryImporter.class }, client);
+    }
+
+    BinaryTransportClient(String host, int port) {
+        this.host = host;
+        this.port = port;
+    }
+
+    public Object invoke(Object proxy, Method method, Object[] args) throws Throwable {
+        if (method.getDeclaringClass() == Object.class)
+            return invokeObjectMethod(proxy, method, args);
+        Object[] response = send(method, args == null ? new Object[0] : args);
+        if (!Boolean.TRUE.equals(response[0]))
+            throw (Throwable) response[1];
+        return response[1];
+    }
+
+    private Object[] send(Method method, Object[] args) {
+        Connection connection = null;
+        try {
+            connection = takeConnection();
+            Object[] response = connection.call(method, args);
+            releaseConnection(connection);
+            return response;
+        } catch (IOException e) {
+            if (connection != null)
+                connection.close();
+            closeIdleConnections();
+            throw new RemoteAccessException("Calling '" + method.getName() + "' on " + host + ":" + port + " failed", e);
+        }
+    }
+
+    private Connection takeConnection() {
+        synchronized (idleConnections) {
+            if (!idleConnections.isEmpty())
+                return idleConnections.removeFirst();
+        }
+        try {
+            return new Connection();
+        } catch (IOException e) {
+            closeIdleConnections();
+            throw new RemoteConnectFailureException("Could not connect to " + host + ":" + port, e);
+        }
+    }
+
+    private void releaseConnection(Connection connection) {
+        synchronized (idleConnections) {
+            idleConnections.addFirst(connection);
+        }
+    }
+
+    private void closeIdleConnections() {
+        synchronized (idleConnections) {
+            while (!idleConnections.isEmpty())
+                idleConnections.removeFirst().close();
+        }
+    }
+
+    private Object invokeObjectMethod(Object proxy, Method method, Object[] args) {
+        if (method.getName().equals("equals"))
+            return Boolean.valueOf(proxy == args[0]);
+        if (method.getName().equals("hashCode"))
+            return new Integer(System.identityHashCode(proxy));
+        return "BinaryTransportClient[" + host + ":" + port + "]";
+    }
+
+    private class Connection {
+        private final Socket socket;
+        private final DataInputStream in;
+        private final DataOutputStream out;
+
+        Connection() throws IOException {
+            socket = new Socket(host, port);
+            socket.setTcpNoDelay(true);
+            in = new DataInputStream(new BufferedInputStream(socket.getInputStream()));
+            out = new DataOutputStream(new BufferedOutputStream(socket.getOutputStream()));
+        }
+
+        Object[] call(Method method, Object[] args) throws IOException {
+            codec.writeFrame(out, new Object[] { method.getName(), BinaryTransportServer.getParameterTypeNames(method), args });
+            return (Object[]) codec.readFrame(in);
+        }
+
+        void close() {
+            try {
+                socket.close();
+            } catch (IOException e) {
+                // Connection is discarded anyway.
+            }
+        }
+    }
+}
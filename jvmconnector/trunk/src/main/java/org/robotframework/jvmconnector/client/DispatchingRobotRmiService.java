@@ -0,0 +1,84 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+package org.robotframework.jvmconnector.client;
+
+import org.robotframework.javalib.library.RobotJavaLibrary;
+import org.robotframework.jvmconnector.common.KeywordCall;
+import org.robotframework.jvmconnector.common.KeywordExecutionResult;
+import org.robotframework.jvmconnector.server.LibraryDispatcher;
+import org.robotframework.jvmconnector.server.LibraryImporter;
+import org.robotframework.jvmconnector.server.RobotRmiService;
+
+/**
+ * Presents one library registered to a {@link LibraryDispatcher} as a
+ * {@link RobotRmiService}, so that the libraries of an application share the
+ * connection of the dispatcher.
+ */
+public class DispatchingRobotRmiService implements RobotRmiService {
+    private final LibraryImporter dispatcher;
+    private final String libraryName;
+
+    public DispatchingRobotRmiService(LibraryImporter dispatcher, String libraryName) {
+        this.dispatcher = dispatcher;
+        this.libraryName = libraryName;
+    }
+
+    public void setLibrary(RobotJavaLibrary library) {
+        throw new UnsupportedOperationException("Library is registered on the remote side");
+    }
+
+    public String[] getKeywordNames() {
+        return dispatcher.getKeywordNames(libraryName);
+    }
+
+    public KeywordExecutionResult runKeyword(String keywordName, Object[] keywordArguments) {
+        return dispatcher.runKeyword(libraryName, keywordName, keywordArguments);
+    }
+
+    public KeywordExecutionResult[] runKeywords(KeywordCall[] keywordCalls, boolean stopOnFailure) {
+        return dispatcher.runKeywords(libraryName, keywordCalls, stopOnFailure);
+    }
+
+    public KeywordExecutionResult runKeywordWithTimeout(String keywordName, Object[] keywordArguments, long timeoutMillis) {
+        return dispatcher.runKeywordWithTimeout(libraryName, keywordName, keywordArguments, timeoutMillis);
+    }
+
+    public KeywordExecutionResult runKeywordUntilSucceeds(String keywordName, Object[] keywordArguments, long timeoutMillis,
+        long retryIntervalMillis) {
+        return dispatcher.runKeywordUntilSucceeds(libraryName, keywordName, keywordArguments, timeoutMillis,
+            retryIntervalMillis);
+    }
+
+    public String startKeyword(String keywordName, Object[] keywordArguments) {
+        return dispatcher.startKeyword(libraryName, keywordName, keywordArguments);
+    }
+
+    public KeywordExecutionResult waitForKeyword(String handle, long timeoutMillis) {
+        return dispatcher.waitForKeyword(libraryName, handle, timeoutMillis);
+    }
+
+    public String[] readKeywordOutput(String handle) {
+        return dispatcher.readKeywordOutput(libraryName, handle);
+    }
+
+    public void releaseKeyword(String handle) {
+        dispatcher.releaseKeyword(libraryName, handle);
+    }
+
+    public boolean ping() {
+        return dispatcher.ping();
+    }
+}
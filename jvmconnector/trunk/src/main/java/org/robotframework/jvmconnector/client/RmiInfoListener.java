@@ -0,0 +1,77 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.robotframework.jvmconnector.client;
+
+import java.io.BufferedReader;
+import java.io.IOException;
+import java.io.InputStreamReader;
+import java.net.InetAddress;
+import java.net.ServerSocket;
+import java.net.Socket;
+import java.net.SocketTimeoutException;
+
+/**
+ * Loopback listener that receives the rmi info announced by
+ * {@link org.robotframework.jvmconnector.server.RmiInfoAnnouncer} once the
+ * launched application has exported its service.
+ */
+public class RmiInfoListener {
+    private final ServerSocket serverSocket;
+
+    public RmiInfoListener() {
+        try {
+            serverSocket = new ServerSocket(0, 1, InetAddress.getByName("127.0.0.1"));
+        } catch (IOException e) {
+            throw new RuntimeException(e);
+        }
+    }
+
+    public int getPort() {
+        return serverSocket.getLocalPort();
+    }
+
+    /**
+     * Returns the announced rmi info or <code>null</code> if nothing was
+     * announced within the timeout. The listener is closed afterwards.
+     */
+    public String waitForRmiInfo(long timeoutMillis) {
+        try {
+            serverSocket.setSoTimeout((int) Math.max(timeoutMillis, 1));
+            Socket socket = serverSocket.accept();
+            try {
+                socket.setSoTimeout((int) Math.max(timeoutMillis, 1));
+                return new BufferedReader(new InputStreamReader(socket.getInputStream(), "UTF-8")).readLine();
+            } finally {
+                socket.close();
+            }
+        } catch (SocketTimeoutException e) {
+            return null;
+        } catch (IOException e) {
+            throw new RuntimeException(e);
+        } finally {
+            close();
+        }
+    }
+
+    public void close() {
+        try {
+            serverSocket.close();
+        } catch (IOException e) {
+            throw new RuntimeException(e);
+        }
+    }
+}
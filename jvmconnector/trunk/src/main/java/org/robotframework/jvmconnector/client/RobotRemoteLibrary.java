@@ -17,7 +17,10 @@
 package org.robotframework.jvmconnector.client;
 
 import org.robotframework.javalib.library.RobotJavaLibrary;
+import org.robotframework.jvmconnector.common.KeywordCall;
+import org.robotframework.jvmconnector.common.KeywordExecutionResult;
 import org.robotframework.jvmconnector.common.PropertyOverrider;
+import org.robotframework.jvmconnector.server.LibraryImporter;
 import org.springframework.beans.factory.config.ConfigurableListableBeanFactory;
 import org.springframework.beans.factory.xml.XmlBeanFactory;
 import org.springframework.core.io.ClassPathResource;
@@ -43,6 +46,15 @@ public class RobotRemoteLibrary implements RobotJavaLibrary {
     public RobotRemoteLibrary(String uri) {
         robotLibraryClient = createRobotLibraryClient(uri);
     }
+
+    /**
+     * Uses a library registered to the given dispatcher instead of a library
+     * exported as its own RMI service.
+     */
+    public RobotRemoteLibrary(LibraryImporter dispatcher, String libraryName) {
+        rmiClient = new RobotRmiClient(new DispatchingRobotRmiService(dispatcher, libraryName));
+        robotLibraryClient = rmiClient;
+    }
     
     public String[] getKeywordNames() {
         return robotLibraryClient.getKeywordNames();
@@ -52,6 +64,35 @@ public class RobotRemoteLibrary implements RobotJavaLibrary {
         return robotLibraryClient.runKeyword(keywordName, args);
     }
 
+    public KeywordExecutionResult[] runKeywords(KeywordCall[] keywordCalls, boolean stopOnFailure) {
+        return rmiClient.runKeywords(keywordCalls, stopOnFailure);
+    }
+
+    public Object runKeywordWithTimeout(String keywordName, Object[] args, long timeoutMillis) {
+        return rmiClient.runKeywordWithTimeout(keywordName, args, timeoutMillis);
+    }
+
+    public KeywordExecutionResult runKeywordUntilSucceeds(String keywordName, Object[] args, long timeoutMillis,
+        long retryIntervalMillis) {
+        return rmiClient.runKeywordUntilSucceeds(keywordName, args, timeoutMillis, retryIntervalMillis);
+    }
+
+    public String startKeyword(String keywordName, Object[] args) {
+        return rmiClient.startKeyword(keywordName, args);
+    }
+
+    public KeywordExecutionResult waitForKeyword(String handle, long timeoutMillis) {
+        return rmiClient.waitForKeyword(handle, timeoutMillis);
+    }
+
+    public String[] readKeywordOutput(String handle) {
+        return rmiClient.readKeywordOutput(handle);
+    }
+
+    public void releaseKeyword(String handle) {
+        rmiClient.releaseKeyword(handle);
+    }
+
     public boolean ping(){
         return rmiClient.ping();
     }
@@ -17,6 +17,7 @@
 package org.robotframework.jvmconnector.client;
 
 import org.robotframework.javalib.library.RobotJavaLibrary;
+import org.robotframework.jvmconnector.common.KeywordCall;
 import org.robotframework.jvmconnector.common.KeywordExecutionResult;
 import org.robotframework.jvmconnector.server.RobotRmiService;
 import org.springframework.beans.factory.BeanFactory;
@@ -39,12 +40,28 @@ public class RobotRmiClient implements RobotJavaLibrary {
         setService(beanFactory);
     }
 
+    public RobotRmiClient(RobotRmiService service) {
+        this.service = service;
+    }
+
     public String[] getKeywordNames() {
         return service.getKeywordNames();
     }
 
     public Object runKeyword(String keywordName, Object[] args) {
-        KeywordExecutionResult keywordExecutionResults = service.runKeyword(keywordName, args);
+        return handleResult(service.runKeyword(keywordName, args));
+    }
+
+    /**
+     * Runs the keyword like {@link #runKeyword(String, Object[])}, but the
+     * remote side interrupts the keyword if it does not finish within the
+     * timeout.
+     */
+    public Object runKeywordWithTimeout(String keywordName, Object[] args, long timeoutMillis) {
+        return handleResult(service.runKeywordWithTimeout(keywordName, args, timeoutMillis));
+    }
+
+    private Object handleResult(KeywordExecutionResult keywordExecutionResults) {
         printStdOut(keywordExecutionResults.getStdOutAsString());
         printStdErr(keywordExecutionResults.getStdErrAsString());
 
@@ -54,6 +71,78 @@ public class RobotRmiClient implements RobotJavaLibrary {
         return keywordExecutionResults.getResult();
     }
 
+    /**
+     * Runs the given keywords in a single remote call. Output of each keyword
+     * is printed, but failures are not thrown; they have to be checked from
+     * the returned results.
+     */
+    public KeywordExecutionResult[] runKeywords(KeywordCall[] keywordCalls, boolean stopOnFailure) {
+        KeywordExecutionResult[] results = service.runKeywords(keywordCalls, stopOnFailure);
+        for (KeywordExecutionResult result : results) {
+            printStdOut(result.getStdOutAsString());
+            printStdErr(result.getStdErrAsString());
+        }
+        return results;
+    }
+
+    /**
+     * Runs the keyword repeatedly on the remote side until it passes or the
+     * timeout is exceeded. Output of the last attempt is printed, but failure
+     * is not thrown; it has to be checked from the returned result.
+     */
+    public KeywordExecutionResult runKeywordUntilSucceeds(String keywordName, Object[] args, long timeoutMillis,
+        long retryIntervalMillis) {
+        KeywordExecutionResult result = service.runKeywordUntilSucceeds(keywordName, args, timeoutMillis,
+            retryIntervalMillis);
+        printStdOut(result.getStdOutAsString());
+        printStdErr(result.getStdErrAsString());
+        return result;
+    }
+
+    /**
+     * Starts running the keyword in the background.
+     * 
+     * @return handle for {@link #waitForKeyword(String, long)}
+     */
+    public String startKeyword(String keywordName, Object[] args) {
+        return service.startKeyword(keywordName, args);
+    }
+
+    /**
+     * Waits for a started keyword to finish. Output of the keyword is printed,
+     * but failure is not thrown; it has to be checked from the returned
+     * result.
+     * 
+     * @return result of the keyword, or <code>null</code> if it did not finish
+     *         within the timeout
+     */
+    public KeywordExecutionResult waitForKeyword(String handle, long timeoutMillis) {
+        KeywordExecutionResult result = service.waitForKeyword(handle, timeoutMillis);
+        if (result != null) {
+            printStdOut(result.getStdOutAsString());
+            printStdErr(result.getStdErrAsString());
+        }
+        return result;
+    }
+
+    /**
+     * Returns output a started keyword has written after the previous read
+     * without printing it.
+     * 
+     * @return STDOUT and STDERR of the keyword
+     */
+    public String[] readKeywordOutput(String handle) {
+        return service.readKeywordOutput(handle);
+    }
+
+    /**
+     * Forgets a started keyword that is not going to be waited for,
+     * interrupting it if it is still running.
+     */
+    public void releaseKeyword(String handle) {
+        service.releaseKeyword(handle);
+    }
+
     protected void printStdOut(String stdOutAsString) {
         System.out.print(stdOutAsString);
     }
@@ -17,6 +17,16 @@ public class DataBasePaths {
         return getPathToFile("launched.txt");
     }
 
+    public String getLaunchedFile(String token) {
+        return join(getLaunchedDirectory(), token + ".txt");
+    }
+
+    public String getLaunchedDirectory() {
+        String launched = getPathToFile("launched");
+        createDir(launched);
+        return launched;
+    }
+
     public String getConnectedFile() {
         return getPathToFile("connected.txt");
     }
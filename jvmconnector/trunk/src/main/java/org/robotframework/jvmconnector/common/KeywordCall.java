@@ -0,0 +1,43 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.robotframework.jvmconnector.common;
+
+import java.io.Serializable;
+
+/**
+ * A keyword name and its arguments, used for sending several keywords to the
+ * remote side in one call.
+ */
+public class KeywordCall implements Serializable {
+    private static final long serialVersionUID = -3146298165431472398L;
+
+    private final String keywordName;
+    private final Object[] keywordArguments;
+
+    public KeywordCall(String keywordName, Object[] keywordArguments) {
+        this.keywordName = keywordName;
+        this.keywordArguments = keywordArguments;
+    }
+
+    public String getKeywordName() {
+        return keywordName;
+    }
+
+    public Object[] getKeywordArguments() {
+        return keywordArguments;
+    }
+}
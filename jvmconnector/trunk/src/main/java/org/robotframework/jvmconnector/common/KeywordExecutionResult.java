@@ -26,5 +26,16 @@ public interface KeywordExecutionResult extends Serializable {
     String getStdOutAsString();
     String getStdErrAsString();
     boolean keywordPassed();
+
+    /**
+     * @return true if the keyword was interrupted because it did not finish
+     *         within its timeout
+     */
+    boolean keywordTimedOut();
     TestFailedException getTestFailedException();
+
+    /**
+     * @return how many times the keyword was run to get this result
+     */
+    int getAttempts();
 }
@@ -0,0 +1,59 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.robotframework.jvmconnector.common;
+
+import java.io.Serializable;
+
+/**
+ * Reference to a keyword return value that is kept on the remote side instead
+ * of being sent over the network. Handles can be given back to keywords as
+ * arguments, in which case the referenced object is used instead.
+ */
+public class ObjectHandle implements Serializable {
+    private static final long serialVersionUID = 5324178902165374127L;
+
+    private final String id;
+    private final String className;
+
+    public ObjectHandle(String id, String className) {
+        this.id = id;
+        this.className = className;
+    }
+
+    public String getId() {
+        return id;
+    }
+
+    /**
+     * @return class name of the referenced object
+     */
+    public String getClassName() {
+        return className;
+    }
+
+    public String toString() {
+        return id;
+    }
+
+    public boolean equals(Object obj) {
+        return obj instanceof ObjectHandle && id.equals(((ObjectHandle) obj).id);
+    }
+
+    public int hashCode() {
+        return id.hashCode();
+    }
+}
@@ -36,6 +36,17 @@ public class TestFailedException extends RuntimeException {
 		initStackTraceString(cause);
 	}
 
+	/**
+	 * Recreates an exception from the details of the source exception, for
+	 * example after receiving them over the network.
+	 */
+	public TestFailedException(String sourceExceptionClassName, String sourceMessage, String stackTraceAsString) {
+		super(sourceMessage);
+		emptyStackTrace();
+		this.sourceExceptionClassName = sourceExceptionClassName;
+		this.stackTraceAsString = stackTraceAsString;
+	}
+
 	/**
 	 * @return message string containing the original detail message and the
 	 *         class name of the source exception.
@@ -51,6 +62,17 @@ public class TestFailedException extends RuntimeException {
 		return sourceExceptionClassName;
 	}
 
+	/**
+	 * @return the original detail message of the source exception.
+	 */
+	public String getSourceMessage() {
+		return super.getMessage();
+	}
+
+	public String getStackTraceAsString() {
+		return stackTraceAsString;
+	}
+
 	public void printStackTrace(PrintStream stream) {
 		stream.print(stackTraceAsString);
 	}
@@ -0,0 +1,304 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+package org.robotframework.jvmconnector.server;
+
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.IOException;
+import java.io.ObjectInputStream;
+import java.io.ObjectOutputStream;
+import java.io.Serializable;
+import java.lang.reflect.Array;
+import java.util.HashMap;
+import java.util.Map;
+
+import org.robotframework.jvmconnector.common.KeywordCall;
+import org.robotframework.jvmconnector.common.KeywordExecutionResult;
+import org.robotframework.jvmconnector.common.ObjectHandle;
+import org.robotframework.jvmconnector.common.TestFailedException;
+
+/**
+ * Compact encoding of the values sent by the binary transport. Strings,
+ * numbers, booleans, arrays of them, keyword calls, keyword execution
+ * results, test failures and object handles have their own encoding, other
+ * values are sent using Java serialization. Values are sent in frames
+ * prefixed with their length, which may be at most {@link #MAX_FRAME_SIZE}.
+ * Lengths inside a frame are checked against the bytes left in it before
+ * anything is allocated. A codec that does not accept serialized
+ * values refuses to read them, so that no classes are loaded or
+ * instantiated based on what was received.
+ */
+public class BinaryCodec {
+    public static final int MAX_FRAME_SIZE = 64 * 1024 * 1024;
+    private static final String UTF8 = "UTF-8";
+
+    private static final byte NULL = 0;
+    private static final byte STRING = 1;
+    private static final byte INTEGER = 2;
+    private static final byte LONG = 3;
+    private static final byte DOUBLE = 4;
+    private static final byte BOOLEAN = 5;
+    private static final byte ARRAY = 6;
+    private static final byte KEYWORD_CALL = 7;
+    private static final byte KEYWORD_EXECUTION_RESULT = 8;
+    private static final byte TEST_FAILED_EXCEPTION = 9;
+    private static final byte SERIALIZED = 10;
+    private static final byte BYTES = 11;
+    private static final byte OBJECT_HANDLE = 12;
+    private static final Map<String, Class<?>> ARRAY_TYPES = new HashMap<String, Class<?>>();
+
+    static {
+        for (Class<?> type : new Class<?>[] { Object.class, String.class, Integer.class, Long.class, Double.class,
+                Boolean.class, KeywordCall.class, KeywordExecutionResult.class, TestFailedException.class,
+                ObjectHandle.class })
+            ARRAY_TYPES.put(type.getName(), type);
+    }
+
+    private final boolean acceptSerialized;
+
+    public BinaryCodec() {
+        this(true);
+    }
+
+    public BinaryCodec(boolean acceptSerialized) {
+        this.acceptSerialized = acceptSerialized;
+    }
+
+    public void writeFrame(DataOutputStream out, Object value) throws IOException {
+        ByteArrayOutputStream frame = new ByteArrayOutputStream();
+        write(new DataOutputStream(frame), value);
+        if (frame.size() > MAX_FRAME_SIZE)
+            throw new IOException("Value is too big to send, frame size " + frame.size() + " exceeds " + MAX_FRAME_SIZE);
+        out.writeInt(frame.size());
+        frame.writeTo(out);
+        out.flush();
+    }
+
+    public Object readFrame(DataInputStream in) throws IOException {
+        return decode(readFrameBytes(in));
+    }
+
+    /**
+     * Reads a frame without decoding it, so that a frame that cannot be
+     * decoded does not break the stream.
+     */
+    public byte[] readFrameBytes(DataInputStream in) throws IOException {
+        int length = in.readInt();
+        if (length < 0 || length > MAX_FRAME_SIZE)
+            throw new IOException("Invalid frame size " + length + ", maximum is " + MAX_FRAME_SIZE);
+        byte[] frame = new byte[length];
+        in.readFully(frame);
+        return frame;
+    }
+
+    public Object decode(byte[] frame) throws IOException {
+        return read(new DataInputStream(new ByteArrayInputStream(frame)));
+    }
+
+    void write(DataOutputStream out, Object value) throws IOException {
+        if (value == null) {
+            out.writeByte(NULL);
+        } else if (value instanceof String) {
+            out.writeByte(STRING);
+            writeString(out, (String) value);
+        } else if (value instanceof Integer) {
+            out.writeByte(INTEGER);
+            out.writeInt(((Integer) value).intValue());
+        } else if (value instanceof Long) {
+            out.writeByte(LONG);
+            out.writeLong(((Long) value).longValue());
+        } else if (value instanceof Double) {
+            out.writeByte(DOUBLE);
+            out.writeDouble(((Double) value).doubleValue());
+        } else if (value instanceof Boolean) {
+            out.writeByte(BOOLEAN);
+            out.writeBoolean(((Boolean) value).booleanValue());
+        } else if (value instanceof byte[]) {
+            out.writeByte(BYTES);
+            out.writeInt(((byte[]) value).length);
+            out.write((byte[]) value);
+        } else if (value instanceof Object[] && ARRAY_TYPES.containsKey(value.getClass().getComponentType().getName())) {
+            writeArray(out, (Object[]) value);
+        } else if (value instanceof KeywordCall) {
+            writeKeywordCall(out, (KeywordCall) value);
+        } else if (value instanceof KeywordExecutionResult) {
+            writeKeywordExecutionResult(out, (KeywordExecutionResult) value);
+        } else if (value instanceof TestFailedException) {
+            writeTestFailedException(out, (TestFailedException) value);
+        } else if (value instanceof ObjectHandle) {
+            writeObjectHandle(out, (ObjectHandle) value);
+        } else {
+            writeSerialized(out, value);
+        }
+    }
+
+    Object read(DataInputStream in) throws IOException {
+        byte type = in.readByte();
+        switch (type) {
+        case NULL:
+            return null;
+        case STRING:
+            return readString(in);
+        case INTEGER:
+            return new Integer(in.readInt());
+        case LONG:
+            return new Long(in.readLong());
+        case DOUBLE:
+            return new Double(in.readDouble());
+        case BOOLEAN:
+            return Boolean.valueOf(in.readBoolean());
+        case ARRAY:
+            return readArray(in);
+        case KEYWORD_CALL:
+            return readKeywordCall(in);
+        case KEYWORD_EXECUTION_RESULT:
+            return readKeywordExecutionResult(in);
+        case TEST_FAILED_EXCEPTION:
+            return readTestFailedException(in);
+        case SERIALIZED:
+            return readSerialized(in);
+        case BYTES:
+            byte[] bytes = new byte[readLength(in, 1)];
+            in.readFully(bytes);
+            return bytes;
+        case OBJECT_HANDLE:
+            return new ObjectHandle((String) read(in), (String) read(in));
+        default:
+            throw new IOException("Unknown value type " + type);
+        }
+    }
+
+    /**
+     * Reads a length and checks that the rest of the frame can contain that
+     * many elements, so that nothing is allocated based on an invalid length.
+     */
+    private int readLength(DataInputStream in, int minimumElementSize) throws IOException {
+        int length = in.readInt();
+        if (length < 0 || (long) length * minimumElementSize > in.available())
+            throw new IOException("Invalid length " + length + ", only " + in.available() + " bytes left in frame");
+        return length;
+    }
+
+    private void writeString(DataOutputStream out, String value) throws IOException {
+        byte[] bytes = value.getBytes(UTF8);
+        out.writeInt(bytes.length);
+        out.write(bytes);
+    }
+
+    private String readString(DataInputStream in) throws IOException {
+        byte[] bytes = new byte[readLength(in, 1)];
+        in.readFully(bytes);
+        return new String(bytes, UTF8);
+    }
+
+    private void writeArray(DataOutputStream out, Object[] values) throws IOException {
+        out.writeByte(ARRAY);
+        writeString(out, values.getClass().getComponentType().getName());
+        out.writeInt(values.length);
+        for (Object value : values)
+            write(out, value);
+    }
+
+    private Object[] readArray(DataInputStream in) throws IOException {
+        String typeName = readString(in);
+        Class<?> componentType = ARRAY_TYPES.get(typeName);
+        if (componentType == null)
+            throw new IOException("Cannot read array of type " + typeName);
+        Object[] values = (Object[]) Array.newInstance(componentType, readLength(in, 1));
+        for (int i = 0; i < values.length; i++)
+            values[i] = read(in);
+        return values;
+    }
+
+    private void writeKeywordCall(DataOutputStream out, KeywordCall call) throws IOException {
+        out.writeByte(KEYWORD_CALL);
+        write(out, call.getKeywordName());
+        write(out, call.getKeywordArguments());
+    }
+
+    private KeywordCall readKeywordCall(DataInputStream in) throws IOException {
+        return new KeywordCall((String) read(in), (Object[]) read(in));
+    }
+
+    private void writeKeywordExecutionResult(DataOutputStream out, KeywordExecutionResult result) throws IOException {
+        out.writeByte(KEYWORD_EXECUTION_RESULT);
+        write(out, result.getResult());
+        write(out, result.getStdOutAsString());
+        write(out, result.getStdErrAsString());
+        write(out, result.keywordPassed() ? null : result.getTestFailedException());
+        out.writeInt(result.getAttempts());
+        out.writeBoolean(result.keywordTimedOut());
+    }
+
+    private KeywordExecutionResult readKeywordExecutionResult(DataInputStream in) throws IOException {
+        KeywordExecutionResultImpl result = new KeywordExecutionResultImpl();
+        result.setResult(read(in));
+        result.setStdStreams((String) read(in), (String) read(in));
+        TestFailedException exception = (TestFailedException) read(in);
+        result.setAttempts(in.readInt());
+        if (in.readBoolean())
+            result.setTimedOut(exception);
+        else if (exception != null)
+            result.setTestFailedException(exception);
+        return result;
+    }
+
+    private void writeTestFailedException(DataOutputStream out, TestFailedException exception) throws IOException {
+        out.writeByte(TEST_FAILED_EXCEPTION);
+        write(out, exception.getSourceExceptionClassName());
+        write(out, exception.getSourceMessage());
+        write(out, exception.getStackTraceAsString());
+    }
+
+    private TestFailedException readTestFailedException(DataInputStream in) throws IOException {
+        return new TestFailedException((String) read(in), (String) read(in), (String) read(in));
+    }
+
+    private void writeObjectHandle(DataOutputStream out, ObjectHandle handle) throws IOException {
+        out.writeByte(OBJECT_HANDLE);
+        write(out, handle.getId());
+        write(out, handle.getClassName());
+    }
+
+    private void writeSerialized(DataOutputStream out, Object value) throws IOException {
+        if (!(value instanceof Serializable))
+            throw new IOException("Cannot send value of type " + value.getClass().getName());
+        ByteArrayOutputStream bytes = new ByteArrayOutputStream();
+        ObjectOutputStream objectOut = new ObjectOutputStream(bytes);
+        objectOut.writeObject(value);
+        objectOut.close();
+        out.writeByte(SERIALIZED);
+        out.writeInt(bytes.size());
+        bytes.writeTo(out);
+    }
+
+    private Object readSerialized(DataInputStream in) throws IOException {
+        if (!acceptSerialized)
+            throw new IOException("Serialized values are not accepted, only strings, numbers, booleans, arrays and object handles can be sent");
+        byte[] bytes = new byte[readLength(in, 1)];
+        in.readFully(bytes);
+        ObjectInputStream objectIn = new ObjectInputStream(new ByteArrayInputStream(bytes));
+        try {
+            return objectIn.readObject();
+        } catch (ClassNotFoundException e) {
+            throw new IOException("Cannot read value: " + e.getMessage());
+        } finally {
+            objectIn.close();
+        }
+    }
+}
@@ -0,0 +1,217 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+package org.robotframework.jvmconnector.server;
+
+import static org.robotframework.javalib.util.Logger.log;
+
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.EOFException;
+import java.io.IOException;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.net.InetAddress;
+import java.net.ServerSocket;
+import java.net.Socket;
+import java.net.UnknownHostException;
+import java.util.Arrays;
+import java.util.HashMap;
+import java.util.Map;
+
+/**
+ * Serves a {@link LibraryImporter} over the binary transport. Each request
+ * frame contains a method name, its parameter types and its arguments, and
+ * the response frame contains either the return value or the thrown
+ * exception. Only methods of the {@link LibraryImporter} interface can be
+ * invoked, and Java serialized values are not accepted from clients. Every
+ * client connection is kept open and served by its own thread.
+ */
+public class BinaryTransportServer {
+    public static final String SCHEME = "binary";
+    private static final Map<String, Method> METHODS = new HashMap<String, Method>();
+
+    static {
+        for (Method method : LibraryImporter.class.getMethods())
+            METHODS.put(getSignature(method.getName(), getParameterTypeNames(method)), method);
+    }
+
+    private final LibraryImporter service;
+    private final BinaryCodec codec = new BinaryCodec(false);
+
+    public BinaryTransportServer(LibraryImporter service) {
+        this.service = service;
+    }
+
+    /**
+     * Starts serving in background threads, accepting connections on all
+     * interfaces.
+     *
+     * @return the url of the service, containing the name of this host
+     */
+    public String start(int port) {
+        return start(createServerSocket(port, null), getLocalHostName());
+    }
+
+    /**
+     * Starts serving in background threads, accepting connections only from
+     * the same host. Port 0 selects a free port.
+     *
+     * @return the url of the service
+     */
+    public String startOnLoopback(int port) {
+        return start(createServerSocket(port, getLoopbackAddress()), "127.0.0.1");
+    }
+
+    private String start(final ServerSocket serverSocket, String host) {
+        startDaemon("binary transport acceptor", new Runnable() {
+            public void run() {
+                acceptConnections(serverSocket);
+            }
+        });
+        return SCHEME + "://" + host + ":" + serverSocket.getLocalPort();
+    }
+
+    private ServerSocket createServerSocket(int port, InetAddress address) {
+        try {
+            return new ServerSocket(port, 50, address);
+        } catch (IOException e) {
+            throw new RuntimeException(e);
+        }
+    }
+
+    private String getLocalHostName() {
+        try {
+            return InetAddress.getLocalHost().getHostName();
+        } catch (UnknownHostException e) {
+            return "localhost";
+        }
+    }
+
+    private InetAddress getLoopbackAddress() {
+        try {
+            return InetAddress.getByName("127.0.0.1");
+        } catch (UnknownHostException e) {
+            throw new RuntimeException(e);
+        }
+    }
+
+    private void acceptConnections(ServerSocket serverSocket) {
+        while (true) {
+            try {
+                final Socket socket = serverSocket.accept();
+                startDaemon("binary transport connection", new Runnable() {
+                    public void run() {
+                        serve(socket);
+                    }
+                });
+            } catch (IOException e) {
+                log("binary transport stopped accepting connections: " + e.getMessage());
+                return;
+            }
+        }
+    }
+
+    private void serve(Socket socket) {
+        try {
+            socket.setTcpNoDelay(true);
+            DataInputStream in = new DataInputStream(new BufferedInputStream(socket.getInputStream()));
+            DataOutputStream out = new DataOutputStream(new BufferedOutputStream(socket.getOutputStream()));
+            while (true)
+                writeResponse(out, handleRequest(codec.readFrameBytes(in)));
+        } catch (EOFException e) {
+            // Client closed the connection.
+        } catch (IOException e) {
+            log("binary transport connection failed: " + e.getMessage());
+        } finally {
+            close(socket);
+        }
+    }
+
+    private void writeResponse(DataOutputStream out, Object[] response) throws IOException {
+        try {
+            codec.writeFrame(out, response);
+        } catch (IOException e) {
+            if (!Boolean.TRUE.equals(response[0]))
+                throw e;
+            codec.writeFrame(out, new Object[] { Boolean.FALSE, new RuntimeException(e.getMessage()) });
+        }
+    }
+
+    private Object[] handleRequest(byte[] frame) {
+        String methodName;
+        String[] parameterTypeNames;
+        Object[] args;
+        try {
+            Object[] request = (Object[]) codec.decode(frame);
+            methodName = (String) request[0];
+            parameterTypeNames = (String[]) request[1];
+            args = (Object[]) request[2];
+        } catch (Exception e) {
+            return new Object[] { Boolean.FALSE, new IllegalArgumentException("Invalid request: " + e) };
+        }
+        return invoke(methodName, parameterTypeNames, args);
+    }
+
+    Object[] invoke(String methodName, String[] parameterTypeNames, Object[] args) {
+        try {
+            Method method = findMethod(methodName, parameterTypeNames);
+            return new Object[] { Boolean.TRUE, method.invoke(service, args) };
+        } catch (InvocationTargetException e) {
+            return new Object[] { Boolean.FALSE, e.getCause() };
+        } catch (Exception e) {
+            return new Object[] { Boolean.FALSE, e };
+        }
+    }
+
+    private Method findMethod(String methodName, String[] parameterTypeNames) throws NoSuchMethodException {
+        String signature = getSignature(methodName, parameterTypeNames);
+        Method method = METHODS.get(signature);
+        if (method == null)
+            throw new NoSuchMethodException(signature);
+        return method;
+    }
+
+    /**
+     * @return names of the parameter types of the method, as sent in requests
+     */
+    public static String[] getParameterTypeNames(Method method) {
+        Class<?>[] parameterTypes = method.getParameterTypes();
+        String[] names = new String[parameterTypes.length];
+        for (int i = 0; i < names.length; i++)
+            names[i] = parameterTypes[i].getName();
+        return names;
+    }
+
+    private static String getSignature(String methodName, String[] parameterTypeNames) {
+        return methodName + Arrays.asList(parameterTypeNames);
+    }
+
+    private void startDaemon(String name, Runnable runnable) {
+        Thread thread = new Thread(runnable, name);
+        thread.setDaemon(true);
+        thread.start();
+    }
+
+    private void close(Socket socket) {
+        try {
+            socket.close();
+        } catch (IOException e) {
+            log("closing binary transport connection failed: " + e.getMessage());
+        }
+    }
+}
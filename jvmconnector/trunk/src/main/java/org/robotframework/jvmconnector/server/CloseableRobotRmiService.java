@@ -20,9 +20,11 @@ package org.robotframework.jvmconnector.server;
 import org.robotframework.javalib.library.RobotJavaLibrary;
 import org.robotframework.javalib.util.ArrayUtil;
 import org.robotframework.javalib.util.KeywordNameNormalizer;
+import org.robotframework.jvmconnector.common.KeywordCall;
 import org.robotframework.jvmconnector.common.KeywordExecutionResult;
 
 public class CloseableRobotRmiService implements RobotRmiService {
+    private static final KeywordNameNormalizer normalizer = new KeywordNameNormalizer();
     private final RobotRmiService wrappedService;
 
     public CloseableRobotRmiService(RobotRmiService wrappedService) {
@@ -40,12 +42,74 @@ public class CloseableRobotRmiService implements RobotRmiService {
         return wrappedService.runKeyword(keywordName, keywordArguments);
     }
 
+    public KeywordExecutionResult[] runKeywords(KeywordCall[] keywordCalls, boolean stopOnFailure) {
+        int systemExitIndex = indexOfSystemExit(keywordCalls);
+        if (systemExitIndex < 0)
+            return wrappedService.runKeywords(keywordCalls, stopOnFailure);
+
+        KeywordCall[] callsBeforeExit = ArrayUtil.copyOfRange(keywordCalls, 0, systemExitIndex);
+        KeywordExecutionResult[] results = wrappedService.runKeywords(callsBeforeExit, stopOnFailure);
+        if (!stopOnFailure || allPassed(results))
+            System.exit(0);
+        return results;
+    }
+
+    public KeywordExecutionResult runKeywordWithTimeout(String keywordName, Object[] keywordArguments, long timeoutMillis) {
+        if (isSystemExit(keywordName)) {
+            System.exit(0);
+        }
+        return wrappedService.runKeywordWithTimeout(keywordName, keywordArguments, timeoutMillis);
+    }
+
+    public KeywordExecutionResult runKeywordUntilSucceeds(String keywordName, Object[] keywordArguments, long timeoutMillis,
+        long retryIntervalMillis) {
+        if (isSystemExit(keywordName)) {
+            System.exit(0);
+        }
+        return wrappedService.runKeywordUntilSucceeds(keywordName, keywordArguments, timeoutMillis, retryIntervalMillis);
+    }
+
+    public String startKeyword(String keywordName, Object[] keywordArguments) {
+        if (isSystemExit(keywordName)) {
+            System.exit(0);
+        }
+        return wrappedService.startKeyword(keywordName, keywordArguments);
+    }
+
+    public KeywordExecutionResult waitForKeyword(String handle, long timeoutMillis) {
+        return wrappedService.waitForKeyword(handle, timeoutMillis);
+    }
+
+    public String[] readKeywordOutput(String handle) {
+        return wrappedService.readKeywordOutput(handle);
+    }
+
+    public void releaseKeyword(String handle) {
+        wrappedService.releaseKeyword(handle);
+    }
+
+    private int indexOfSystemExit(KeywordCall[] keywordCalls) {
+        for (int i = 0; i < keywordCalls.length; i++) {
+            if (isSystemExit(keywordCalls[i].getKeywordName()))
+                return i;
+        }
+        return -1;
+    }
+
+    private boolean allPassed(KeywordExecutionResult[] results) {
+        for (KeywordExecutionResult result : results) {
+            if (!result.keywordPassed())
+                return false;
+        }
+        return true;
+    }
+
     public void setLibrary(RobotJavaLibrary library) {
         wrappedService.setLibrary(library);
     }
 
     private boolean isSystemExit(String keywordName) {
-        return new KeywordNameNormalizer().normalize(keywordName).equals("systemexit");
+        return normalizer.normalize(keywordName).equals("systemexit");
     }
 
     public boolean ping() {
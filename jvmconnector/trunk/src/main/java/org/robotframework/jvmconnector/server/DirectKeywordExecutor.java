@@ -0,0 +1,36 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.robotframework.jvmconnector.server;
+
+import java.util.concurrent.Callable;
+
+import org.robotframework.jvmconnector.common.KeywordExecutionResult;
+
+/**
+ * Runs keywords in the calling thread without any restrictions.
+ */
+public class DirectKeywordExecutor implements KeywordExecutor {
+    public KeywordExecutionResult execute(Callable<KeywordExecutionResult> keywordCall) {
+        try {
+            return keywordCall.call();
+        } catch (RuntimeException e) {
+            throw e;
+        } catch (Exception e) {
+            throw new RuntimeException(e);
+        }
+    }
+}
@@ -0,0 +1,96 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.robotframework.jvmconnector.server;
+
+import java.util.Collections;
+import java.util.HashMap;
+import java.util.Map;
+
+/**
+ * Creates keyword executors for libraries based on their execution policies.
+ * The policies are:
+ * <ul>
+ * <li><code>direct</code>: keywords run in the calling thread without
+ * restrictions. This is the default.</li>
+ * <li><code>serial</code>: one keyword of the library runs at a time.</li>
+ * <li><code>parallel-N</code>: at most N keywords of the library run at a
+ * time.</li>
+ * <li><code>thread-NAME</code>: keywords run in a thread called NAME, which
+ * is shared by all the libraries using the same name.</li>
+ * </ul>
+ * The policy given with the name {@link #DEFAULT} is used with libraries
+ * without their own policy.
+ */
+public class ExecutionPolicies {
+    public static final String DEFAULT = "*";
+
+    private final Map<String, String> policies;
+    private final Map<String, KeywordExecutor> threadExecutors = new HashMap<String, KeywordExecutor>();
+
+    public ExecutionPolicies() {
+        this(Collections.<String, String>emptyMap());
+    }
+
+    public ExecutionPolicies(Map<String, String> policies) {
+        this.policies = policies;
+        for (String policy : policies.values())
+            validate(policy);
+    }
+
+    public KeywordExecutor createExecutor(String libraryName) {
+        return createExecutorForPolicy(getPolicy(libraryName));
+    }
+
+    private String getPolicy(String libraryName) {
+        if (policies.containsKey(libraryName))
+            return policies.get(libraryName);
+        if (policies.containsKey(DEFAULT))
+            return policies.get(DEFAULT);
+        return "direct";
+    }
+
+    private void validate(String policy) {
+        createExecutorForPolicy(policy);
+    }
+
+    private KeywordExecutor createExecutorForPolicy(String policy) {
+        String lowerCasePolicy = policy.toLowerCase();
+        if (lowerCasePolicy.equals("direct"))
+            return new DirectKeywordExecutor();
+        if (lowerCasePolicy.equals("serial"))
+            return new LimitedKeywordExecutor(1);
+        if (lowerCasePolicy.startsWith("parallel-"))
+            return new LimitedKeywordExecutor(parseLimit(policy));
+        if (lowerCasePolicy.startsWith("thread-") && policy.length() > "thread-".length())
+            return getThreadExecutor(policy.substring("thread-".length()));
+        throw new IllegalArgumentException("Unknown execution policy '" + policy + "'");
+    }
+
+    private int parseLimit(String policy) {
+        try {
+            return Integer.parseInt(policy.substring("parallel-".length()));
+        } catch (NumberFormatException e) {
+            throw new IllegalArgumentException("Unknown execution policy '" + policy + "'");
+        }
+    }
+
+    private synchronized KeywordExecutor getThreadExecutor(String threadName) {
+        if (!threadExecutors.containsKey(threadName))
+            threadExecutors.put(threadName, new ThreadKeywordExecutor(threadName));
+        return threadExecutors.get(threadName);
+    }
+}
@@ -32,6 +32,8 @@ public class KeywordExecutionResultImpl implements KeywordExecutionResult {
     private String stdErrAsString;
     private TestFailedException testFailedException;
     private boolean keywordPassed = true;
+    private int attempts = 1;
+    private boolean keywordTimedOut = false;
 
     public Object getResult() {
         return keywordExecutionResult;
@@ -53,6 +55,26 @@ public class KeywordExecutionResultImpl implements KeywordExecutionResult {
         return testFailedException;
     }
 
+    public boolean keywordTimedOut() {
+        return keywordTimedOut;
+    }
+
+    /**
+     * Marks the keyword failed because of a timeout.
+     */
+    public void setTimedOut(TestFailedException testFailedException) {
+        setTestFailedException(testFailedException);
+        keywordTimedOut = true;
+    }
+
+    public int getAttempts() {
+        return attempts;
+    }
+
+    public void setAttempts(int attempts) {
+        this.attempts = attempts;
+    }
+
     public void setResult(Object keywordExecutionResult) {
         this.keywordExecutionResult = keywordExecutionResult;
     }
@@ -70,4 +92,9 @@ public class KeywordExecutionResultImpl implements KeywordExecutionResult {
         stdOutAsString = streamRedirecter.getStdOutAsString();
         stdErrAsString = streamRedirecter.getStdErrAsString();
     }
+
+    public void setStdStreams(String stdOutAsString, String stdErrAsString) {
+        this.stdOutAsString = stdOutAsString;
+        this.stdErrAsString = stdErrAsString;
+    }
 }
@@ -0,0 +1,128 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+package org.robotframework.jvmconnector.server;
+
+import org.robotframework.jvmconnector.common.KeywordCall;
+import org.robotframework.jvmconnector.common.KeywordExecutionResult;
+import org.robotframework.jvmconnector.common.ObjectHandle;
+
+/**
+ * Routes keyword calls to the libraries registered to a single service, so
+ * that all the libraries of an application can be used over one connection.
+ */
+public interface LibraryDispatcher {
+    /**
+     * Instantiates the library and registers it under its name. Registering
+     * an already registered library does nothing.
+     */
+    void registerLibrary(String libraryName);
+
+    /**
+     * @see RobotRmiService#getKeywordNames()
+     */
+    String[] getKeywordNames(String libraryName);
+
+    /**
+     * @see RobotRmiService#runKeyword(String, Object[])
+     */
+    KeywordExecutionResult runKeyword(String libraryName, String keywordName, Object[] keywordArguments);
+
+    /**
+     * @see RobotRmiService#runKeywords(KeywordCall[], boolean)
+     */
+    KeywordExecutionResult[] runKeywords(String libraryName, KeywordCall[] keywordCalls, boolean stopOnFailure);
+
+    /**
+     * @see ObjectHandleTable#getField(ObjectHandle, String)
+     */
+    Object getObjectField(ObjectHandle handle, String fieldName);
+
+    /**
+     * @see ObjectHandleTable#getSlice(ObjectHandle, int, int)
+     */
+    Object[] getObjectSlice(ObjectHandle handle, int start, int end);
+
+    /**
+     * Removes the object referred by the handle from the object handle table.
+     */
+    void releaseObject(ObjectHandle handle);
+
+    /**
+     * @see PayloadStore#createPayload(String)
+     */
+    ObjectHandle createPayload(String path);
+
+    /**
+     * Runs the keyword and keeps the file or the byte array it returns as a
+     * payload regardless of the object handle policy. The result contains
+     * the handle of the payload.
+     *
+     * @see PayloadStore#keepResult(Object)
+     */
+    KeywordExecutionResult runKeywordForPayload(String libraryName, String keywordName, Object[] keywordArguments);
+
+    /**
+     * @see PayloadStore#appendChunk(ObjectHandle, byte[])
+     */
+    void appendPayloadChunk(ObjectHandle handle, byte[] chunk);
+
+    /**
+     * @see PayloadStore#readChunk(ObjectHandle, long, int)
+     */
+    byte[] readPayloadChunk(ObjectHandle handle, long offset, int length);
+
+    /**
+     * @see PayloadStore#getSize(ObjectHandle)
+     */
+    long getPayloadSize(ObjectHandle handle);
+
+    /**
+     * @see PayloadStore#getPath(ObjectHandle)
+     */
+    String getPayloadPath(ObjectHandle handle);
+
+    /**
+     * @see RobotRmiService#runKeywordWithTimeout(String, Object[], long)
+     */
+    KeywordExecutionResult runKeywordWithTimeout(String libraryName, String keywordName, Object[] keywordArguments,
+        long timeoutMillis);
+
+    /**
+     * @see RobotRmiService#runKeywordUntilSucceeds(String, Object[], long, long)
+     */
+    KeywordExecutionResult runKeywordUntilSucceeds(String libraryName, String keywordName, Object[] keywordArguments,
+        long timeoutMillis, long retryIntervalMillis);
+
+    /**
+     * @see RobotRmiService#startKeyword(String, Object[])
+     */
+    String startKeyword(String libraryName, String keywordName, Object[] keywordArguments);
+
+    /**
+     * @see RobotRmiService#waitForKeyword(String, long)
+     */
+    KeywordExecutionResult waitForKeyword(String libraryName, String handle, long timeoutMillis);
+
+    /**
+     * @see RobotRmiService#readKeywordOutput(String)
+     */
+    String[] readKeywordOutput(String libraryName, String handle);
+
+    /**
+     * @see RobotRmiService#releaseKeyword(String)
+     */
+    void releaseKeyword(String libraryName, String handle);
+}
@@ -0,0 +1,51 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.robotframework.jvmconnector.server;
+
+import java.util.concurrent.Callable;
+import java.util.concurrent.Semaphore;
+
+import org.robotframework.jvmconnector.common.KeywordExecutionResult;
+
+/**
+ * Runs keywords in the calling thread, letting at most the given number of
+ * them run at the same time. With one permit keywords are serialized.
+ */
+public class LimitedKeywordExecutor implements KeywordExecutor {
+    private final DirectKeywordExecutor executor = new DirectKeywordExecutor();
+    private final Semaphore permits;
+
+    public LimitedKeywordExecutor(int maxConcurrentKeywords) {
+        if (maxConcurrentKeywords < 1)
+            throw new IllegalArgumentException("At least one concurrent keyword must be allowed");
+        this.permits = new Semaphore(maxConcurrentKeywords, true);
+    }
+
+    public KeywordExecutionResult execute(Callable<KeywordExecutionResult> keywordCall) {
+        try {
+            permits.acquire();
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            throw new RuntimeException(e);
+        }
+        try {
+            return executor.execute(keywordCall);
+        } finally {
+            permits.release();
+        }
+    }
+}
@@ -0,0 +1,253 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.robotframework.jvmconnector.server;
+
+import java.io.Serializable;
+import java.lang.reflect.Array;
+import java.lang.reflect.Field;
+import java.lang.reflect.Method;
+import java.util.HashMap;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+
+import org.robotframework.jvmconnector.common.ObjectHandle;
+
+/**
+ * Keeps keyword return values on the remote side and gives out
+ * {@link ObjectHandle}s referring to them. The least recently used objects
+ * are evicted when the table is full. The policy decides which values are
+ * kept:
+ * <ul>
+ * <li><code>none</code>: all values are returned as they are. This is the
+ * default.</li>
+ * <li><code>nonserializable</code>: values that could not be sent over the
+ * network are kept.</li>
+ * <li><code>all</code>: all values except strings, numbers, booleans,
+ * characters and arrays of them are kept.</li>
+ * </ul>
+ * Pinned objects, such as payloads, are never evicted and are kept until
+ * they are released.
+ */
+public class ObjectHandleTable {
+    public static final int DEFAULT_MAX_SIZE = 1000;
+    private static final String HANDLE_PREFIX = "objecthandle-";
+
+    private final String policy;
+    private final Map<String, Object> objects;
+    private final Map<String, Object> pinnedObjects = new HashMap<String, Object>();
+    private long handleCount;
+
+    public ObjectHandleTable() {
+        this("none");
+    }
+
+    public ObjectHandleTable(String policy) {
+        this(policy, DEFAULT_MAX_SIZE);
+    }
+
+    @SuppressWarnings("serial")
+    public ObjectHandleTable(String policy, final int maxSize) {
+        this.policy = policy == null ? "none" : policy.toLowerCase();
+        if (!this.policy.equals("none") && !this.policy.equals("nonserializable") && !this.policy.equals("all"))
+            throw new IllegalArgumentException("Unknown object handle policy '" + policy + "'");
+        this.objects = new LinkedHashMap<String, Object>(16, 0.75f, true) {
+            protected boolean removeEldestEntry(Map.Entry<String, Object> eldest) {
+                return size() > maxSize;
+            }
+        };
+    }
+
+    /**
+     * @return the value itself or a handle referring to it, depending on the
+     *         policy
+     */
+    public synchronized Object toReturnValue(Object value) {
+        if (!shouldKeep(value))
+            return value;
+        return keep(value);
+    }
+
+    /**
+     * Keeps the value regardless of the policy.
+     */
+    public synchronized ObjectHandle keep(Object value) {
+        return keep(value, objects);
+    }
+
+    /**
+     * Keeps the value until it is released, regardless of the policy and the
+     * size of the table.
+     */
+    public synchronized ObjectHandle pin(Object value) {
+        return keep(value, pinnedObjects);
+    }
+
+    private ObjectHandle keep(Object value, Map<String, Object> storage) {
+        String id = HANDLE_PREFIX + ++handleCount;
+        storage.put(id, value);
+        return new ObjectHandle(id, value.getClass().getName());
+    }
+
+    /**
+     * Replaces handles with the referenced objects.
+     */
+    public synchronized Object[] resolveArguments(Object[] arguments) {
+        if (arguments == null)
+            return null;
+        Object[] resolved = arguments;
+        for (int i = 0; i < arguments.length; i++) {
+            if (arguments[i] instanceof ObjectHandle) {
+                if (resolved == arguments)
+                    resolved = arguments.clone();
+                resolved[i] = get((ObjectHandle) arguments[i]);
+            }
+        }
+        return resolved;
+    }
+
+    /**
+     * Replaces strings that are ids of kept objects with the objects. Used
+     * with XML-RPC, where handles can only be given back as their ids.
+     *
+     * @throws IllegalArgumentException if an id refers to an object that has
+     *             been released or evicted
+     */
+    public synchronized Object[] resolveHandleIds(Object[] arguments) {
+        if (arguments == null)
+            return null;
+        Object[] resolved = arguments;
+        for (int i = 0; i < arguments.length; i++) {
+            if (isHandleId(arguments[i])) {
+                if (resolved == arguments)
+                    resolved = arguments.clone();
+                resolved[i] = get((String) arguments[i]);
+            }
+        }
+        return resolved;
+    }
+
+    private boolean isHandleId(Object argument) {
+        return argument instanceof String && ((String) argument).matches(HANDLE_PREFIX + "\\d+");
+    }
+
+    public synchronized Object get(ObjectHandle handle) {
+        return get(handle.getId());
+    }
+
+    /**
+     * @return whether the object is still available, or has been released or
+     *         evicted
+     */
+    public synchronized boolean contains(ObjectHandle handle) {
+        return objects.containsKey(handle.getId()) || pinnedObjects.containsKey(handle.getId());
+    }
+
+    public synchronized void release(ObjectHandle handle) {
+        objects.remove(handle.getId());
+        pinnedObjects.remove(handle.getId());
+    }
+
+    /**
+     * Returns the value of a property of the referenced object, read using a
+     * <code>getX</code> or <code>isX</code> getter or a public field with
+     * the given name. Other methods are never called.
+     */
+    public Object getField(ObjectHandle handle, String name) {
+        return toReturnValue(readField(get(handle), name));
+    }
+
+    /**
+     * Returns the elements of the referenced array or list from
+     * <code>start</code> (inclusive) to <code>end</code> (exclusive).
+     */
+    public Object[] getSlice(ObjectHandle handle, int start, int end) {
+        Object object = get(handle);
+        int length = getLength(object);
+        if (start < 0 || start > end)
+            throw new IllegalArgumentException("Invalid slice " + start + ":" + end + ", start must be between 0 and end");
+        end = Math.min(end, length);
+        Object[] slice = new Object[Math.max(end - start, 0)];
+        for (int i = 0; i < slice.length; i++)
+            slice[i] = toReturnValue(getElement(object, start + i));
+        return slice;
+    }
+
+    private boolean shouldKeep(Object value) {
+        if (value == null || policy.equals("none"))
+            return false;
+        if (policy.equals("nonserializable"))
+            return !(value instanceof Serializable);
+        return !isSimple(value.getClass());
+    }
+
+    private boolean isSimple(Class<?> type) {
+        if (type.isArray())
+            return isSimple(type.getComponentType());
+        return type.isPrimitive() || type == String.class || Number.class.isAssignableFrom(type)
+            || type == Boolean.class || type == Character.class;
+    }
+
+    private Object get(String id) {
+        if (pinnedObjects.containsKey(id))
+            return pinnedObjects.get(id);
+        if (!objects.containsKey(id))
+            throw new IllegalArgumentException("Object handle '" + id + "' is not available, it may have been released or evicted");
+        return objects.get(id);
+    }
+
+    private Object readField(Object object, String name) {
+        if (name == null || name.length() == 0)
+            throw new IllegalArgumentException("Field name must not be empty");
+        String capitalized = Character.toUpperCase(name.charAt(0)) + name.substring(1);
+        for (String methodName : new String[] { "get" + capitalized, "is" + capitalized }) {
+            try {
+                Method method = object.getClass().getMethod(methodName);
+                if (method.getReturnType() == void.class)
+                    continue;
+                method.setAccessible(true);
+                return method.invoke(object);
+            } catch (NoSuchMethodException e) {
+                continue;
+            } catch (Exception e) {
+                throw new RuntimeException(e);
+            }
+        }
+        try {
+            Field field = object.getClass().getField(name);
+            return field.get(object);
+        } catch (NoSuchFieldException e) {
+            throw new IllegalArgumentException("Object of class " + object.getClass().getName() + " has no field '" + name + "'");
+        } catch (IllegalAccessException e) {
+            throw new RuntimeException(e);
+        }
+    }
+
+    private int getLength(Object object) {
+        if (object.getClass().isArray())
+            return Array.getLength(object);
+        if (object instanceof List)
+            return ((List<?>) object).size();
+        throw new IllegalArgumentException("Object of class " + object.getClass().getName() + " is not an array or a list");
+    }
+
+    private Object getElement(Object object, int index) {
+        if (object instanceof List)
+            return ((List<?>) object).get(index);
+        return Array.get(object, index);
+    }
+}
@@ -0,0 +1,212 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.robotframework.jvmconnector.server;
+
+import java.io.File;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.RandomAccessFile;
+import java.util.HashMap;
+import java.util.Iterator;
+import java.util.Map;
+
+import org.robotframework.jvmconnector.common.ObjectHandle;
+
+/**
+ * Transfers big keyword arguments and return values in chunks outside the
+ * keyword calls. Payloads are files or byte arrays pinned to the
+ * {@link ObjectHandleTable}, so they are not evicted while they are
+ * transferred and keywords get uploaded payloads as
+ * <code>java.io.File</code> arguments. When the client runs on the same
+ * host, it can use the path of the payload file directly instead of
+ * transferring the content. Temporary files created by the store are deleted
+ * when their payload is released, or evicted from the table in case of byte
+ * arrays kept by the object handle policy.
+ */
+public class PayloadStore {
+    private final ObjectHandleTable objectHandles;
+    private final Map<ObjectHandle, File> temporaryFiles = new HashMap<ObjectHandle, File>();
+
+    public PayloadStore(ObjectHandleTable objectHandles) {
+        this.objectHandles = objectHandles;
+    }
+
+    /**
+     * Creates a payload from an existing file, or an empty temporary file
+     * for uploading chunks to if <code>path</code> is <code>null</code>.
+     */
+    public synchronized ObjectHandle createPayload(String path) {
+        deleteFilesOfEvictedObjects();
+        if (path != null)
+            return objectHandles.pin(getExistingFile(path));
+        File file = createTemporaryFile();
+        ObjectHandle handle = objectHandles.pin(file);
+        temporaryFiles.put(handle, file);
+        return handle;
+    }
+
+    /**
+     * Pins a keyword return value as a payload. The value may also be a
+     * handle to a file or a byte array kept by the object handle policy.
+     */
+    public ObjectHandle keepResult(Object value) {
+        if (value instanceof ObjectHandle) {
+            ObjectHandle handle = (ObjectHandle) value;
+            value = objectHandles.get(handle);
+            objectHandles.release(handle);
+        }
+        if (!(value instanceof File) && !(value instanceof byte[]))
+            throw new IllegalArgumentException("Keyword must return a file or a byte array to be used as a payload, got "
+                + (value == null ? "null" : value.getClass().getName()));
+        return objectHandles.pin(value);
+    }
+
+    public void appendChunk(ObjectHandle handle, byte[] chunk) {
+        try {
+            FileOutputStream out = new FileOutputStream(getFile(handle), true);
+            try {
+                out.write(chunk);
+            } finally {
+                out.close();
+            }
+        } catch (IOException e) {
+            throw new RuntimeException(e);
+        }
+    }
+
+    /**
+     * @return at most <code>length</code> bytes starting from
+     *         <code>offset</code>, an empty array at the end of the payload
+     */
+    public byte[] readChunk(ObjectHandle handle, long offset, int length) {
+        Object payload = getPayload(handle);
+        int chunkLength = (int) Math.max(Math.min(length, getSize(payload) - offset), 0);
+        byte[] chunk = new byte[chunkLength];
+        if (payload instanceof byte[])
+            System.arraycopy(payload, (int) offset, chunk, 0, chunkLength);
+        else
+            readFile((File) payload, offset, chunk);
+        return chunk;
+    }
+
+    public long getSize(ObjectHandle handle) {
+        return getSize(getPayload(handle));
+    }
+
+    /**
+     * @return path of the file containing the payload, byte arrays are
+     *         written to a temporary file first, which is deleted together
+     *         with the payload
+     */
+    public synchronized String getPath(ObjectHandle handle) {
+        deleteFilesOfEvictedObjects();
+        Object payload = getPayload(handle);
+        if (payload instanceof File)
+            return ((File) payload).getAbsolutePath();
+        File file = temporaryFiles.get(handle);
+        if (file == null) {
+            file = createTemporaryFile();
+            writeFile(file, (byte[]) payload);
+            temporaryFiles.put(handle, file);
+        }
+        return file.getAbsolutePath();
+    }
+
+    /**
+     * Removes the payload, deleting the files created for it by this store.
+     */
+    public synchronized void release(ObjectHandle handle) {
+        File file = temporaryFiles.remove(handle);
+        if (file != null)
+            file.delete();
+        objectHandles.release(handle);
+    }
+
+    private void deleteFilesOfEvictedObjects() {
+        for (Iterator<Map.Entry<ObjectHandle, File>> i = temporaryFiles.entrySet().iterator(); i.hasNext();) {
+            Map.Entry<ObjectHandle, File> entry = i.next();
+            if (!objectHandles.contains(entry.getKey())) {
+                entry.getValue().delete();
+                i.remove();
+            }
+        }
+    }
+
+    private Object getPayload(ObjectHandle handle) {
+        Object payload = objectHandles.get(handle);
+        if (!(payload instanceof File) && !(payload instanceof byte[]))
+            throw new IllegalArgumentException("Object handle '" + handle + "' does not refer to a file or a byte array");
+        return payload;
+    }
+
+    private File getFile(ObjectHandle handle) {
+        Object payload = getPayload(handle);
+        if (!(payload instanceof File))
+            throw new IllegalArgumentException("Object handle '" + handle + "' does not refer to a file");
+        return (File) payload;
+    }
+
+    private long getSize(Object payload) {
+        if (payload instanceof byte[])
+            return ((byte[]) payload).length;
+        return ((File) payload).length();
+    }
+
+    private File getExistingFile(String path) {
+        File file = new File(path);
+        if (!file.isFile())
+            throw new IllegalArgumentException("File '" + path + "' does not exist");
+        return file;
+    }
+
+    private File createTemporaryFile() {
+        try {
+            File file = File.createTempFile("payload", null);
+            file.deleteOnExit();
+            return file;
+        } catch (IOException e) {
+            throw new RuntimeException(e);
+        }
+    }
+
+    private void readFile(File file, long offset, byte[] chunk) {
+        try {
+            RandomAccessFile input = new RandomAccessFile(file, "r");
+            try {
+                input.seek(offset);
+                input.readFully(chunk);
+            } finally {
+                input.close();
+            }
+        } catch (IOException e) {
+            throw new RuntimeException(e);
+        }
+    }
+
+    private void writeFile(File file, byte[] content) {
+        try {
+            FileOutputStream out = new FileOutputStream(file);
+            try {
+                out.write(content);
+            } finally {
+                out.close();
+            }
+        } catch (IOException e) {
+            throw new RuntimeException(e);
+        }
+    }
+}
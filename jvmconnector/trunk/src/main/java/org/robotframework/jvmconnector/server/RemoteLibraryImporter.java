@@ -17,15 +17,37 @@
 
 package org.robotframework.jvmconnector.server;
 
+import java.util.concurrent.Callable;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.ConcurrentMap;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.Future;
+import java.util.concurrent.FutureTask;
+
 import org.robotframework.javalib.library.RobotJavaLibrary;
+import org.robotframework.jvmconnector.common.KeywordCall;
+import org.robotframework.jvmconnector.common.KeywordExecutionResult;
+import org.robotframework.jvmconnector.common.ObjectHandle;
 
 public class RemoteLibraryImporter implements LibraryImporter {
     private final int rmiPort;
     private final RmiServicePublisher rmiPublisher;
+    private final ExecutionPolicies executionPolicies;
+    private final ObjectHandleTable objectHandles;
+    private final PayloadStore payloads;
+    private final ConcurrentMap<String, Future<RobotRmiService>> services = new ConcurrentHashMap<String, Future<RobotRmiService>>();
     
     public RemoteLibraryImporter(int rmiPort, RmiServicePublisher rmiPublisher) {
+        this(rmiPort, rmiPublisher, new ExecutionPolicies(), new ObjectHandleTable());
+    }
+
+    public RemoteLibraryImporter(int rmiPort, RmiServicePublisher rmiPublisher, ExecutionPolicies executionPolicies,
+        ObjectHandleTable objectHandles) {
         this.rmiPort = rmiPort;
         this.rmiPublisher = rmiPublisher;
+        this.executionPolicies = executionPolicies;
+        this.objectHandles = objectHandles;
+        this.payloads = new PayloadStore(objectHandles);
     }
 
     public void closeService() {
@@ -34,11 +56,148 @@ public class RemoteLibraryImporter implements LibraryImporter {
 
     public String importLibrary(String libraryName) {
         String serviceName = libraryName.replace('.', '_');
+        RobotRmiService service = createService(libraryName);
+        services.put(libraryName, created(service));
+        return rmiPublisher.publish(serviceName, RobotRmiService.class, service, rmiPort);
+    }
+
+    /**
+     * Creates the library unless it is already registered. The library is
+     * instantiated only once even if it is registered from several threads
+     * at the same time; the others wait for it to be created.
+     */
+    public void registerLibrary(final String libraryName) {
+        FutureTask<RobotRmiService> creation = new FutureTask<RobotRmiService>(new Callable<RobotRmiService>() {
+            public RobotRmiService call() {
+                return createService(libraryName);
+            }
+        });
+        Future<RobotRmiService> existing = services.putIfAbsent(libraryName, creation);
+        if (existing != null) {
+            getResult(existing);
+            return;
+        }
+        creation.run();
+        try {
+            getResult(creation);
+        } catch (RuntimeException e) {
+            services.remove(libraryName, creation);
+            throw e;
+        }
+    }
+
+    public String[] getKeywordNames(String libraryName) {
+        return getService(libraryName).getKeywordNames();
+    }
+
+    public KeywordExecutionResult runKeyword(String libraryName, String keywordName, Object[] keywordArguments) {
+        return getService(libraryName).runKeyword(keywordName, keywordArguments);
+    }
+
+    public KeywordExecutionResult[] runKeywords(String libraryName, KeywordCall[] keywordCalls, boolean stopOnFailure) {
+        return getService(libraryName).runKeywords(keywordCalls, stopOnFailure);
+    }
+
+    public Object getObjectField(ObjectHandle handle, String fieldName) {
+        return objectHandles.getField(handle, fieldName);
+    }
+
+    public Object[] getObjectSlice(ObjectHandle handle, int start, int end) {
+        return objectHandles.getSlice(handle, start, end);
+    }
+
+    public void releaseObject(ObjectHandle handle) {
+        payloads.release(handle);
+    }
+
+    public ObjectHandle createPayload(String path) {
+        return payloads.createPayload(path);
+    }
+
+    public KeywordExecutionResult runKeywordForPayload(String libraryName, String keywordName, Object[] keywordArguments) {
+        KeywordExecutionResult result = runKeyword(libraryName, keywordName, keywordArguments);
+        if (result.keywordPassed())
+            ((KeywordExecutionResultImpl) result).setResult(payloads.keepResult(result.getResult()));
+        return result;
+    }
+
+    public void appendPayloadChunk(ObjectHandle handle, byte[] chunk) {
+        payloads.appendChunk(handle, chunk);
+    }
+
+    public byte[] readPayloadChunk(ObjectHandle handle, long offset, int length) {
+        return payloads.readChunk(handle, offset, length);
+    }
+
+    public long getPayloadSize(ObjectHandle handle) {
+        return payloads.getSize(handle);
+    }
+
+    public String getPayloadPath(ObjectHandle handle) {
+        return payloads.getPath(handle);
+    }
+
+    public KeywordExecutionResult runKeywordWithTimeout(String libraryName, String keywordName, Object[] keywordArguments,
+        long timeoutMillis) {
+        return getService(libraryName).runKeywordWithTimeout(keywordName, keywordArguments, timeoutMillis);
+    }
+
+    public KeywordExecutionResult runKeywordUntilSucceeds(String libraryName, String keywordName, Object[] keywordArguments,
+        long timeoutMillis, long retryIntervalMillis) {
+        return getService(libraryName).runKeywordUntilSucceeds(keywordName, keywordArguments, timeoutMillis, retryIntervalMillis);
+    }
+
+    public String startKeyword(String libraryName, String keywordName, Object[] keywordArguments) {
+        return getService(libraryName).startKeyword(keywordName, keywordArguments);
+    }
+
+    public KeywordExecutionResult waitForKeyword(String libraryName, String handle, long timeoutMillis) {
+        return getService(libraryName).waitForKeyword(handle, timeoutMillis);
+    }
+
+    public String[] readKeywordOutput(String libraryName, String handle) {
+        return getService(libraryName).readKeywordOutput(handle);
+    }
+
+    public void releaseKeyword(String libraryName, String handle) {
+        getService(libraryName).releaseKeyword(handle);
+    }
+
+    private RobotRmiService createService(String libraryName) {
         SimpleRobotRmiService rmiService = new SimpleRobotRmiService();
         rmiService.setLibrary(instantiateLibrary(libraryName));
-        RobotRmiService service = new CloseableRobotRmiService(rmiService);
-        
-        return rmiPublisher.publish(serviceName, RobotRmiService.class, service, rmiPort);
+        rmiService.setKeywordExecutor(executionPolicies.createExecutor(libraryName));
+        rmiService.setObjectHandleTable(objectHandles);
+        return new CloseableRobotRmiService(rmiService);
+    }
+
+    private RobotRmiService getService(String libraryName) {
+        Future<RobotRmiService> service = services.get(libraryName);
+        if (service == null)
+            throw new IllegalArgumentException("Library '" + libraryName + "' is not registered");
+        return getResult(service);
+    }
+
+    private Future<RobotRmiService> created(RobotRmiService service) {
+        FutureTask<RobotRmiService> creation = new FutureTask<RobotRmiService>(new Runnable() {
+            public void run() {
+            }
+        }, service);
+        creation.run();
+        return creation;
+    }
+
+    private RobotRmiService getResult(Future<RobotRmiService> service) {
+        try {
+            return service.get();
+        } catch (ExecutionException e) {
+            if (e.getCause() instanceof RuntimeException)
+                throw (RuntimeException) e.getCause();
+            throw new RuntimeException(e.getCause());
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            throw new RuntimeException(e);
+        }
     }
 
     public boolean ping() {
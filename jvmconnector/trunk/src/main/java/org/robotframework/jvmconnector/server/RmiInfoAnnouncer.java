@@ -0,0 +1,53 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.robotframework.jvmconnector.server;
+
+import static org.robotframework.javalib.util.Logger.log;
+
+import java.io.IOException;
+import java.io.OutputStreamWriter;
+import java.io.Writer;
+import java.net.InetAddress;
+import java.net.Socket;
+
+/**
+ * Sends the rmi info of a freshly exported service to the
+ * {@link org.robotframework.jvmconnector.client.RmiInfoListener} of the
+ * process that launched the application.
+ */
+public class RmiInfoAnnouncer {
+    private final int port;
+
+    public RmiInfoAnnouncer(int port) {
+        this.port = port;
+    }
+
+    public void announce(String rmiInfo) {
+        try {
+            Socket socket = new Socket(InetAddress.getByName("127.0.0.1"), port);
+            try {
+                Writer writer = new OutputStreamWriter(socket.getOutputStream(), "UTF-8");
+                writer.write(rmiInfo + "\n");
+                writer.flush();
+            } finally {
+                socket.close();
+            }
+        } catch (IOException e) {
+            log("could not announce rmi info to port " + port + ": " + e.getMessage());
+        }
+    }
+}
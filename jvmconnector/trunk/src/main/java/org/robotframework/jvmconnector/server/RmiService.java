@@ -20,14 +20,59 @@ package org.robotframework.jvmconnector.server;
 public class RmiService {
     private final Class<LibraryImporter> serviceInterface = LibraryImporter.class;
     private RmiServicePublisher rmiPublisher = new RmiServicePublisher();
+    private final ExecutionPolicies executionPolicies;
+    private final ObjectHandleTable objectHandles;
 
-    public void start(final String pathToRmiStorage) {
-        String rmiInfo = start(new FreePortFinder().findFreePort());
+    public RmiService() {
+        this(new ExecutionPolicies(), new ObjectHandleTable());
+    }
+
+    public RmiService(ExecutionPolicies executionPolicies, ObjectHandleTable objectHandles) {
+        this.executionPolicies = executionPolicies;
+        this.objectHandles = objectHandles;
+    }
+
+    public String start(final String pathToRmiStorage) {
+        return start(pathToRmiStorage, null);
+    }
+
+    public String start(final String pathToRmiStorage, String transport) {
+        int port = isRmi(transport) ? new FreePortFinder().findFreePort() : 0;
+        String rmiInfo = start(port, transport);
         new RmiInfoStorage(pathToRmiStorage).store(rmiInfo);
+        return rmiInfo;
     }
 
     public String start(int rmiPort) {
-        RemoteLibraryImporter libraryImporter = new RemoteLibraryImporter(rmiPort, rmiPublisher);
+        RemoteLibraryImporter libraryImporter = new RemoteLibraryImporter(rmiPort, rmiPublisher, executionPolicies, objectHandles);
         return rmiPublisher.publish("robotrmiservice", serviceInterface, libraryImporter, rmiPort);
     }
+
+    /**
+     * Starts the service using the given transport: <code>rmi</code>,
+     * <code>binary</code> or <code>local</code>, which is the binary
+     * transport accepting connections only from the same host. With the
+     * binary transports port 0 selects a free port.
+     *
+     * @return the url of the service
+     */
+    public String start(int port, String transport) {
+        if (isRmi(transport))
+            return start(port);
+        if (transport.equalsIgnoreCase(BinaryTransportServer.SCHEME))
+            return createBinaryTransportServer().start(port);
+        if (transport.equalsIgnoreCase("local"))
+            return createBinaryTransportServer().startOnLoopback(port);
+        throw new IllegalArgumentException("Unknown transport '" + transport + "'");
+    }
+
+    private boolean isRmi(String transport) {
+        return transport == null || transport.equalsIgnoreCase("rmi");
+    }
+
+    private BinaryTransportServer createBinaryTransportServer() {
+        int rmiPort = new FreePortFinder().findFreePort();
+        RemoteLibraryImporter libraryImporter = new RemoteLibraryImporter(rmiPort, rmiPublisher, executionPolicies, objectHandles);
+        return new BinaryTransportServer(libraryImporter);
+    }
 }
\ No newline at end of file
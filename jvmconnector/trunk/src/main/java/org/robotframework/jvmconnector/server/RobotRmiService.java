@@ -17,6 +17,7 @@
 package org.robotframework.jvmconnector.server;
 
 import org.robotframework.javalib.library.RobotJavaLibrary;
+import org.robotframework.jvmconnector.common.KeywordCall;
 import org.robotframework.jvmconnector.common.KeywordExecutionResult;
 
 
@@ -43,6 +44,66 @@ public interface RobotRmiService {
 	 * @see KeywordExecutionResult
 	 */
 	KeywordExecutionResult runKeyword(String keywordName, Object[] keywordArguments);
+
+	/**
+	 * Runs the given keywords in order.
+	 * 
+	 * @param stopOnFailure
+	 *            if true, keywords following the first failing keyword are
+	 *            not run
+	 * @return results of the keywords that were run, in the same order as
+	 *         the keyword calls
+	 */
+	KeywordExecutionResult[] runKeywords(KeywordCall[] keywordCalls, boolean stopOnFailure);
+
+	/**
+	 * Runs the keyword in another thread and interrupts it if it does not
+	 * finish within the timeout. A keyword that timed out gets a failed
+	 * result with {@link KeywordExecutionResult#keywordTimedOut()} set and
+	 * the stack trace of the thread running it as the stack trace.
+	 */
+	KeywordExecutionResult runKeywordWithTimeout(String keywordName, Object[] keywordArguments, long timeoutMillis);
+
+	/**
+	 * Runs the keyword until it passes or the timeout is exceeded, waiting
+	 * the retry interval between the attempts. Only the result of the last
+	 * attempt is returned, see {@link KeywordExecutionResult#getAttempts()}.
+	 */
+	KeywordExecutionResult runKeywordUntilSucceeds(String keywordName, Object[] keywordArguments, long timeoutMillis,
+	        long retryIntervalMillis);
+
+	/**
+	 * Starts running the keyword in the background.
+	 * 
+	 * @return handle for getting the result with
+	 *         {@link #waitForKeyword(String, long)}
+	 */
+	String startKeyword(String keywordName, Object[] keywordArguments);
+
+	/**
+	 * Waits for a keyword started with {@link #startKeyword(String, Object[])}
+	 * to finish.
+	 * 
+	 * @return result of the keyword, or <code>null</code> if the keyword did
+	 *         not finish within the timeout and can still be waited for
+	 */
+	KeywordExecutionResult waitForKeyword(String handle, long timeoutMillis);
+
+	/**
+	 * Reads output a keyword started with
+	 * {@link #startKeyword(String, Object[])} has written after the previous
+	 * read. Output that has been read is not included in the final result.
+	 * 
+	 * @return STDOUT and STDERR of the keyword
+	 */
+	String[] readKeywordOutput(String handle);
+
+	/**
+	 * Forgets a keyword started with {@link #startKeyword(String, Object[])}
+	 * so that it can no longer be waited for, interrupting it if it is still
+	 * running. Keywords that are never waited for must be released.
+	 */
+	void releaseKeyword(String handle);
 	
 	/**
 	 * Used to see if the connection is alive.
@@ -16,11 +16,26 @@
 
 package org.robotframework.jvmconnector.server;
 
+import java.util.ArrayList;
 import java.util.Arrays;
+import java.util.List;
+import java.util.concurrent.Callable;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.ConcurrentMap;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+import java.util.concurrent.ThreadFactory;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.TimeoutException;
+import java.util.concurrent.atomic.AtomicLong;
+import java.util.concurrent.atomic.AtomicReference;
 
 import org.robotframework.javalib.library.RobotJavaLibrary;
 import org.robotframework.javalib.util.Logger;
 import org.robotframework.javalib.util.StdStreamRedirecter;
+import org.robotframework.jvmconnector.common.KeywordCall;
 import org.robotframework.jvmconnector.common.KeywordExecutionResult;
 import org.robotframework.jvmconnector.common.TestFailedException;
 
@@ -31,9 +46,15 @@ import org.robotframework.jvmconnector.common.TestFailedException;
 public class SimpleRobotRmiService implements RobotRmiService {
     private RobotJavaLibrary library;
     private final StdStreamRedirecter streamRedirecter;
+    private KeywordExecutor keywordExecutor = new DirectKeywordExecutor();
+    private final ConcurrentMap<String, Future<KeywordExecutionResult>> startedKeywords = new ConcurrentHashMap<String, Future<KeywordExecutionResult>>();
+    private final ConcurrentMap<String, AtomicReference<Thread>> startedKeywordThreads = new ConcurrentHashMap<String, AtomicReference<Thread>>();
+    private final AtomicLong startedKeywordCount = new AtomicLong();
+    private ExecutorService backgroundExecutor;
+    private ObjectHandleTable objectHandles;
 
     public SimpleRobotRmiService() {
-        this(new StdStreamRedirecter());
+        this(new ThreadLocalStdStreamRedirecter());
     }
 
     public SimpleRobotRmiService(StdStreamRedirecter streamRedirecter) {
@@ -51,19 +72,207 @@ public class SimpleRobotRmiService implements RobotRmiService {
         this.library = library;
     }
 
+    /**
+     * Sets the executor that decides where and how concurrently the keywords
+     * are run. By default they run directly in the calling thread.
+     */
+    public void setKeywordExecutor(KeywordExecutor keywordExecutor) {
+        this.keywordExecutor = keywordExecutor;
+    }
+
+    /**
+     * Sets the table used for keeping return values on this side and for
+     * resolving handles given as arguments. By default return values are
+     * returned as they are.
+     */
+    public void setObjectHandleTable(ObjectHandleTable objectHandles) {
+        this.objectHandles = objectHandles;
+    }
+
     public KeywordExecutionResult runKeyword(String keywordName, Object[] keywordArguments) {
-        streamRedirecter.redirectStdStreams();
+        return runKeyword(keywordName, keywordArguments, new AtomicReference<Thread>(), Long.MAX_VALUE);
+    }
+
+    // A keyword still queued in the executor when its deadline passes is not run at all
+    private KeywordExecutionResult runKeyword(final String keywordName, final Object[] keywordArguments,
+        final AtomicReference<Thread> executingThread, final long deadline) {
+        return keywordExecutor.execute(new Callable<KeywordExecutionResult>() {
+            public KeywordExecutionResult call() {
+                if (System.currentTimeMillis() >= deadline)
+                    throw new KeywordTimeoutException("Keyword '" + keywordName + "' was not started before its timeout");
+                executingThread.set(Thread.currentThread());
+                streamRedirecter.redirectStdStreams();
+                try {
+                    return executeKeyword(keywordName, keywordArguments);
+                } finally {
+                    streamRedirecter.resetStdStreams();
+                }
+            }
+        });
+    }
+
+    public KeywordExecutionResult[] runKeywords(KeywordCall[] keywordCalls, boolean stopOnFailure) {
+        List<KeywordExecutionResult> results = new ArrayList<KeywordExecutionResult>();
+        for (KeywordCall keywordCall : keywordCalls) {
+            KeywordExecutionResult result = runKeyword(keywordCall.getKeywordName(), keywordCall.getKeywordArguments());
+            results.add(result);
+            if (stopOnFailure && !result.keywordPassed())
+                break;
+        }
+        return results.toArray(new KeywordExecutionResult[results.size()]);
+    }
+
+    public KeywordExecutionResult runKeywordWithTimeout(final String keywordName, final Object[] keywordArguments,
+        long timeoutMillis) {
+        final AtomicReference<Thread> executingThread = new AtomicReference<Thread>();
+        final long deadline = System.currentTimeMillis() + timeoutMillis;
+        Future<KeywordExecutionResult> keyword = getBackgroundExecutor().submit(new Callable<KeywordExecutionResult>() {
+            public KeywordExecutionResult call() {
+                return runKeyword(keywordName, keywordArguments, executingThread, deadline);
+            }
+        });
         try {
-            return executeKeyword(keywordName, keywordArguments);
-        } finally {
-            streamRedirecter.resetStdStreams();
+            return keyword.get(timeoutMillis, TimeUnit.MILLISECONDS);
+        } catch (TimeoutException e) {
+            return interrupt(keyword, executingThread.get(), keywordName, timeoutMillis);
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            throw new RuntimeException(e);
+        } catch (ExecutionException e) {
+            throw new RuntimeException(e.getCause());
+        }
+    }
+
+    // A keyword that finishes before it can be cancelled returns its real result,
+    // otherwise the timeout failure carries the output the keyword printed so far
+    private KeywordExecutionResult interrupt(Future<KeywordExecutionResult> keyword, Thread executingThread,
+        String keywordName, long timeoutMillis) {
+        String[] output = readOutput(executingThread);
+        KeywordTimeoutException timeout = new KeywordTimeoutException("Keyword '" + keywordName + "' did not finish in "
+            + timeoutMillis + " milliseconds");
+        if (executingThread != null)
+            timeout.setStackTrace(executingThread.getStackTrace());
+        if (!keyword.cancel(true))
+            return getFinishedResult(keyword);
+        if (executingThread != null)
+            executingThread.interrupt();
+        KeywordExecutionResultImpl result = new KeywordExecutionResultImpl();
+        result.setStdStreams(output[0], output[1]);
+        result.setTimedOut(new TestFailedException(timeout));
+        return result;
+    }
+
+    private KeywordExecutionResult getFinishedResult(Future<KeywordExecutionResult> keyword) {
+        try {
+            return keyword.get();
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            throw new RuntimeException(e);
+        } catch (ExecutionException e) {
+            throw new RuntimeException(e.getCause());
+        }
+    }
+
+    public KeywordExecutionResult runKeywordUntilSucceeds(String keywordName, Object[] keywordArguments, long timeoutMillis,
+        long retryIntervalMillis) {
+        long deadline = System.currentTimeMillis() + timeoutMillis;
+        for (int attempts = 1; ; attempts++) {
+            KeywordExecutionResultImpl result = (KeywordExecutionResultImpl) runKeyword(keywordName, keywordArguments);
+            result.setAttempts(attempts);
+            if (result.keywordPassed() || System.currentTimeMillis() >= deadline || !sleep(retryIntervalMillis))
+                return result;
+        }
+    }
+
+    private boolean sleep(long millis) {
+        try {
+            Thread.sleep(millis);
+            return true;
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            return false;
+        }
+    }
+
+    public String startKeyword(final String keywordName, final Object[] keywordArguments) {
+        String handle = "keyword-" + startedKeywordCount.incrementAndGet();
+        final AtomicReference<Thread> executingThread = new AtomicReference<Thread>();
+        startedKeywordThreads.put(handle, executingThread);
+        startedKeywords.put(handle, getBackgroundExecutor().submit(new Callable<KeywordExecutionResult>() {
+            public KeywordExecutionResult call() {
+                return runKeyword(keywordName, keywordArguments, executingThread, Long.MAX_VALUE);
+            }
+        }));
+        return handle;
+    }
+
+    public String[] readKeywordOutput(String handle) {
+        AtomicReference<Thread> executingThread = startedKeywordThreads.get(handle);
+        if (executingThread == null)
+            throw new IllegalArgumentException("No started keyword with handle '" + handle + "'");
+        return readOutput(executingThread.get());
+    }
+
+    private String[] readOutput(Thread executingThread) {
+        String[] output = null;
+        if (executingThread != null && streamRedirecter instanceof ThreadLocalStdStreamRedirecter)
+            output = ((ThreadLocalStdStreamRedirecter) streamRedirecter).readNewOutput(executingThread);
+        return output == null ? new String[] { "", "" } : output;
+    }
+
+    public KeywordExecutionResult waitForKeyword(String handle, long timeoutMillis) {
+        Future<KeywordExecutionResult> startedKeyword = startedKeywords.get(handle);
+        if (startedKeyword == null)
+            throw new IllegalArgumentException("No started keyword with handle '" + handle + "'");
+        try {
+            KeywordExecutionResult result = startedKeyword.get(timeoutMillis, TimeUnit.MILLISECONDS);
+            forgetStartedKeyword(handle);
+            return result;
+        } catch (TimeoutException e) {
+            return null;
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            throw new RuntimeException(e);
+        } catch (ExecutionException e) {
+            forgetStartedKeyword(handle);
+            throw new RuntimeException(e.getCause());
+        }
+    }
+
+    public void releaseKeyword(String handle) {
+        Future<KeywordExecutionResult> startedKeyword = startedKeywords.remove(handle);
+        AtomicReference<Thread> executingThread = startedKeywordThreads.remove(handle);
+        if (startedKeyword != null && startedKeyword.cancel(true) && executingThread.get() != null)
+            executingThread.get().interrupt();
+    }
+
+    private void forgetStartedKeyword(String handle) {
+        startedKeywords.remove(handle);
+        startedKeywordThreads.remove(handle);
+    }
+
+    private synchronized ExecutorService getBackgroundExecutor() {
+        if (backgroundExecutor == null) {
+            backgroundExecutor = Executors.newCachedThreadPool(new ThreadFactory() {
+                public Thread newThread(Runnable runnable) {
+                    Thread thread = new Thread(runnable, "started keyword");
+                    thread.setDaemon(true);
+                    return thread;
+                }
+            });
         }
+        return backgroundExecutor;
     }
 
     private KeywordExecutionResult executeKeyword(String keywordName, Object[] keywordArguments) {
         KeywordExecutionResultImpl keywordExecutionResult = new KeywordExecutionResultImpl();
         try {
-            keywordExecutionResult.setResult(library.runKeyword(keywordName, keywordArguments));
+            if (objectHandles == null) {
+                keywordExecutionResult.setResult(library.runKeyword(keywordName, keywordArguments));
+            } else {
+                Object result = library.runKeyword(keywordName, objectHandles.resolveArguments(keywordArguments));
+                keywordExecutionResult.setResult(objectHandles.toReturnValue(result));
+            }
         } catch (Throwable e) {
             keywordExecutionResult.setTestFailedException(new TestFailedException(e));
         }
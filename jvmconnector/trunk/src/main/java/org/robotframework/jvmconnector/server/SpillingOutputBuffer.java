@@ -0,0 +1,178 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.robotframework.jvmconnector.server;
+
+import java.io.ByteArrayOutputStream;
+import java.io.File;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.io.RandomAccessFile;
+import java.io.UnsupportedEncodingException;
+
+/**
+ * Output buffer that keeps at most the given number of bytes in memory and
+ * spills the rest to a temporary file. Written output, which must be UTF-8,
+ * can be read while writing continues. Reads never return more than the
+ * limit at a time, so the buffered output is never loaded into memory at
+ * once.
+ */
+public class SpillingOutputBuffer extends OutputStream {
+    public static final int DEFAULT_LIMIT = 1024 * 1024;
+    private static final String ENCODING = "utf-8";
+
+    private final int limit;
+    private final ByteArrayOutputStream memory = new ByteArrayOutputStream();
+    private File spillFile;
+    private OutputStream spill;
+    private long spilledLength;
+    private long readPosition;
+
+    public SpillingOutputBuffer() {
+        this(DEFAULT_LIMIT);
+    }
+
+    /**
+     * @param limit maximum number of bytes kept in memory and returned by
+     *            one read
+     */
+    public SpillingOutputBuffer(int limit) {
+        this.limit = limit;
+    }
+
+    public synchronized void write(int b) throws IOException {
+        write(new byte[] { (byte) b }, 0, 1);
+    }
+
+    public synchronized void write(byte[] bytes, int offset, int length) throws IOException {
+        if (spill == null && memory.size() + length > limit)
+            startSpilling();
+        if (spill == null) {
+            memory.write(bytes, offset, length);
+        } else {
+            spill.write(bytes, offset, length);
+            spilledLength += length;
+        }
+    }
+
+    /**
+     * Returns output written after the previous read, at most the limit.
+     * Output that does not fit is returned by the following reads.
+     */
+    public synchronized String readNew() {
+        try {
+            if (spill == null)
+                return readMemory();
+            String output = decode(readSpilled());
+            if (readPosition == spilledLength)
+                stopSpilling();
+            return output;
+        } catch (IOException e) {
+            throw new RuntimeException(e);
+        }
+    }
+
+    /**
+     * Returns output written after the previous read, at most the limit, and
+     * discards the rest. Discarded output is replaced with a note telling how
+     * many bytes were left out.
+     */
+    public synchronized String readRest() {
+        String output = readNew();
+        if (spill == null)
+            return output;
+        long truncated = spilledLength - readPosition;
+        close();
+        return output + "\n[" + truncated + " bytes of output truncated]\n";
+    }
+
+    /**
+     * Deletes the temporary file, if any.
+     */
+    public synchronized void close() {
+        try {
+            stopSpilling();
+        } catch (IOException e) {
+            throw new RuntimeException(e);
+        }
+    }
+
+    private String readMemory() throws IOException {
+        String output = memory.toString(ENCODING);
+        memory.reset();
+        return output;
+    }
+
+    private void startSpilling() throws IOException {
+        spillFile = File.createTempFile("output", null);
+        spillFile.deleteOnExit();
+        spill = new FileOutputStream(spillFile);
+        memory.writeTo(spill);
+        spilledLength = memory.size();
+        readPosition = 0;
+        memory.reset();
+    }
+
+    private byte[] readSpilled() throws IOException {
+        spill.flush();
+        int length = (int) Math.min(spilledLength - readPosition, limit);
+        byte[] bytes = new byte[length];
+        RandomAccessFile input = new RandomAccessFile(spillFile, "r");
+        try {
+            input.seek(readPosition);
+            input.readFully(bytes);
+        } finally {
+            input.close();
+        }
+        int complete = readPosition + length < spilledLength ? completeCharacters(bytes) : length;
+        if (complete == 0)
+            complete = length;
+        readPosition += complete;
+        return complete == length ? bytes : copyOf(bytes, complete);
+    }
+
+    // Leaves a character split by the read limit to the next read
+    private int completeCharacters(byte[] bytes) {
+        for (int i = bytes.length - 1; i >= 0 && i >= bytes.length - 4; i--) {
+            int b = bytes[i] & 0xff;
+            if ((b & 0xc0) == 0x80)
+                continue;
+            int characterLength = b >= 0xf0 ? 4 : b >= 0xe0 ? 3 : b >= 0xc0 ? 2 : 1;
+            return i + characterLength > bytes.length ? i : bytes.length;
+        }
+        return bytes.length;
+    }
+
+    private byte[] copyOf(byte[] bytes, int length) {
+        byte[] copy = new byte[length];
+        System.arraycopy(bytes, 0, copy, 0, length);
+        return copy;
+    }
+
+    private String decode(byte[] bytes) throws UnsupportedEncodingException {
+        return new String(bytes, ENCODING);
+    }
+
+    private void stopSpilling() throws IOException {
+        if (spill == null)
+            return;
+        spill.close();
+        spillFile.delete();
+        spill = null;
+        spillFile = null;
+    }
+}
@@ -0,0 +1,173 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.robotframework.jvmconnector.server;
+
+import java.io.PrintStream;
+
+/**
+ * PrintStream that writes to the stream of the current thread. Threads that
+ * have not set their own stream write to the default stream.
+ * <p>
+ * Threads started by a thread that has set its stream write to the same
+ * stream until the starting thread sets its stream to <code>null</code>,
+ * after which they write to the default stream.
+ */
+public class ThreadDispatchingPrintStream extends PrintStream {
+    private volatile PrintStream defaultStream;
+    private final ThreadLocal<Target> threadTargets = new InheritableThreadLocal<Target>();
+
+    public ThreadDispatchingPrintStream(PrintStream defaultStream) {
+        super(defaultStream);
+        this.defaultStream = defaultStream;
+    }
+
+    /**
+     * Sets the stream where the current thread, and threads it starts, write.
+     * <code>null</code> returns them to the default stream.
+     */
+    public void setThreadStream(PrintStream stream) {
+        Target previous = threadTargets.get();
+        if (previous != null && previous.owner == Thread.currentThread())
+            previous.stream = null;
+        if (stream == null)
+            threadTargets.remove();
+        else
+            threadTargets.set(new Target(stream));
+    }
+
+    public PrintStream getDefaultStream() {
+        return defaultStream;
+    }
+
+    /**
+     * Changes the stream where threads without their own stream write.
+     */
+    public void setDefaultStream(PrintStream defaultStream) {
+        this.defaultStream = defaultStream;
+    }
+
+    private PrintStream current() {
+        Target target = threadTargets.get();
+        PrintStream stream = target == null ? null : target.stream;
+        return stream == null ? defaultStream : stream;
+    }
+
+    private static class Target {
+        final Thread owner = Thread.currentThread();
+        volatile PrintStream stream;
+
+        Target(PrintStream stream) {
+            this.stream = stream;
+        }
+    }
+
+    public void write(int b) {
+        current().write(b);
+    }
+
+    public void write(byte[] buf, int off, int len) {
+        current().write(buf, off, len);
+    }
+
+    public void flush() {
+        current().flush();
+    }
+
+    public void close() {
+        current().close();
+    }
+
+    public boolean checkError() {
+        return current().checkError();
+    }
+
+    public void print(boolean b) {
+        current().print(b);
+    }
+
+    public void print(char c) {
+        current().print(c);
+    }
+
+    public void print(int i) {
+        current().print(i);
+    }
+
+    public void print(long l) {
+        current().print(l);
+    }
+
+    public void print(float f) {
+        current().print(f);
+    }
+
+    public void print(double d) {
+        current().print(d);
+    }
+
+    public void print(char[] s) {
+        current().print(s);
+    }
+
+    public void print(String s) {
+        current().print(s);
+    }
+
+    public void print(Object obj) {
+        current().print(obj);
+    }
+
+    public void println() {
+        current().println();
+    }
+
+    public void println(boolean x) {
+        current().println(x);
+    }
+
+    public void println(char x) {
+        current().println(x);
+    }
+
+    public void println(int x) {
+        current().println(x);
+    }
+
+    public void println(long x) {
+        current().println(x);
+    }
+
+    public void println(float x) {
+        current().println(x);
+    }
+
+    public void println(double x) {
+        current().println(x);
+    }
+
+    public void println(char[] x) {
+        current().println(x);
+    }
+
+    public void println(String x) {
+        current().println(x);
+    }
+
+    public void println(Object x) {
+        current().println(x);
+    }
+}
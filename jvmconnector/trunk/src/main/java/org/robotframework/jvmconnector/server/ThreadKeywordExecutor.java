@@ -0,0 +1,70 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.robotframework.jvmconnector.server;
+
+import java.util.concurrent.Callable;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+import java.util.concurrent.ThreadFactory;
+
+import org.robotframework.jvmconnector.common.KeywordExecutionResult;
+
+/**
+ * Runs all keywords in one named daemon thread, for example to keep keywords
+ * that are not thread safe on the same thread. Keywords called from that
+ * thread itself are run directly.
+ */
+public class ThreadKeywordExecutor implements KeywordExecutor {
+    private final DirectKeywordExecutor directExecutor = new DirectKeywordExecutor();
+    private final ExecutorService executor;
+    private volatile Thread thread;
+
+    public ThreadKeywordExecutor(final String threadName) {
+        executor = Executors.newSingleThreadExecutor(new ThreadFactory() {
+            public Thread newThread(Runnable runnable) {
+                thread = new Thread(runnable, threadName);
+                thread.setDaemon(true);
+                return thread;
+            }
+        });
+    }
+
+    public KeywordExecutionResult execute(Callable<KeywordExecutionResult> keywordCall) {
+        if (Thread.currentThread() == thread)
+            return directExecutor.execute(keywordCall);
+        Future<KeywordExecutionResult> keyword = executor.submit(keywordCall);
+        try {
+            return keyword.get();
+        } catch (ExecutionException e) {
+            throw rethrow(e.getCause());
+        } catch (InterruptedException e) {
+            keyword.cancel(true);
+            Thread.currentThread().interrupt();
+            throw new RuntimeException(e);
+        }
+    }
+
+    private RuntimeException rethrow(Throwable cause) {
+        if (cause instanceof Error)
+            throw (Error) cause;
+        if (cause instanceof RuntimeException)
+            return (RuntimeException) cause;
+        return new RuntimeException(cause);
+    }
+}
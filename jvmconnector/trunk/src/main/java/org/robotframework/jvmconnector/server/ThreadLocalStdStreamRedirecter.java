@@ -0,0 +1,136 @@
+/*
+ * Copyright 2008 Nokia Siemens Networks Oyj
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.robotframework.jvmconnector.server;
+
+import java.io.PrintStream;
+import java.io.UnsupportedEncodingException;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.ConcurrentMap;
+
+import org.robotframework.javalib.util.StdStreamRedirecter;
+
+/**
+ * Captures STDOUT and STDERR of the current thread and the threads it starts
+ * while capturing. Dispatching streams are installed as
+ * <code>System.out</code> and <code>System.err</code>, after which keywords
+ * running in different threads get their own output and can be executed
+ * concurrently. Output of other threads, for example an event dispatch
+ * thread started before the keyword, goes to the original streams, as does
+ * output of started threads after the capture has been reset.
+ * <p>
+ * There is only one pair of dispatching streams in the JVM. If something
+ * else replaces <code>System.out</code> or <code>System.err</code>, the new
+ * stream becomes the default stream of the dispatcher and the dispatcher is
+ * installed again, so that captures in progress are not lost.
+ * <p>
+ * Captured output is kept in {@link SpillingOutputBuffer}s, so very chatty
+ * keywords do not fill the memory, and it can be read from other threads with
+ * {@link #readNewOutput(Thread)} while the keyword is still running. Output
+ * that has not been read when the keyword finishes is truncated to the limit
+ * of the buffer.
+ */
+public class ThreadLocalStdStreamRedirecter extends StdStreamRedirecter {
+    private static final String LOG_ENCODING = "utf-8";
+    private static ThreadDispatchingPrintStream dispatchingOut;
+    private static ThreadDispatchingPrintStream dispatchingErr;
+
+    private final ConcurrentMap<Thread, Capture> captures = new ConcurrentHashMap<Thread, Capture>();
+
+    public String getStdErrAsString() {
+        Capture capture = captures.get(Thread.currentThread());
+        return capture == null ? "" : capture.err.readRest();
+    }
+
+    public String getStdOutAsString() {
+        Capture capture = captures.get(Thread.currentThread());
+        return capture == null ? "" : capture.out.readRest();
+    }
+
+    /**
+     * Returns STDOUT and STDERR the given thread has written after the
+     * previous read, or <code>null</code> if its output is not captured.
+     */
+    public String[] readNewOutput(Thread thread) {
+        Capture capture = captures.get(thread);
+        if (capture == null)
+            return null;
+        return new String[] { capture.out.readNew(), capture.err.readNew() };
+    }
+
+    public void redirectStdStreams() {
+        installDispatchingStreams();
+        Capture capture = new Capture();
+        Capture previous = captures.put(Thread.currentThread(), capture);
+        if (previous != null)
+            previous.close();
+        getDispatchingOut().setThreadStream(capture.outStream);
+        getDispatchingErr().setThreadStream(capture.errStream);
+    }
+
+    public void resetStdStreams() {
+        if (getDispatchingOut() != null) {
+            getDispatchingOut().setThreadStream(null);
+            getDispatchingErr().setThreadStream(null);
+        }
+        Capture capture = captures.remove(Thread.currentThread());
+        if (capture != null)
+            capture.close();
+    }
+
+    private static synchronized void installDispatchingStreams() {
+        if (dispatchingOut == null) {
+            dispatchingOut = new ThreadDispatchingPrintStream(System.out);
+            dispatchingErr = new ThreadDispatchingPrintStream(System.err);
+        }
+        if (System.out != dispatchingOut) {
+            dispatchingOut.setDefaultStream(System.out);
+            System.setOut(dispatchingOut);
+        }
+        if (System.err != dispatchingErr) {
+            dispatchingErr.setDefaultStream(System.err);
+            System.setErr(dispatchingErr);
+        }
+    }
+
+    private static synchronized ThreadDispatchingPrintStream getDispatchingOut() {
+        return dispatchingOut;
+    }
+
+    private static synchronized ThreadDispatchingPrintStream getDispatchingErr() {
+        return dispatchingErr;
+    }
+
+    private static class Capture {
+        final SpillingOutputBuffer out = new SpillingOutputBuffer();
+        final SpillingOutputBuffer err = new SpillingOutputBuffer();
+        final PrintStream outStream = createPrintStream(out);
+        final PrintStream errStream = createPrintStream(err);
+
+        void close() {
+            out.close();
+            err.close();
+        }
+
+        private PrintStream createPrintStream(SpillingOutputBuffer buffer) {
+            try {
+                return new PrintStream(buffer, true, LOG_ENCODING);
+            } catch (UnsupportedEncodingException e) {
+                throw new RuntimeException(e);
+            }
+        }
+    }
+}
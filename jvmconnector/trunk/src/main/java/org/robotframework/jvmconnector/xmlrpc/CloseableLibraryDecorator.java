@@ -17,7 +17,10 @@
 package org.robotframework.jvmconnector.xmlrpc;
 
 import java.util.ArrayList;
+import java.util.Collections;
+import java.util.HashMap;
 import java.util.List;
+import java.util.Map;
 
 import org.apache.commons.collections.CollectionUtils;
 import org.laughingpanda.jretrofit.AllMethodsNotImplementedException;
@@ -26,21 +29,31 @@ import org.robotframework.javalib.library.KeywordDocumentationRepository;
 import org.robotframework.javalib.library.RobotJavaLibrary;
 
 /**
- * A library decorator to enable the remote JVM shutdown. 
+ * A library decorator to enable the remote JVM shutdown. Keyword names,
+ * arguments and documentation are read from the library once, when the
+ * decorator is created.
  */
 public class CloseableLibraryDecorator implements RobotLibrary {
     public static final String KEYWORD_CLOSE_APPLICATION = "closeapplication";
     private final RobotJavaLibrary library;
+    private final KeywordDocumentationRepository keywordInfo;
+    private final String[] keywordNames;
+    private final Map<String, String[]> keywordArguments = new HashMap<String, String[]>();
+    private final Map<String, String> keywordDocumentations = new HashMap<String, String>();
+    private final Object[] librarySpec;
 
     public CloseableLibraryDecorator(RobotJavaLibrary library) {
         this.library = library;
+        this.keywordInfo = keywordInfo();
+        this.keywordNames = createKeywordNames();
+        this.librarySpec = createLibrarySpec();
     }
 
+    /**
+     * The returned array is shared and must not be modified.
+     */
     public String[] getKeywordNames() {
-        List<String> newKeywordNames = new ArrayList<String>();
-        CollectionUtils.addAll(newKeywordNames, library.getKeywordNames());
-        newKeywordNames.add(KEYWORD_CLOSE_APPLICATION);
-        return newKeywordNames.toArray(new String[0]);
+        return keywordNames;
     }
 
     public Object runKeyword(String keywordName, Object[] args) {
@@ -52,11 +65,24 @@ public class CloseableLibraryDecorator implements RobotLibrary {
     }
 
     public String[] getKeywordArguments(String keywordName) {
-        return keywordInfo().getKeywordArguments(keywordName);
+        if (keywordArguments.containsKey(keywordName))
+            return keywordArguments.get(keywordName);
+        return keywordInfo.getKeywordArguments(keywordName);
     }
     
     public String getKeywordDocumentation(String keywordName) {
-        return keywordInfo().getKeywordDocumentation(keywordName);
+        if (keywordDocumentations.containsKey(keywordName))
+            return keywordDocumentations.get(keywordName);
+        return keywordInfo.getKeywordDocumentation(keywordName);
+    }
+
+    /**
+     * Returns names, arguments and documentation of all the keywords, so that
+     * they can be fetched with one call. Each keyword is a map with keys
+     * <code>name</code>, <code>args</code> and <code>doc</code>.
+     */
+    public Object[] getLibrarySpec() {
+        return librarySpec;
     }
     
     // JVM shutdown needs to be done later because xml-rpc requires a return value
@@ -68,6 +94,34 @@ public class CloseableLibraryDecorator implements RobotLibrary {
         }.start();
     }
 
+    private String[] createKeywordNames() {
+        List<String> newKeywordNames = new ArrayList<String>();
+        CollectionUtils.addAll(newKeywordNames, library.getKeywordNames());
+        for (String keywordName : newKeywordNames) {
+            keywordArguments.put(keywordName, keywordInfo.getKeywordArguments(keywordName));
+            keywordDocumentations.put(keywordName, keywordInfo.getKeywordDocumentation(keywordName));
+        }
+        newKeywordNames.add(KEYWORD_CLOSE_APPLICATION);
+        return newKeywordNames.toArray(new String[0]);
+    }
+
+    private Object[] createLibrarySpec() {
+        List<Map<String, Object>> spec = new ArrayList<Map<String, Object>>();
+        for (String keywordName : keywordNames) {
+            Map<String, Object> keyword = new HashMap<String, Object>();
+            keyword.put("name", keywordName);
+            keyword.put("args", nullToEmpty(keywordArguments.get(keywordName)));
+            String documentation = keywordDocumentations.get(keywordName);
+            keyword.put("doc", documentation == null ? "" : documentation);
+            spec.add(Collections.unmodifiableMap(keyword));
+        }
+        return spec.toArray();
+    }
+
+    private String[] nullToEmpty(String[] arguments) {
+        return arguments == null ? new String[0] : arguments;
+    }
+
     // If Library doesn't contain keyword metadata, just return null object 
     private KeywordDocumentationRepository keywordInfo() {
         try {
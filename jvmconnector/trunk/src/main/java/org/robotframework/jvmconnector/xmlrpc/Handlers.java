@@ -1,13 +1,18 @@
 package org.robotframework.jvmconnector.xmlrpc;
 
+import java.util.ArrayList;
 import java.util.HashMap;
+import java.util.List;
 import java.util.Map;
 
 import org.apache.xmlrpc.XmlRpcException;
 import org.apache.xmlrpc.XmlRpcHandler;
 import org.apache.xmlrpc.XmlRpcRequest;
+import org.apache.xmlrpc.XmlRpcRequestConfig;
 import org.robotframework.javalib.library.RobotJavaLibrary;
 import org.robotframework.javalib.util.StdStreamRedirecter;
+import org.robotframework.jvmconnector.server.ObjectHandleTable;
+import org.robotframework.jvmconnector.server.ThreadLocalStdStreamRedirecter;
 
 class GetKeywordNameHandler implements XmlRpcHandler {
     private final RobotJavaLibrary library;
@@ -23,15 +28,17 @@ class GetKeywordNameHandler implements XmlRpcHandler {
 
 class RunKeywordHandler implements XmlRpcHandler {
     private final RobotJavaLibrary library;
-    private StdStreamRedirecter outStreamRedirecter;
+    private final ObjectHandleTable objectHandles;
+    private final ReturnValueMarshaller marshaller = new ReturnValueMarshaller();
 
-    public RunKeywordHandler(RobotJavaLibrary library) {
+    public RunKeywordHandler(RobotJavaLibrary library, ObjectHandleTable objectHandles) {
         this.library = library;
+        this.objectHandles = objectHandles;
     }
 
     public Object execute(XmlRpcRequest req) throws XmlRpcException {
-        redirectOutputStreams();
-        Map<String, String> rslt = null;
+        StdStreamRedirecter outStreamRedirecter = redirectOutputStreams();
+        Map<String, Object> rslt = null;
         try {
             rslt = runKeyword(req);
         } catch (final Throwable t) {
@@ -43,25 +50,26 @@ class RunKeywordHandler implements XmlRpcHandler {
         return rslt;
     }
 
-    private void redirectOutputStreams() {
-        outStreamRedirecter = new StdStreamRedirecter();
+    private StdStreamRedirecter redirectOutputStreams() {
+        StdStreamRedirecter outStreamRedirecter = new ThreadLocalStdStreamRedirecter();
         outStreamRedirecter.redirectStdStreams();
+        return outStreamRedirecter;
     }
 
     @SuppressWarnings("serial")
-    private Map<String, String> runKeyword(XmlRpcRequest req) {
+    private Map<String, Object> runKeyword(XmlRpcRequest req) {
         String keywordName = (String)req.getParameter(0);            
-        Object[] args = (Object[])req.getParameter(1);
-        final Object rslt = library.runKeyword(keywordName, args);
-        return new HashMap<String, String>() {{
+        Object[] args = objectHandles.resolveHandleIds((Object[])req.getParameter(1));
+        final Object rslt = objectHandles.toReturnValue(library.runKeyword(keywordName, args));
+        return new HashMap<String, Object>() {{
             put("status", "PASS");
-            put("return", ""+rslt);
+            put("return", marshaller.marshal(rslt));
         }};
     }
     
     @SuppressWarnings("serial")
-    private Map<String, String> failKeywordRunning(final StdStreamRedirecter outStreamRedirecter, final Throwable t) {
-        return new HashMap<String, String>() {{
+    private Map<String, Object> failKeywordRunning(final StdStreamRedirecter outStreamRedirecter, final Throwable t) {
+        return new HashMap<String, Object>() {{
             put("status", "FAIL");
             put("error", t.getMessage());
             put("traceback", extractStackTrace(t));
@@ -109,4 +117,89 @@ class GetKeywordDocumentationHandler implements XmlRpcHandler {
         String keywordName = (String)req.getParameter(0);
         return library.getKeywordDocumentation(keywordName);
     }
+}
+
+class GetLibrarySpecHandler implements XmlRpcHandler {
+    private final CloseableLibraryDecorator library;
+
+    public GetLibrarySpecHandler(CloseableLibraryDecorator library) {
+        this.library = library;
+    }
+
+    public Object execute(XmlRpcRequest req) throws XmlRpcException {
+        return library.getLibrarySpec();
+    }
+}
+
+/**
+ * Implements <code>system.multicall</code> so that several calls, for example
+ * keyword runs, can be sent in one request. Each call is a struct with
+ * <code>methodName</code> and <code>params</code>; the result of a successful
+ * call is wrapped in an array and a failed call is returned as a fault struct.
+ */
+class MulticallHandler implements XmlRpcHandler {
+    private final Map<String, XmlRpcHandler> handlers;
+
+    public MulticallHandler(Map<String, XmlRpcHandler> handlers) {
+        this.handlers = handlers;
+    }
+
+    public Object execute(XmlRpcRequest req) throws XmlRpcException {
+        Object[] calls = (Object[]) req.getParameter(0);
+        List<Object> results = new ArrayList<Object>();
+        for (Object call : calls)
+            results.add(execute(req.getConfig(), (Map<?, ?>) call));
+        return results.toArray();
+    }
+
+    private Object execute(XmlRpcRequestConfig config, Map<?, ?> call) {
+        String methodName = (String) call.get("methodName");
+        XmlRpcHandler handler = handlers.get(methodName);
+        if (handler == null || handler == this)
+            return fault(0, "Method '" + methodName + "' cannot be called with system.multicall");
+        try {
+            Object[] params = (Object[]) call.get("params");
+            return new Object[] { handler.execute(new Call(config, methodName, params)) };
+        } catch (XmlRpcException e) {
+            return fault(e.code, e.getMessage());
+        } catch (Throwable t) {
+            return fault(0, t.toString());
+        }
+    }
+
+    @SuppressWarnings("serial")
+    private Map<String, Object> fault(final int code, final String message) {
+        return new HashMap<String, Object>() {{
+            put("faultCode", code);
+            put("faultString", message == null ? "" : message);
+        }};
+    }
+
+    private static class Call implements XmlRpcRequest {
+        private final XmlRpcRequestConfig config;
+        private final String methodName;
+        private final Object[] params;
+
+        public Call(XmlRpcRequestConfig config, String methodName, Object[] params) {
+            this.config = config;
+            this.methodName = methodName;
+            this.params = params == null ? new Object[0] : params;
+        }
+
+        public XmlRpcRequestConfig getConfig() {
+            return config;
+        }
+
+        public String getMethodName() {
+            return methodName;
+        }
+
+        public int getParameterCount() {
+            return params.length;
+        }
+
+        public Object getParameter(int index) {
+            return params[index];
+        }
+    }
 }
\ No newline at end of file
@@ -0,0 +1,112 @@
+package org.robotframework.jvmconnector.xmlrpc;
+
+import java.lang.reflect.Array;
+import java.util.ArrayList;
+import java.util.Date;
+import java.util.HashMap;
+import java.util.IdentityHashMap;
+import java.util.List;
+import java.util.Map;
+
+/**
+ * Converts keyword return values to types XML-RPC supports natively, so that
+ * clients get lists, structs, numbers and binary data instead of strings.
+ * <p>
+ * Arrays and collections become arrays, maps become structs with string keys,
+ * <code>byte[]</code> is sent as base64 and <code>null</code> as an empty
+ * string. Integral numbers that do not fit into an XML-RPC int and all other
+ * objects are converted to strings. A value that refers to itself is replaced
+ * with a string at the point of recursion, and if the value has more than
+ * the maximum number of elements, it is returned as a string.
+ */
+public class ReturnValueMarshaller {
+    public static final int DEFAULT_MAX_ELEMENTS = 100000;
+
+    private final int maxElements;
+
+    public ReturnValueMarshaller() {
+        this(DEFAULT_MAX_ELEMENTS);
+    }
+
+    public ReturnValueMarshaller(int maxElements) {
+        this.maxElements = maxElements;
+    }
+
+    public Object marshal(Object value) {
+        try {
+            return new Marshalling().marshal(value);
+        } catch (TooManyElementsException e) {
+            return String.valueOf(value);
+        }
+    }
+
+    private class Marshalling {
+        private final Map<Object, Object> inProgress = new IdentityHashMap<Object, Object>();
+        private int elements = 0;
+
+        Object marshal(Object value) {
+            if (++elements > maxElements)
+                throw new TooManyElementsException();
+            if (value == null)
+                return "";
+            if (value instanceof String || value instanceof Boolean || value instanceof Integer
+                || value instanceof Double || value instanceof Date || value instanceof byte[])
+                return value;
+            if (value instanceof Byte || value instanceof Short)
+                return ((Number) value).intValue();
+            if (value instanceof Float)
+                return ((Float) value).doubleValue();
+            if (value instanceof Long)
+                return marshalLong((Long) value);
+            if (value.getClass().isArray() || value instanceof Iterable || value instanceof Map)
+                return marshalContainer(value);
+            return value.toString();
+        }
+
+        private Object marshalLong(Long value) {
+            if (value >= Integer.MIN_VALUE && value <= Integer.MAX_VALUE)
+                return value.intValue();
+            return value.toString();
+        }
+
+        private Object marshalContainer(Object value) {
+            if (inProgress.containsKey(value))
+                return "<recursive " + value.getClass().getName() + ">";
+            inProgress.put(value, value);
+            try {
+                if (value instanceof Map)
+                    return marshalMap((Map<?, ?>) value);
+                if (value instanceof Iterable)
+                    return marshalIterable((Iterable<?>) value);
+                return marshalArray(value);
+            } finally {
+                inProgress.remove(value);
+            }
+        }
+
+        private Object marshalMap(Map<?, ?> value) {
+            Map<String, Object> struct = new HashMap<String, Object>();
+            for (Map.Entry<?, ?> entry : value.entrySet())
+                struct.put(String.valueOf(entry.getKey()), marshal(entry.getValue()));
+            return struct;
+        }
+
+        private Object marshalIterable(Iterable<?> value) {
+            List<Object> items = new ArrayList<Object>();
+            for (Object item : value)
+                items.add(marshal(item));
+            return items.toArray();
+        }
+
+        private Object marshalArray(Object value) {
+            Object[] items = new Object[Array.getLength(value)];
+            for (int i = 0; i < items.length; i++)
+                items[i] = marshal(Array.get(value, i));
+            return items;
+        }
+    }
+
+    @SuppressWarnings("serial")
+    private static class TooManyElementsException extends RuntimeException {
+    }
+}
@@ -8,37 +8,90 @@ import org.apache.xmlrpc.XmlRpcHandler;
 import org.apache.xmlrpc.server.XmlRpcHandlerMapping;
 import org.apache.xmlrpc.server.XmlRpcNoSuchHandlerException;
 import org.apache.xmlrpc.server.XmlRpcServer;
+import org.apache.xmlrpc.server.XmlRpcServerConfigImpl;
 import org.apache.xmlrpc.webserver.WebServer;
 import org.robotframework.javalib.library.RobotJavaLibrary;
+import org.robotframework.jvmconnector.server.ObjectHandleTable;
 
 public class RobotXmlRpcServer {
-    private final RobotLibrary library;
+    private final CloseableLibraryDecorator library;
     private final WebServer webServer;
+    private final ObjectHandleTable objectHandles;
+    private boolean keepAlive = true;
+    private boolean gzipResponses = false;
+    private int maxThreads = 0;
     
     public RobotXmlRpcServer(RobotJavaLibrary library) {
         this(library, 8270);    
     }
     
     public RobotXmlRpcServer(RobotJavaLibrary library, int port) {
+        this(library, port, new ObjectHandleTable("none"));
+    }
+
+    /**
+     * @param objectHandles table for keeping return values on the server,
+     *            in which case the ids of the handles are returned. Arguments
+     *            that are ids of kept objects are replaced with the objects.
+     */
+    public RobotXmlRpcServer(RobotJavaLibrary library, int port, ObjectHandleTable objectHandles) {
         this.library = new CloseableLibraryDecorator(library);
         this.webServer = new WebServer(port);
+        this.objectHandles = objectHandles;
     }
     
+    /**
+     * Whether HTTP connections are kept open between requests. Enabled by
+     * default.
+     */
+    public void setKeepAlive(boolean keepAlive) {
+        this.keepAlive = keepAlive;
+    }
+
+    /**
+     * Whether responses are compressed with gzip for clients that accept it.
+     * Requires enabling the Apache XML-RPC extensions, which also changes how
+     * <code>null</code> values are sent, so it is disabled by default.
+     */
+    public void setGzipResponses(boolean gzipResponses) {
+        this.gzipResponses = gzipResponses;
+    }
+
+    /**
+     * Maximum number of requests handled concurrently. By default the limit
+     * of the Apache XML-RPC web server is used.
+     */
+    public void setMaxThreads(int maxThreads) {
+        this.maxThreads = maxThreads;
+    }
+
     public void startServer() throws Exception {
         XmlRpcServer xmlRpcServer = webServer.getXmlRpcServer();
+        xmlRpcServer.setConfig(createConfig());
+        if (maxThreads > 0)
+            xmlRpcServer.setMaxThreads(maxThreads);
         setHandlers(xmlRpcServer);
         webServer.start();
         System.out.println("XMLRPC Server up and running...");
     }
 
+    private XmlRpcServerConfigImpl createConfig() {
+        XmlRpcServerConfigImpl config = new XmlRpcServerConfigImpl();
+        config.setKeepAliveEnabled(keepAlive);
+        config.setEnabledForExtensions(gzipResponses);
+        return config;
+    }
+
     private void setHandlers(XmlRpcServer xmlRpcServer) {
         xmlRpcServer.setHandlerMapping(new XmlRpcHandlerMapping() {
             @SuppressWarnings("serial")
             private final Map<String, XmlRpcHandler> handlers = new HashMap<String, XmlRpcHandler>() {{ 
                 put("get_keyword_names", new GetKeywordNameHandler(library)); 
-                put("run_keyword", new RunKeywordHandler(library));
+                put("run_keyword", new RunKeywordHandler(library, objectHandles));
                 put("get_keyword_arguments", new GetKeywordArgumentsHandler(library));
                 put("get_keyword_documentation", new GetKeywordDocumentationHandler(library));
+                put("get_library_spec", new GetLibrarySpecHandler(library));
+                put("system.multicall", new MulticallHandler(this));
             }};
             
             public XmlRpcHandler getHandler(String handlerName) throws XmlRpcNoSuchHandlerException, XmlRpcException {
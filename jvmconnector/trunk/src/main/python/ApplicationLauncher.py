@@ -20,7 +20,7 @@ from org.robotframework.org.springframework.remoting.rmi import RmiServiceExport
 from org.robotframework.org.springframework.remoting.rmi import RmiProxyFactoryBean
 
 from org.robotframework.jvmconnector.server import *
-from org.robotframework.jvmconnector.client import RobotRemoteLibrary
+from org.robotframework.jvmconnector.client import RobotRemoteLibrary, RmiInfoListener
 from org.robotframework.jvmconnector.launch.jnlp import JnlpEnhancer
 from org.robotframework.jvmconnector.common import DataBasePaths
 
@@ -55,14 +55,21 @@ class RmiWrapper:
         self.class_loader = Class
 
     def export_rmi_service_and_launch_application(self, application, args):
-        self.library_importer_publisher.start(DATABASE)
+        rmi_info = self.library_importer_publisher.start(DATABASE)
+        self._announce(rmi_info)
         self.class_loader.forName(application).main(args)
 
+    def _announce(self, rmi_info):
+        notify_port = System.getProperty(NOTIFY_PROPERTY)
+        if notify_port:
+            RmiInfoAnnouncer(int(notify_port)).announce(rmi_info)
+
 
 class InvalidURLException(Exception):
     pass
 
 DATABASE = DataBasePaths().getLaunchedFile()
+NOTIFY_PROPERTY = 'robot.jvmconnector.notify'
 
 class ApplicationLauncher:
     """A library for starting java application or Java Webstart application and importing
@@ -95,6 +102,8 @@ class ApplicationLauncher:
         self.builtin = BuiltIn()
         self.operating_system = OperatingSystem()
         self.rmi_url = None
+        self._announced_rmi_url = None
+        self._start_end_time = None
         self._assert_invariants()
 
     def start_application(self, args='', jvm_args=''):
@@ -106,8 +115,14 @@ class ApplicationLauncher:
         Example:
         | Start Application | one two three | -Dproperty=value |
         """
-        command = self._create_command(args, jvm_args)
+        # Waiting for the announcement and connecting share the same timeout
+        self._start_end_time = time.time() + self.timeout
+        listener = self._create_rmi_info_listener()
+        command = self._create_command(args, jvm_args, listener)
         self.operating_system.start_process(command)
+        if listener:
+            timeout = long(self.timeout * 1000)
+            self._announced_rmi_url = listener.waitForRmiInfo(timeout)
         self.application_started()
     
     def import_remote_library(self, library_name, *args):
@@ -160,18 +175,29 @@ class ApplicationLauncher:
         Required before taking libraries into use with `Import Remote Library` 
         when application is started with ApplicationLauncher.py script.
         """
-        self.rmi_url = None
-        self._connect_to_base_rmi_service()
+        self.rmi_url = self._announced_rmi_url
+        self._announced_rmi_url = None
+        end_time = self._start_end_time
+        self._start_end_time = None
+        self._connect_to_base_rmi_service(end_time)
+
+    def _create_rmi_info_listener(self):
+        # Java Web Start applications are launched through RMILauncher, which
+        # only stores the rmi info to the database.
+        if self._is_jnlp_application():
+            return None
+        return RmiInfoListener()
 
-    def _create_command(self, args, jvm_args):
+    def _create_command(self, args, jvm_args, listener=None):
         if (self._is_jnlp_application()):
             jnlp = JnlpEnhancer(self.libdir).createRmiEnhancedJnlp(self.application)
             return 'javaws %s %s'  % (jvm_args, jnlp)
         else:
             pythonpath = self._get_python_path()
             out_file, err_file = self._get_output_files()
-            return 'jython -Dpython.path="%s" %s "%s" %s %s 1>%s 2>%s' % (pythonpath,
-                   jvm_args, __file__, self.application, args, out_file, err_file)
+            notify = '-D%s=%s' % (NOTIFY_PROPERTY, listener.getPort())
+            return 'jython -Dpython.path="%s" %s %s "%s" %s %s 1>%s 2>%s' % (pythonpath,
+                   notify, jvm_args, __file__, self.application, args, out_file, err_file)
 
     def _is_jnlp_application(self):
         return self.application.startswith('http') or path.isfile(self.application)
@@ -199,14 +225,16 @@ class ApplicationLauncher:
         if testlibs.has_key(lib.name):
             testlibs.pop(lib.name)
 
-    def _connect_to_base_rmi_service(self): 
-        start_time = time.time()
-        while time.time() - start_time < self.timeout:
+    def _connect_to_base_rmi_service(self, end_time=None): 
+        end_time = end_time or time.time() + self.timeout
+        while True:
             url = self._retrieve_base_rmi_url()
             try:
                 return self._create_rmi_client(url)
             except (BeanCreationException, RemoteAccessException,
                     InvalidURLException):
+                if time.time() >= end_time:
+                    break
                 time.sleep(2)
         raise RuntimeError('Could not connect to application %s' % self.application)
 
@@ -1,12 +1,17 @@
 import os
 import re
+import sys
 import time
+import shutil
+import threading
+import jarray
 
+from java.util import UUID
 from java.util.jar import JarFile
 from java.util.zip import ZipException
-from java.io import IOException, FileNotFoundException
+from java.io import IOException, FileNotFoundException, FileInputStream, FileOutputStream
 
-from robot.utils import eq, normalize, NormalizedDict, seq2str, timestr_to_secs
+from robot.utils import eq, normalize, NormalizedDict, seq2str, timestr_to_secs, secs_to_timestr
 from robot.running import NAMESPACES
 from robot.running.namespace import IMPORTER
 try:
@@ -18,12 +23,12 @@ from robot.libraries.BuiltIn import BuiltIn
 from robot.libraries.OperatingSystem import OperatingSystem
 
 from org.robotframework.jvmconnector.org.springframework.beans.factory import BeanCreationException
-from org.robotframework.jvmconnector.org.springframework.remoting import RemoteAccessException
+from org.robotframework.jvmconnector.org.springframework.remoting import RemoteAccessException, RemoteConnectFailureException
 from org.robotframework.jvmconnector.org.springframework.remoting.rmi import RmiProxyFactoryBean
 
-from org.robotframework.jvmconnector.client import RobotRemoteLibrary
+from org.robotframework.jvmconnector.client import RobotRemoteLibrary, BinaryTransportClient, RmiInfoListener
 from org.robotframework.jvmconnector.server import RmiInfoStorage, LibraryImporter
-from org.robotframework.jvmconnector.common import DataBasePaths
+from org.robotframework.jvmconnector.common import DataBasePaths, KeywordCall, ObjectHandle
 
 class InvalidURLException(Exception):
     pass
@@ -31,30 +36,115 @@ class InvalidURLException(Exception):
 
 class RemoteLibrary:
 
-    def __init__(self, name, uri):
+    def __init__(self, name, connect, reconnect_service=None):
         self.name = name
-        self._uri = uri
+        self._connect = connect
+        self._reconnect_service = reconnect_service
         self._open_connection()
         self._keywords = None
 
     def _open_connection(self):
-        self._remote_lib = RobotRemoteLibrary(self._uri)
+        self._remote_lib = self._connect()
 
     def get_keyword_names(self):
         if self._keywords is None:
             self._keywords = list(self._remote_lib.getKeywordNames())
         return self._keywords
 
-    def has_keyword(self, name):
-        return name in self._keywords
+    def run_keyword(self, name, args, timeout_millis=None):
+        if timeout_millis:
+            return self._call('runKeywordWithTimeout', name, args, timeout_millis)
+        return self._call('runKeyword', name, args)
 
-    def run_keyword(self, name, args):
+    def run_keywords(self, calls, stop_on_failure):
+        keyword_calls = [KeywordCall(name, args) for name, args in calls]
+        return list(self._call('runKeywords', keyword_calls, stop_on_failure))
+
+    def run_keyword_until_succeeds(self, name, args, timeout_millis,
+                                   retry_interval_millis):
+        return self._call('runKeywordUntilSucceeds', name, args, timeout_millis,
+                          retry_interval_millis)
+
+    def start_keyword(self, name, args):
+        return self._call('startKeyword', name, args)
+
+    def wait_for_keyword(self, handle, timeout_millis):
+        return self._call('waitForKeyword', handle, timeout_millis)
+
+    def read_keyword_output(self, handle):
+        return self._call('readKeywordOutput', handle)
+
+    def release_keyword(self, handle):
+        return self._call('releaseKeyword', handle)
+
+    def _call(self, method_name, *args):
+        # Only a failed connect is retried: other failures may have happened
+        # after the keyword already ran in the application.
         try:
-            self._remote_lib.ping()
-        except RemoteAccessException:
-            print "*DEBUG* Reconnecting"
-            self._open_connection()
-        return self._remote_lib.runKeyword(name, args)
+            return getattr(self._remote_lib, method_name)(*args)
+        except RemoteConnectFailureException:
+            self.reconnect()
+            return getattr(self._remote_lib, method_name)(*args)
+
+    def reconnect(self):
+        print "*DEBUG* Reconnecting"
+        if self._reconnect_service:
+            self._reconnect_service()
+        self._open_connection()
+
+
+class Heartbeat(threading.Thread):
+
+    def __init__(self, application, interval):
+        threading.Thread.__init__(self)
+        self.setDaemon(True)
+        self.connection_lost = False
+        self._application = application
+        self._interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.isSet():
+            self._stopped.wait(self._interval)
+            if not self._stopped.isSet() and not self.connection_lost:
+                self.connection_lost = not self._application.is_connection_alive()
+
+    def stop(self):
+        self._stopped.set()
+
+
+class ParallelCall(threading.Thread):
+
+    def __init__(self, function, *args):
+        threading.Thread.__init__(self)
+        self.setDaemon(True)
+        self.result = None
+        self.error = None
+        self._function = function
+        self._args = args
+
+    def run(self):
+        try:
+            self.result = self._function(*self._args)
+        except:
+            self.error = sys.exc_info()
+
+    def raise_error(self):
+        if self.error:
+            raise self.error[0], self.error[1], self.error[2]
+
+
+def get_end_time(timeout):
+    return time.time() + timestr_to_secs(timeout or '60 seconds')
+
+
+def run_in_parallel(function, args_list):
+    calls = [ ParallelCall(function, *args) for args in args_list ]
+    for call in calls:
+        call.start()
+    for call in calls:
+        call.join()
+    return calls
 
 
 class Applications:
@@ -136,50 +226,70 @@ class Applications:
 class RemoteApplication:
     ROBOT_LIBRARY_SCOPE = 'GLOBAL'
     _database = DataBasePaths().getLaunchedFile()
+    _payload_chunk_size = 1024 * 1024
 
     def __init__(self):
         self._libs = []
         self._keywords = {}
+        self._keyword_names = None
         self.rmi_url = None
-        self._rmi_client = None
+        self._service = None
+        self._heartbeat = None
         self.alias = None
 
     def application_started(self, alias, timeout='60 seconds', rmi_url=None):
-        if self._rmi_client:
+        self.connect(alias, get_end_time(timeout), rmi_url)
+
+    def connect(self, alias, end_time, rmi_url=None):
+        if self._service is not None:
             raise RuntimeError("Application already connected")
         self.alias = alias
-        timeout = timestr_to_secs(timeout or '60 seconds')
-        self._rmi_client = self._connect_to_base_rmi_service(alias, timeout, rmi_url)
+        self._service = self._connect_to_base_rmi_service(alias, end_time, rmi_url)
         print "*INFO* Connected to remote service at '%s'" % self.rmi_url
 
-    def _connect_to_base_rmi_service(self, alias, timeout, rmi_url): 
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+    def _connect_to_base_rmi_service(self, alias, end_time, rmi_url): 
+        # Connecting is tried at least once even if the time was used up
+        # while waiting for the application to announce itself.
+        retry_interval = max(end_time - time.time(), 0) / 100.0
+        while True:
             url = self._retrieve_base_rmi_url(rmi_url)
             try:
                 print "*TRACE* Trying to connect to rmi url '%s'" % url
-                return self._create_rmi_client(url)
+                service = self._create_service(url)
             except (BeanCreationException, RemoteAccessException,
                     InvalidURLException):
-                time.sleep(timeout/100.0)
+                if time.time() >= end_time:
+                    break
+                time.sleep(retry_interval)
+            else:
+                self._clean_db_if_url_was_retrieved_from_it(rmi_url)
+                return service
         self._could_not_connect(alias)
 
     def _retrieve_base_rmi_url(self, url):
         return url or RmiInfoStorage(self._database).retrieve()
 
-    def _create_rmi_client(self, url):
-        if not re.match('rmi://[^:]+:\d{1,5}/.*', url):
+    def _create_service(self, url):
+        if re.match('binary://[^:]+:\d{1,5}/?$', url):
+            service = BinaryTransportClient.connect(url)
+            service.ping()
+        elif re.match('rmi://[^:]+:\d{1,5}/.*', url):
+            service = self._create_rmi_client(url).getObject()
+        else:
             raise InvalidURLException()
+        self.rmi_url = url
+        return service
+
+    def _create_rmi_client(self, url):
         rmi_client = RmiProxyFactoryBean(serviceUrl=url,
-                                         serviceInterface=LibraryImporter)
+                                         serviceInterface=LibraryImporter,
+                                         refreshStubOnConnectFailure=True)
         rmi_client.prepare()
         rmi_client.afterPropertiesSet()
-        self._save_base_url_and_clean_db(url)
         return rmi_client
 
-    def _save_base_url_and_clean_db(self, url):
-        self.rmi_url = url
-        if os.path.exists(self._database):
+    def _clean_db_if_url_was_retrieved_from_it(self, rmi_url):
+        if not rmi_url and os.path.exists(self._database):
             os.remove(self._database)
 
     def _could_not_connect(self, alias):
@@ -187,77 +297,237 @@ class RemoteApplication:
         raise RuntimeError("Could not connect to application %s" % alias)
 
     def take_libraries_into_use(self, *library_names):
-        for name in library_names:
-            self.take_library_into_use(name)
+        self._check_connection()
+        names = self._get_libraries_not_in_use(library_names)
+        calls = run_in_parallel(self._create_library, [ (name,) for name in names ])
+        for call in calls:
+            if call.result:
+                self.add_library(call.result)
+        for call in calls:
+            call.raise_error()
+
+    def add_library(self, library):
+        self._libs.append(library)
+        for name in library.get_keyword_names():
+            self._add_to_index(name, library, name)
+            self._add_to_index('%s.%s' % (library.name, name), library, name)
+        self._keyword_names = None
+
+    def _add_to_index(self, name, library, short_name):
+        key = normalize(name)
+        if not self._keywords.has_key(key):
+            self._keywords[key] = (name, [])
+        self._keywords[key][1].append((library, short_name))
 
     def take_library_into_use(self, library_name):
         #TODO: Add support for arguments
-        self._check_connection()
-        if self._library_already_in_use(library_name):
-            print "*INFO* Library '%s' is already in use" % (library_name)
-            return []
-        library_url = self._import_remote_library(library_name)
-        library = RemoteLibrary(library_name, library_url)
-        self._libs.append(library)
+        self.take_libraries_into_use(library_name)
+
+    def _get_libraries_not_in_use(self, library_names):
+        names = []
+        for name in library_names:
+            if self._library_already_in_use(name) or name in names:
+                print "*INFO* Library '%s' is already in use" % (name)
+            else:
+                names.append(name)
+        return names
+
+    def _create_library(self, library_name):
+        self._register_remote_library(library_name)
+        library = RemoteLibrary(library_name,
+                                lambda: self._connect_to_library(library_name),
+                                self._reconnect_service)
+        library.get_keyword_names()
+        return library
+
+    def _connect_to_library(self, library_name):
+        return RobotRemoteLibrary(self._service, library_name)
+
+    def _reconnect_service(self):
+        # Libraries reconnect one by one, but the service is created only once
+        if not self.is_connection_alive():
+            self._service = self._create_service(self.rmi_url)
 
     def _library_already_in_use(self, library_name):
         return library_name in [lib.name for lib in self._libs ]
 
     def _check_connection(self):
-        if self._rmi_client is None:
+        if self._service is None:
             raise RuntimeError("No connection established. Use keyword " + 
                                "'Start Application' or 'Application Started' " +
                                "before this keyword.")
 
-    def _import_remote_library(self, library_name): 
-        return self._rmi_client.getObject().importLibrary(library_name)
+    def _register_remote_library(self, library_name):
+        self._service.registerLibrary(library_name)
+
+    def start_heartbeat(self, interval):
+        self.stop_heartbeat()
+        self._heartbeat = Heartbeat(self, interval)
+        self._heartbeat.start()
+
+    def stop_heartbeat(self):
+        if self._heartbeat:
+            self._heartbeat.stop()
+            self._heartbeat = None
 
     def close_application(self):
         self._check_connection()
+        self.stop_heartbeat()
         try:
-            self._rmi_client.getObject().closeService()
+            self._service.closeService()
         except RemoteAccessException:
-            self._rmi_client = None
+            self._service = None
             return
         raise RuntimeError('Could not close application.')
 
     def is_connection_alive(self):
         try:
-            return self._rmi_client.getObject().ping()
+            return self._service.ping()
         except RemoteAccessException:
             return False
 
     def get_keyword_names(self):
-        self._keywords = self._get_keywords_with_related_libraries()
-        self._add_long_names_for_duplicates()
-        keyword_names = self._keywords.keys()
-        keyword_names.sort()
-        return keyword_names
+        if self._keyword_names is None:
+            self._keyword_names = self._create_keyword_names()
+        return self._keyword_names
 
-    def _get_keywords_with_related_libraries(self):
-        keywords = {}
+    def _create_keyword_names(self):
+        keyword_names = []
         for lib in self._libs:
-            for keyword_name in lib.get_keyword_names():
-                if keywords.has_key(keyword_name):
-                    keywords[keyword_name].append(lib)
-                else:
-                    keywords[keyword_name] = [lib]
-        return keywords
-
-    def _add_long_names_for_duplicates(self):
-        for kw, libs in self._keywords.items():
-            if len(libs) > 1:
-                for lib in libs:
-                    self._keywords['%s.%s' % (lib.name, kw)] = [lib]
-
-    def run_keyword(self, name, args):
-        if len(self._keywords[name]) == 1:
-            return self._keywords[name][0].run_keyword(name, args)
-        self._raise_error_from_duplicate_keywords(name, self._keywords[name])
-        
+            for name in lib.get_keyword_names():
+                if self._is_duplicate(name):
+                    keyword_names.append('%s.%s' % (lib.name, name))
+        for name, keywords in self._keywords.values():
+            if not self._is_long_name(name, keywords):
+                keyword_names.append(name)
+        keyword_names.sort()
+        return keyword_names
 
-    def _raise_error_from_duplicate_keywords(self, name, libs):
-        kw_names = ['%s.%s' % (lib.name, name) for lib in libs]
+    def _is_duplicate(self, name):
+        return len(self._keywords[normalize(name)][1]) > 1
+
+    def _is_long_name(self, name, keywords):
+        lib, short_name = keywords[0]
+        return name != short_name
+
+    def run_keyword(self, name, args, timeout_millis=None):
+        self._reconnect_if_connection_lost()
+        lib, short_name = self._get_keyword(name)
+        return lib.run_keyword(short_name, args, timeout_millis)
+
+    def run_keywords(self, calls, stop_on_failure):
+        self._reconnect_if_connection_lost()
+        results = []
+        for lib, lib_calls in self._group_calls_by_library(calls):
+            lib_results = lib.run_keywords(lib_calls, stop_on_failure)
+            results.extend(lib_results)
+            if stop_on_failure and self._contains_failure(lib_results):
+                break
+        return results
+
+    def get_object_field(self, handle, name):
+        return self._service.getObjectField(self._to_object_handle(handle), name)
+
+    def get_object_slice(self, handle, start, end):
+        return list(self._service.getObjectSlice(self._to_object_handle(handle),
+                                                 start, end))
+
+    def release_object(self, handle):
+        self._service.releaseObject(self._to_object_handle(handle))
+
+    def _to_object_handle(self, handle):
+        # Handles may come back from Robot as their string ids
+        if isinstance(handle, ObjectHandle):
+            return handle
+        return ObjectHandle(str(handle), None)
+
+    def is_on_this_host(self):
+        match = re.match('\w+://([^:/]+)', self.rmi_url or '')
+        return match is not None and match.group(1) in ['localhost', '127.0.0.1']
+
+    def upload_payload(self, path):
+        if self.is_on_this_host():
+            return self._service.createPayload(os.path.abspath(path))
+        handle = self._service.createPayload(None)
+        input = FileInputStream(path)
+        try:
+            buffer = jarray.zeros(self._payload_chunk_size, 'b')
+            read = input.read(buffer)
+            while read > 0:
+                self._service.appendPayloadChunk(handle, buffer[:read])
+                read = input.read(buffer)
+        finally:
+            input.close()
+        return handle
+
+    def run_keyword_for_payload(self, name, args):
+        self._reconnect_if_connection_lost()
+        lib, short_name = self._get_keyword(name)
+        return self._service.runKeywordForPayload(lib.name, short_name, args)
+
+    def download_payload(self, handle, path=None):
+        if self.is_on_this_host():
+            remote_path = self._service.getPayloadPath(handle)
+            if not path:
+                return remote_path
+            shutil.copyfile(remote_path, path)
+            return path
+        if not path:
+            raise RuntimeError("Target path must be given when the application is on another host")
+        output = FileOutputStream(path)
+        try:
+            offset = 0
+            chunk = self._service.readPayloadChunk(handle, offset, self._payload_chunk_size)
+            while len(chunk) > 0:
+                output.write(chunk)
+                offset += len(chunk)
+                chunk = self._service.readPayloadChunk(handle, offset, self._payload_chunk_size)
+        finally:
+            output.close()
+        return path
+
+    def run_keyword_until_succeeds(self, name, args, timeout_millis,
+                                   retry_interval_millis):
+        self._reconnect_if_connection_lost()
+        lib, short_name = self._get_keyword(name)
+        return lib.run_keyword_until_succeeds(short_name, args, timeout_millis,
+                                              retry_interval_millis)
+
+    def start_keyword(self, name, args):
+        self._reconnect_if_connection_lost()
+        lib, short_name = self._get_keyword(name)
+        return lib, lib.start_keyword(short_name, args)
+
+    def _reconnect_if_connection_lost(self):
+        if self._heartbeat and self._heartbeat.connection_lost:
+            print "*INFO* Connection to application '%s' was lost" % self.alias
+            for lib in self._libs:
+                lib.reconnect()
+            self._heartbeat.connection_lost = False
+
+    def _group_calls_by_library(self, calls):
+        groups = []
+        for name, args in calls:
+            lib, short_name = self._get_keyword(name)
+            if groups and groups[-1][0] is lib:
+                groups[-1][1].append((short_name, args))
+            else:
+                groups.append((lib, [(short_name, args)]))
+        return groups
+
+    def _contains_failure(self, results):
+        return len([r for r in results if not r.keywordPassed()]) > 0
+
+    def _get_keyword(self, name):
+        keywords = self._keywords.get(normalize(name))
+        if not keywords:
+            raise RuntimeError("No remote keyword with name '%s' found" % name)
+        if len(keywords[1]) > 1:
+            self._raise_error_from_duplicate_keywords(name, keywords[1])
+        return keywords[1][0]
+
+    def _raise_error_from_duplicate_keywords(self, name, keywords):
+        kw_names = ['%s.%s' % (lib.name, name) for lib, short_name in keywords]
         raise RuntimeError("Keyword '%s' available from multiple remote libraries. Use: %s" % (name, seq2str(kw_names, lastsep=' or ')))
 
 
@@ -334,9 +604,9 @@ class RemoteApplicationsConnector:
 
     _-javaagent:"~/some/testing/lib/jvmconnector-1.0.jar"="~/some/testing/lib":PORT=12345_
 
-    When Robot Agent is used (RemoteApplications uses it internally) and the
-    port parameter is not given, rmi_url from where the testing capabilities
-    can be accessed is written to file
+    When Robot Agent is used directly and the port parameter is not given,
+    rmi_url from where the testing capabilities can be accessed is written to
+    file
     `%HOME/.robotframework/jvmconnector/launched.txt` or to file
     `%APPDATA%\\RobotFramework\\jvmconnector\\launched.txt` on Windows. In case
     application is started on remote machine, this rmi_url needs to be given to
@@ -347,6 +617,12 @@ class RemoteApplicationsConnector:
     application in case the `connect_to_previously_launched_applications`
     argument is given when `importing` RemoteApplications library.
 
+    Applications started with `Start Application` announce their rmi_url
+    directly to the starting test run. Each start uses its own token and the
+    rmi_url is also written to a file named after the token in the `launched`
+    directory next to `launched.txt`, so several applications, and several
+    test runs on the same host, can be started at the same time.
+
     *NOTE:* With Java 1.5 the testing dependencies cannot be added to the
     application's JVM with the Robot Agent. Therefore the test libraries need
     to be added to the classpath with some other means. Often it is possible to
@@ -369,20 +645,31 @@ class RemoteApplicationsConnector:
     character. See more from 
     http://java.sun.com/docs/books/tutorial/deployment/jar/downman.html
     """
-    _database = DataBasePaths().getLaunchedFile()
+
+    _output_poll_interval = 1.0
 
     def __init__(self):
         self._initialize()
         ignore_methods = ['run_keyword', 'get_keyword_documentation',
                            'get_keyword_arguments', 'get_keyword_names',
                            'connect']
-        self._kws = [ attr for attr in dir(self) if not attr.startswith('_') \
-                     and attr not in ignore_methods ]
+        self._kws = {}
+        for attr in dir(self):
+            if not attr.startswith('_') and attr not in ignore_methods:
+                self._kws[attr] = getattr(self, attr)
         self._use_previously_launched = False
+        self._heartbeat_interval = None
+        self._keyword_timeout = None
+        self._transport = None
+        self._execution_policies = []
+        self._object_handles = None
+        self._started_keyword_count = 0
 
     def _initialize(self):
         self._apps = Applications()
         self._active_app = None
+        self._keyword_names = None
+        self._started_keywords = {}
 
     def connect(self, connect_to_previously_started_applications):
         self._use_previously_launched = connect_to_previously_started_applications
@@ -430,23 +717,124 @@ class RemoteApplicationsConnector:
         NOT run the command for starting it.
         """
         self._alias_in_use(alias)
-        self._clear_launched_apps_db(port)
-        if not (self._use_previously_launched and self._apps.get_url(alias)):
-            self._run_command_with_java_tool_options(command, lib_dir, port)
+        end_time = get_end_time(timeout)
         rmi_url = self._get_rmi_url(alias, port)
-        self.application_started(alias, timeout, rmi_url)
+        if not (self._use_previously_launched and self._apps.get_url(alias)):
+            listener, token = self._launch(command, lib_dir, port)
+            rmi_url = self._wait_for_rmi_url(alias, end_time, listener, token)
+        self._application_started(alias, end_time, rmi_url)
+
+    def start_applications(self, timeout, lib_dir, *aliases_and_commands):
+        """Starts several applications at once and connects to them.
+
+        `aliases_and_commands` are given as pairs of alias and command. All the
+        applications are launched first and then connected to concurrently, so
+        starting them takes about as long as starting the slowest one. The last
+        application becomes the active application.
+
+        `timeout` and `lib_dir` are used for all the applications and have the
+        same meaning as with `Start Application`. The port is always selected
+        automatically.
+
+        If some of the applications cannot be launched or connected, the
+        others are still taken into use before the first error is reported, so
+        that they can be closed with `Close All Applications`.
+
+        Example:
+        | Start Applications | 2 min | \${CURDIR}${/}libs | App1 | java -jar client.jar | App2 | java -jar client.jar |
+        """
+        aliases, commands = self._split_aliases_and_commands(aliases_and_commands)
+        launches = []
+        end_time = get_end_time(timeout)
+        try:
+            for alias, command in zip(aliases, commands):
+                rmi_url = self._get_rmi_url(alias, None)
+                listener = token = None
+                if not rmi_url:
+                    listener, token = self._launch(command, lib_dir or None, None)
+                launches.append((alias, end_time, rmi_url, listener, token))
+        except:
+            error = sys.exc_info()
+            self._connect_to_launched_applications(launches)
+            raise error[0], error[1], error[2]
+        for call in self._connect_to_launched_applications(launches):
+            call.raise_error()
+
+    def _connect_to_launched_applications(self, launches):
+        calls = run_in_parallel(self._connect_to_launched_application, launches)
+        for launch, call in zip(launches, calls):
+            if call.result:
+                self._register_application(launch[0], call.result)
+        return calls
+
+    def _split_aliases_and_commands(self, aliases_and_commands):
+        if not aliases_and_commands or len(aliases_and_commands) % 2 != 0:
+            raise RuntimeError("Applications must be given as alias and command pairs")
+        aliases = list(aliases_and_commands[::2])
+        commands = list(aliases_and_commands[1::2])
+        used = {}
+        for alias in aliases:
+            self._alias_in_use(alias)
+            if used.has_key(normalize(alias)):
+                raise RuntimeError("Alias '%s' given more than once" % alias)
+            used[normalize(alias)] = True
+        return aliases, commands
+
+    def _connect_to_launched_application(self, alias, end_time, rmi_url,
+                                         listener, token):
+        if listener:
+            rmi_url = self._wait_for_rmi_url(alias, end_time, listener, token)
+        app = RemoteApplication()
+        app.connect(alias, end_time, rmi_url)
+        return app
 
     def _alias_in_use(self, alias):
         if self._apps.has_connected_to_application(alias):
             raise RuntimeError("Application with alias '%s' already in use" % alias)
 
-    def _clear_launched_apps_db(self, port):
-        if not port and os.path.exists(self._database):
-            os.remove(self._database)
-
-    def _run_command_with_java_tool_options(self, command, lib_dir, port):
+    def _launch(self, command, lib_dir, port):
+        token = str(UUID.randomUUID())
+        listener = RmiInfoListener()
+        try:
+            self._run_command_with_java_tool_options(command, lib_dir, port,
+                                                     listener.getPort(), token,
+                                                     self._get_transport(port))
+        except:
+            error = sys.exc_info()
+            listener.close()
+            raise error[0], error[1], error[2]
+        return listener, token
+
+    def _get_transport(self, port):
+        if self._transport == 'auto':
+            return not port and 'local' or None
+        return self._transport
+
+    def _wait_for_rmi_url(self, alias, end_time, listener, token):
+        timeout = max(end_time - time.time(), 0)
+        announced_url = listener.waitForRmiInfo(long(timeout * 1000))
+        rmi_url = announced_url or self._retrieve_launched_url(token)
+        self._remove_launched_url(token)
+        if not rmi_url:
+            raise RuntimeError("Could not connect to application %s" % alias)
+        print "*TRACE* Application '%s' started at rmi url '%s'" % (alias, rmi_url)
+        return rmi_url
+
+    def _retrieve_launched_url(self, token):
+        return RmiInfoStorage(DataBasePaths().getLaunchedFile(token)).retrieve()
+
+    def _remove_launched_url(self, token):
+        launched = DataBasePaths().getLaunchedFile(token)
+        if os.path.exists(launched):
+            os.remove(launched)
+
+    def _run_command_with_java_tool_options(self, command, lib_dir, port,
+                                            notify_port=None, token=None,
+                                            transport=None):
         orig_java_tool_options = self._get_java_tool_options()
-        os.environ['JAVA_TOOL_OPTIONS'] =  self._get_java_agent(lib_dir, port)
+        os.environ['JAVA_TOOL_OPTIONS'] =  self._get_java_agent(lib_dir, port,
+                                                                notify_port,
+                                                                token, transport)
         OperatingSystem().start_process(command)
         os.environ['JAVA_TOOL_OPTIONS'] = orig_java_tool_options
 
@@ -455,12 +843,18 @@ class RemoteApplicationsConnector:
             return os.environ['JAVA_TOOL_OPTIONS']
         return ''
 
-    def _get_java_agent(self, lib_dir, port):
+    def _get_java_agent(self, lib_dir, port, notify_port=None, token=None,
+                        transport=None):
         lib_dir = lib_dir or ''
         jvm_connector_jar = self._get_jvm_connector_jar()
-        port = port and ['PORT=%s' % port] or []
+        options = port and ['PORT=%s' % port] or []
+        options += notify_port and ['NOTIFY=%s' % notify_port] or []
+        options += token and ['TOKEN=%s' % token] or []
+        options += transport and ['TRANSPORT=%s' % transport] or []
+        options += ['POLICY=%s' % policy for policy in self._execution_policies]
+        options += self._object_handles and ['HANDLES=%s' % self._object_handles] or []
         return '-javaagent:"%s"="%s"' % (jvm_connector_jar, 
-                                         os.path.pathsep.join(port + [lib_dir]))
+                                         ':'.join(options + [lib_dir]))
 
     def _get_jvm_connector_jar(self):
         for jar_file in self._get_jars_from_classpath():
@@ -522,13 +916,241 @@ class RemoteApplicationsConnector:
         | Application Started | App1 |  |  |
         | Application Started | App2 | 2 minutes | rmi://localhost:7000/robotrmiservice |
         """
+        self._application_started(alias, get_end_time(timeout), rmi_url)
+
+    def _application_started(self, alias, end_time, rmi_url):
         self._alias_in_use(alias)
         app = RemoteApplication()
         if self._use_previously_launched:
             rmi_url = rmi_url or self._apps.get_url(alias)
-        app.application_started(alias, timeout, rmi_url)
+        app.connect(alias, end_time, rmi_url)
+        self._register_application(alias, app)
+
+    def _register_application(self, alias, app):
+        if self._heartbeat_interval:
+            app.start_heartbeat(self._heartbeat_interval)
         self._apps.add(alias, app)
         self._active_app = app
+        self._keyword_names = None
+
+    def set_connection_heartbeat(self, interval='NONE'):
+        """Sets the interval for checking the connections to the applications in the background.
+
+        Remote keywords are not preceded by a connection check. Instead, a lost
+        connection is reopened and the keyword is retried once when calling
+        the keyword fails. With a heartbeat, each connected application is
+        pinged every `interval` in a background thread, and connections found
+        dead are reopened before the next keyword is run.
+
+        The heartbeat is used for the applications that are already connected
+        and for the applications connected later. Giving `interval` as 'NONE'
+        or leaving it out disables the heartbeat.
+
+        Example:
+        | Set Connection Heartbeat | 5 seconds |
+        """
+        if interval.upper() == 'NONE':
+            self._heartbeat_interval = None
+        else:
+            self._heartbeat_interval = timestr_to_secs(interval)
+        for app in self._apps.get_applications():
+            if self._heartbeat_interval:
+                app.start_heartbeat(self._heartbeat_interval)
+            else:
+                app.stop_heartbeat()
+
+    def set_remote_keyword_timeout(self, timeout='NONE'):
+        """Sets the time remote keywords are allowed to run.
+
+        The timeout is enforced in the application: a keyword that does not
+        finish in time is interrupted and fails with the stack trace of the
+        thread running it, which helps finding out where it got stuck. The
+        stack trace is logged on DEBUG level. Robot's own timeouts cannot
+        interrupt a keyword running in the application.
+
+        The timeout is used with the keywords run after setting it. Giving
+        `timeout` as 'NONE' or leaving it out disables the timeout.
+
+        Example:
+        | Set Remote Keyword Timeout | 2 minutes |
+        """
+        if timeout.upper() == 'NONE':
+            self._keyword_timeout = None
+        else:
+            self._keyword_timeout = long(timestr_to_secs(timeout) * 1000)
+
+    def set_transport(self, transport='RMI'):
+        """Sets the transport used with the applications started afterwards.
+
+        `transport` is 'RMI', which is the default, 'BINARY', 'LOCAL' or
+        'AUTO'. The binary transport sends keyword calls over a persistent
+        socket using a compact binary protocol, which is faster than RMI for
+        suites that run many short keywords. The local transport is the
+        binary transport accepting connections only from the same machine.
+
+        With 'AUTO', applications started with `Start Application` or
+        `Start Applications` without a port use the local transport, because
+        they are always started on the same machine. When a port is given,
+        RMI is used so that the application can be connected from elsewhere.
+
+        With `Application Started`, the scheme of the `rmi_url` defines the
+        transport, for example 'binary://localhost:12345'. The agent uses the
+        binary transports when it is given the option _:TRANSPORT=binary_ or
+        _:TRANSPORT=local_.
+
+        Example:
+        | Set Transport | BINARY |
+        | Start Application | App1 | java -jar my_application.jar |
+        """
+        if transport.upper() not in ['AUTO', 'RMI', 'BINARY', 'LOCAL']:
+            raise RuntimeError("Unknown transport '%s'" % transport)
+        self._transport = transport.upper() != 'RMI' and transport.lower() or None
+
+    def set_execution_policy(self, policy, library=None):
+        """Sets how keywords are executed in the applications started afterwards.
+
+        `policy` is one of the following:
+        - 'DIRECT': keywords run concurrently without restrictions. This is
+          the default.
+        - 'SERIAL': one keyword of the library runs at a time.
+        - 'PARALLEL-N': at most N keywords of the library run at a time.
+        - 'THREAD-NAME': keywords run in one thread called NAME. Libraries
+          given the same thread name share the thread, which is useful with
+          libraries that are not thread safe, such as Swing libraries.
+
+        `library` is the name of the library the policy is used with. Without
+        it the policy is used with all the libraries not having their own
+        policy.
+
+        Example:
+        | Set Execution Policy | PARALLEL-4 |
+        | Set Execution Policy | THREAD-SWING | org.robotframework.swing.SwingLibrary |
+        | Start Application | App1 | java -jar my_application.jar |
+        """
+        policy = policy.lower()
+        if library:
+            policy = '%s=%s' % (library, policy)
+        self._execution_policies.append(policy)
+
+    def set_object_handles(self, policy='NONSERIALIZABLE'):
+        """Sets which keyword return values are kept in the applications started afterwards.
+
+        Return values kept in the application are not sent over the network.
+        Instead, the keyword returns a handle that can be given as an argument
+        to other keywords of the same application, which then get the
+        original object. Parts of the object can be fetched with `Get Remote
+        Object Field` and `Get Remote Object Slice`. The least recently used
+        objects are discarded when there are too many of them, and
+        `Release Remote Object` discards an object immediately.
+
+        `policy` is one of the following:
+        - 'NONSERIALIZABLE': values that cannot be sent over the network are
+          kept. This is the default of this keyword.
+        - 'ALL': all values except strings, numbers, booleans and arrays of
+          them are kept. Useful with big objects such as table models.
+        - 'NONE': all values are sent over the network. This is used when
+          this keyword has not been called.
+
+        Example:
+        | Set Object Handles | ALL |
+        | Start Application | App1 | java -jar my_application.jar |
+        | ${model}= | Get Table Model | results |
+        | ${rows}= | Get Remote Object Field | ${model} | rowCount |
+        """
+        if policy.upper() not in ['NONSERIALIZABLE', 'ALL', 'NONE']:
+            raise RuntimeError("Unknown object handle policy '%s'" % policy)
+        self._object_handles = policy.lower()
+
+    def get_remote_object_field(self, handle, name):
+        """Returns a field of an object kept in the active application.
+
+        The field is read using a getter method, such as `getName` or
+        `isVisible` for `name` or `visible`, or a public field called `name`.
+        Other methods are not called. See `Set Object Handles` for more
+        information about object handles.
+
+        Example:
+        | ${rows}= | Get Remote Object Field | ${model} | rowCount |
+        """
+        self._check_active_app()
+        return self._active_app.get_object_field(handle, name)
+
+    def get_remote_object_slice(self, handle, start, end):
+        """Returns elements of an array or a list kept in the active application.
+
+        Elements from `start` up to but not including `end` are returned. See
+        `Set Object Handles` for more information about object handles.
+
+        Example:
+        | ${first rows}= | Get Remote Object Slice | ${rows} | 0 | 10 |
+        """
+        self._check_active_app()
+        return self._active_app.get_object_slice(handle, int(start), int(end))
+
+    def release_remote_object(self, handle):
+        """Discards an object kept in the active application.
+
+        See `Set Object Handles` for more information about object handles.
+        """
+        self._check_active_app()
+        self._active_app.release_object(handle)
+
+    def upload_payload(self, path):
+        """Transfers a file to the active application for use as a keyword argument.
+
+        Returns a handle that can be given to keywords in place of the
+        content. Keywords receive it as a `java.io.File` object. When the
+        application runs on the same host, only the path of the file is
+        transferred. Otherwise the content is sent in chunks, outside the
+        keyword calls, so big files do not need to fit in memory at once.
+
+        The handle can be released with `Release Remote Object`.
+
+        Example:
+        | ${data}= | Upload Payload | ${CURDIR}${/}testdata.csv |
+        | Import Data | ${data} |
+        """
+        self._check_active_app()
+        return self._active_app.upload_payload(path)
+
+    def get_payload_from_keyword(self, keyword, *args):
+        """Runs the keyword and keeps the file or the byte array it returns in the active application.
+
+        Returns a handle to the return value, which can be given to `Download
+        Payload`. The value is kept regardless of `Set Object Handles` until
+        it is released with `Release Remote Object`.
+
+        Example:
+        | ${screenshot}= | Get Payload From Keyword | Take Screenshot |
+        | Download Payload | ${screenshot} | ${OUTPUT DIR}${/}screenshot.png |
+        """
+        self._check_active_app()
+        result = self._active_app.run_keyword_for_payload(keyword, args)
+        self._write_keyword_output((result.getStdOutAsString(),
+                                    result.getStdErrAsString()))
+        if not result.keywordPassed():
+            raise result.getTestFailedException()
+        return result.getResult()
+
+    def download_payload(self, handle, path=None):
+        """Transfers a file or a byte array kept in the active application to `path`.
+
+        `handle` is a handle returned by `Get Payload From Keyword`, or by a
+        keyword when the value is kept because of `Set Object Handles`. It
+        must refer to a `java.io.File` or a byte array. Returns the path of
+        the downloaded file.
+
+        When the application runs on the same host, the content is not sent
+        over the network. If `path` is not given in that case, the path of
+        the file in the application is returned as is, and byte arrays are
+        written to a temporary file first.
+
+        Example:
+        | ${screenshot}= | Get Payload From Keyword | Take Screenshot |
+        | Download Payload | ${screenshot} | ${OUTPUT DIR}${/}screenshot.png |
+        """
+        self._check_active_app()
+        return self._active_app.download_payload(handle, path)
 
     def switch_to_application(self, alias):
         """Changes the application where the keywords are executed.
@@ -556,19 +1178,84 @@ class RemoteApplicationsConnector:
         use on the remote side. *NOTE:* See 'Start Application' for information
         how to provide library jar files.
 
+        The libraries are imported concurrently and the keywords are updated
+        once after all of them are in use.
+
         Example:
         | Start Application | App1 | java -jar my_application.jar | 2 min | \${CURDIR}${/}libs |
         | Take Libraries Into Use | MyLibrary | SwingLibrary |
         """
         self._check_active_app()
-        self._active_app.take_libraries_into_use(*library_names)
-        self._update_keywords_to_robot()
+        try:
+            self._active_app.take_libraries_into_use(*library_names)
+        finally:
+            self._update_keywords_to_robot()
+
+    def take_libraries_into_use_on_all_applications(self, *library_names):
+        """Takes the libraries into use at all the connected applications.
+
+        Works like `Take Libraries Into Use` but the libraries are taken into
+        use at every connected application concurrently.
+
+        Example:
+        | Start Applications | 2 min | \${CURDIR}${/}libs | App1 | java -jar client.jar | App2 | java -jar client.jar |
+        | Take Libraries Into Use On All Applications | MyLibrary | SwingLibrary |
+        """
+        apps = self._apps.get_applications()
+        if not apps:
+            raise RuntimeError("No application selected")
+        try:
+            calls = run_in_parallel(self._take_libraries_into_use_on,
+                                    [ (app, library_names) for app in apps ])
+        finally:
+            self._update_keywords_to_robot()
+        for call in calls:
+            call.raise_error()
+
+    def _take_libraries_into_use_on(self, app, library_names):
+        app.take_libraries_into_use(*library_names)
 
     def _check_active_app(self):
         if self._active_app is None:
             raise RuntimeError("No application selected")
 
     def _update_keywords_to_robot(self):
+        self._keyword_names = None
+        libs = self._get_libraries_in_robot('RemoteApplications')
+        if libs and self._can_add_handlers(libs):
+            for lib in libs:
+                self._add_new_handlers(lib)
+        else:
+            self._reimport_library_to_robot()
+
+    def _get_libraries_in_robot(self, name):
+        # These internals exist in Robot 2.5 and newer
+        namespace = getattr(NAMESPACES, 'current', None)
+        if not (hasattr(namespace, '_testlibs') and hasattr(IMPORTER, '_libraries')):
+            return []
+        libs = [namespace._testlibs.get(name)]
+        cached = IMPORTER._libraries
+        libs.extend(hasattr(cached, '_libs') and cached._libs or cached.values())
+        return [lib for lib in libs if lib and lib.name == name]
+
+    def _can_add_handlers(self, libs):
+        # Robot versions before 2.5 cannot create handlers to an existing
+        # library, so the whole library must be imported again
+        for lib in libs:
+            for attr in ['handlers', 'get_instance', '_get_handler_method',
+                         '_create_handler']:
+                if not hasattr(lib, attr):
+                    return False
+        return True
+
+    def _add_new_handlers(self, lib):
+        instance = lib.get_instance()
+        for name in self.get_keyword_names():
+            if not lib.handlers.has_key(name):
+                method = lib._get_handler_method(instance, name)
+                lib.handlers[name] = lib._create_handler(name, method)
+
+    def _reimport_library_to_robot(self):
         # TODO: When Robot has better support for reimporting libraries,
         # update following code to use that approach. See RF issue 293.
         lib_name = 'RemoteApplications'
@@ -607,6 +1294,168 @@ class RemoteApplicationsConnector:
         #TODO: Add support for arguments
         self.take_libraries_into_use(library_name)
 
+    def run_remote_keywords(self, *keywords_and_arguments):
+        """Runs the given keywords in the active application in a single remote call.
+
+        Keywords and their arguments are separated from each other with `AND`.
+        Consecutive keywords from the same remote library are sent to the
+        application together, so a long sequence of keywords does not pay the
+        network round trip for every keyword. Execution stops at the first
+        failing keyword and its error is reported. Returns a list containing
+        the return values of the executed keywords.
+
+        Only keywords from the remote libraries can be used with this keyword.
+        Use `Run Remote Keywords And Continue On Failure` to run all the
+        keywords regardless of failures.
+
+        Example:
+        | Run Remote Keywords | Insert Into Text Field | name | John | AND | Insert Into Text Field | age | 42 | AND | Push Button | OK |
+        """
+        return self._run_remote_keywords(keywords_and_arguments, True)
+
+    def run_remote_keywords_and_continue_on_failure(self, *keywords_and_arguments):
+        """Runs the given keywords in a single remote call and continues on failure.
+
+        Works like `Run Remote Keywords` but all the given keywords are run
+        even if some of them fail. The error of the first failing keyword is
+        reported after all the keywords have been run.
+        """
+        return self._run_remote_keywords(keywords_and_arguments, False)
+
+    def _run_remote_keywords(self, keywords_and_arguments, stop_on_failure):
+        self._check_active_app()
+        calls = self._split_to_keyword_calls(keywords_and_arguments)
+        results = self._active_app.run_keywords(calls, stop_on_failure)
+        for result in results:
+            if not result.keywordPassed():
+                raise result.getTestFailedException()
+        return [result.getResult() for result in results]
+
+    def _split_to_keyword_calls(self, keywords_and_arguments):
+        calls = [[]]
+        for item in keywords_and_arguments:
+            if item == 'AND':
+                calls.append([])
+            else:
+                calls[-1].append(item)
+        for call in calls:
+            if not call:
+                raise RuntimeError("Keyword name missing from keywords '%s'"
+                                   % ' '.join([str(item) for item in keywords_and_arguments]))
+        return [(call[0], call[1:]) for call in calls]
+
+    def wait_until_remote_keyword_succeeds(self, timeout, retry_interval, name, *args):
+        """Runs the remote keyword until it passes or `timeout` is exceeded.
+
+        Works like `BuiltIn.Wait Until Keyword Succeeds`, but the retrying is
+        done inside the application, so each attempt does not need a round
+        trip over the network and `retry_interval` can be shorter. Only the
+        output of the last attempt is logged. Returns the return value of the
+        keyword and fails with its last error if it never passed.
+
+        Only keywords from the remote libraries can be used with this keyword.
+
+        Example:
+        | Wait Until Remote Keyword Succeeds | 10 seconds | 100 milliseconds | Button Should Be Enabled | OK |
+        """
+        self._check_active_app()
+        timeout = timestr_to_secs(timeout)
+        retry_interval = timestr_to_secs(retry_interval)
+        result = self._active_app.run_keyword_until_succeeds(name, args,
+                                                             long(timeout * 1000),
+                                                             long(retry_interval * 1000))
+        if not result.keywordPassed():
+            print "*INFO* Keyword '%s' failed %d times in %s" \
+                    % (name, result.getAttempts(), secs_to_timestr(timeout))
+            raise result.getTestFailedException()
+        print "*INFO* Keyword '%s' passed after %d attempts" % (name, result.getAttempts())
+        return result.getResult()
+
+    def start_keyword_asynchronously(self, keyword, *args):
+        """Starts the keyword in the active application and returns immediately.
+
+        Returns a handle that is given to `Wait For Keyword` to get the
+        result of the keyword. Meanwhile other keywords can be run, also in
+        other applications. Only keywords from the remote libraries can be
+        started this way. A keyword that is not going to be waited for should
+        be stopped with `Stop Keyword`.
+
+        Example:
+        | ${handle}= | Start Keyword Asynchronously | Generate Report | monthly |
+        | Switch To Application | App2 |
+        | Push Button | OK |
+        | ${report}= | Wait For Keyword | ${handle} | 5 minutes |
+        """
+        self._check_active_app()
+        lib, remote_handle = self._active_app.start_keyword(keyword, args)
+        self._started_keyword_count += 1
+        handle = 'keyword-%d' % self._started_keyword_count
+        self._started_keywords[handle] = (keyword, self._active_app, lib, remote_handle)
+        return handle
+
+    def wait_for_keyword(self, handle, timeout='60 seconds'):
+        """Waits for a keyword started with `Start Keyword Asynchronously` to finish.
+
+        Returns the return value of the keyword and fails if the keyword
+        failed. If the keyword does not finish within `timeout`, this keyword
+        fails but the started keyword can still be waited for again.
+
+        Output of the keyword is shown on the console while it is running,
+        and it is also written to the log. Very long output is kept in a
+        temporary file in the application until it has been read.
+        """
+        keyword, app, lib, remote_handle = self._get_started_keyword(handle)
+        timeout = timestr_to_secs(timeout)
+        result = self._wait_for_keyword(lib, remote_handle, time.time() + timeout)
+        if result is None:
+            raise RuntimeError("Keyword '%s' did not finish in %s"
+                               % (keyword, secs_to_timestr(timeout)))
+        del self._started_keywords[handle]
+        if not result.keywordPassed():
+            raise result.getTestFailedException()
+        return result.getResult()
+
+    def stop_keyword(self, handle):
+        """Stops a keyword started with `Start Keyword Asynchronously`.
+
+        The keyword is interrupted if it is still running and it can no longer
+        be waited for. Keywords started in an application are also forgotten
+        when the application is closed.
+        """
+        keyword, app, lib, remote_handle = self._get_started_keyword(handle)
+        del self._started_keywords[handle]
+        lib.release_keyword(remote_handle)
+
+    def _get_started_keyword(self, handle):
+        if not self._started_keywords.has_key(handle):
+            raise RuntimeError("No started keyword with handle '%s'" % handle)
+        return self._started_keywords[handle]
+
+    def _forget_started_keywords(self, app):
+        for handle, started in self._started_keywords.items():
+            if started[1] is app:
+                del self._started_keywords[handle]
+
+    def _wait_for_keyword(self, lib, remote_handle, end_time):
+        while True:
+            wait_time = min(self._output_poll_interval, max(end_time - time.time(), 0))
+            result = lib.wait_for_keyword(remote_handle, long(wait_time * 1000))
+            if result is not None:
+                return result
+            self._write_keyword_output(lib.read_keyword_output(remote_handle))
+            if time.time() >= end_time:
+                return None
+
+    def _write_keyword_output(self, output):
+        stdout, stderr = output
+        if stdout:
+            if sys.stdout is not sys.__stdout__:
+                sys.__stdout__.write(stdout)
+                sys.__stdout__.flush()
+            sys.stdout.write(stdout)
+        if stderr:
+            sys.stderr.write(stderr)
+
     def close_all_applications(self):
         """Closes all the applications."""
         for alias in self._apps.get_aliases():
@@ -627,13 +1476,16 @@ class RemoteApplicationsConnector:
         alias = alias or self._get_active_app_alias()
         print "*TRACE* Closing application '%s'" % alias
         self._check_application_is_in_use(alias)
-        if self._apps.get_application(alias) == self._active_app:
+        app = self._apps.get_application(alias)
+        if app == self._active_app:
             self._active_app = None
         try:
-            self._apps.get_application(alias).close_application()
+            app.close_application()
             print "*INFO* Closed application '%s'" % (alias)
         finally:
             self._apps.delete(alias)
+            self._forget_started_keywords(app)
+            self._keyword_names = None
 
     def _get_active_app_alias(self):
         self._check_active_app()
@@ -663,22 +1515,26 @@ class RemoteApplicationsConnector:
                              % self._active_app.alias)
 
     def get_keyword_names(self):
-        kws = []
+        if self._keyword_names is None:
+            self._keyword_names = self._create_keyword_names()
+        return self._keyword_names
+
+    def _create_keyword_names(self):
+        kws = {}
         for app in self._apps.get_applications():
-            kws.extend(app.get_keyword_names())
-        return kws + self._kws
+            for name in app.get_keyword_names():
+                kws[name] = True
+        return kws.keys() + self._kws.keys()
 
     def run_keyword(self, name, args):
         method = self._get_method(name)
         if method:
             return method(*args)
         self._check_active_app()
-        return self._active_app.run_keyword(name, args)
+        return self._active_app.run_keyword(name, args, self._keyword_timeout)
 
     def _get_method(self, name):
-        if name in self._kws:
-            return getattr(self, name)
-        return None
+        return self._kws.get(name)
 
     def get_keyword_arguments(self, name):
         method = self._get_method(name)
@@ -3,7 +3,9 @@ package org.robotframework.jvmconnector.agent;
 import static org.junit.Assert.assertEquals;
 
 import java.util.Arrays;
+import java.util.HashMap;
 import java.util.List;
+import java.util.Map;
 
 import org.junit.Test;
 
@@ -45,6 +47,48 @@ public class AgentConfigurationTest{
         testParser("zip.jar:port=abcd:foo.jar", null, "zip.jar:foo.jar");
     }
 
+    @Test
+    public void parseNotifyPort() {
+        AgentConfiguration conf = new AgentConfiguration("PORT=1234:NOTIFY=5678:foo.jar");
+        assertEquals(new Integer(1234), conf.getPort());
+        assertEquals(new Integer(5678), conf.getNotifyPort());
+        assertEquals(Arrays.asList("foo.jar"), conf.getJars());
+    }
+
+    @Test
+    public void parseWithoutNotifyPort() {
+        assertEquals(null, new AgentConfiguration("foo.jar").getNotifyPort());
+    }
+
+    @Test
+    public void parseToken() {
+        AgentConfiguration conf = new AgentConfiguration("TOKEN=1b4e28ba-2fa1-11d2:foo.jar");
+        assertEquals("1b4e28ba-2fa1-11d2", conf.getToken());
+        assertEquals(Arrays.asList("foo.jar"), conf.getJars());
+    }
+
+    @Test
+    public void parseTransport() {
+        AgentConfiguration conf = new AgentConfiguration("foo.jar:TRANSPORT=binary");
+        assertEquals("binary", conf.getTransport());
+        assertEquals(Arrays.asList("foo.jar"), conf.getJars());
+    }
+
+    @Test
+    public void parsePolicies() {
+        AgentConfiguration conf = new AgentConfiguration("POLICY=parallel-4:foo.jar:POLICY=org.example.SwingLib=thread-swing");
+        Map<String, String> expected = new HashMap<String, String>();
+        expected.put("*", "parallel-4");
+        expected.put("org.example.SwingLib", "thread-swing");
+        assertEquals(expected, conf.getPolicies());
+        assertEquals(Arrays.asList("foo.jar"), conf.getJars());
+    }
+
+    @Test
+    public void jarNameContainingPortIsNotParsedAsPort() {
+        testParser("support.jar:port=1234", 1234, "support.jar");
+    }
+
     private void testParser(String input, Integer port, String jars, String splitter) {
         AgentConfiguration conf = new AgentConfiguration(input);
         assertEquals(port, conf.getPort());
@@ -0,0 +1,229 @@
+package org.robotframework.jvmconnector.server;
+
+import static org.junit.Assert.assertArrayEquals;
+import static org.junit.Assert.assertEquals;
+import static org.junit.Assert.assertFalse;
+import static org.junit.Assert.assertTrue;
+
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.IOException;
+import java.net.InetAddress;
+import java.util.Arrays;
+import java.util.Date;
+
+import org.junit.Before;
+import org.junit.Test;
+import org.robotframework.javalib.library.RobotJavaLibrary;
+import org.robotframework.jvmconnector.client.BinaryTransportClient;
+import org.robotframework.jvmconnector.common.KeywordCall;
+import org.robotframework.jvmconnector.common.KeywordExecutionResult;
+import org.robotframework.jvmconnector.common.ObjectHandle;
+import org.robotframework.jvmconnector.common.TestFailedException;
+import org.robotframework.jvmconnector.mocks.ExceptionThrowingKeyword;
+import org.robotframework.jvmconnector.mocks.MockException;
+import org.robotframework.jvmconnector.mocks.MockJavaLibrary;
+import org.springframework.remoting.RemoteConnectFailureException;
+
+public class BinaryTransportTest {
+    private String libraryName = MockJavaLibrary.class.getName();
+    private LibraryImporter service;
+
+    @Before
+    public void startService() {
+        RemoteLibraryImporter importer = new RemoteLibraryImporter(new FreePortFinder().findFreePort(), new RmiServicePublisher());
+        String url = new BinaryTransportServer(importer).start(0);
+        service = BinaryTransportClient.connect(url);
+        service.registerLibrary(libraryName);
+    }
+
+    @Test
+    public void encodesValuesWithOwnEncoding() throws Exception {
+        Object[] values = new Object[] { null, "äiti", new Integer(1), new Long(2), new Double(3.5), Boolean.TRUE,
+                new String[] { "one", "two" } };
+        Object[] decoded = (Object[]) roundTrip(values);
+        assertArrayEquals(values, decoded);
+        assertEquals(String[].class, decoded[6].getClass());
+    }
+
+    @Test
+    public void encodesOtherValuesWithSerialization() throws Exception {
+        Date date = new Date();
+        assertEquals(date, roundTrip(date));
+    }
+
+    @Test
+    public void encodesArraysOfOtherTypesWithSerialization() throws Exception {
+        Date[] dates = new Date[] { new Date() };
+        Object decoded = roundTrip(dates);
+        assertEquals(Date[].class, decoded.getClass());
+        assertArrayEquals(dates, (Object[]) decoded);
+    }
+
+    @Test(expected=IOException.class)
+    public void serializedValuesAreNotAcceptedWhenDisabled() throws Exception {
+        BinaryCodec codec = new BinaryCodec(false);
+        ByteArrayOutputStream bytes = new ByteArrayOutputStream();
+        codec.writeFrame(new DataOutputStream(bytes), new Date());
+        codec.readFrame(new DataInputStream(new ByteArrayInputStream(bytes.toByteArray())));
+    }
+
+    @Test(expected=IOException.class)
+    public void framesWithNegativeSizeAreRejected() throws Exception {
+        readFrame(new byte[] { (byte) 0xff, (byte) 0xff, (byte) 0xff, (byte) 0xff });
+    }
+
+    @Test(expected=IOException.class)
+    public void framesBiggerThanMaximumAreRejected() throws Exception {
+        readFrame(new byte[] { 0x7f, (byte) 0xff, (byte) 0xff, (byte) 0xff });
+    }
+
+    @Test(expected=IOException.class)
+    public void lengthsBeyondEndOfFrameAreRejected() throws Exception {
+        // Frame of 5 bytes containing a byte array claiming 2^30 bytes
+        readFrame(new byte[] { 0, 0, 0, 5, 11, 0x40, 0, 0, 0 });
+    }
+
+    @Test(expected=IOException.class)
+    public void negativeArrayLengthsAreRejected() throws Exception {
+        ByteArrayOutputStream content = new ByteArrayOutputStream();
+        DataOutputStream out = new DataOutputStream(content);
+        out.writeByte(6);
+        out.writeInt(16);
+        out.write("java.lang.Object".getBytes("UTF-8"));
+        out.writeInt(-1);
+        ByteArrayOutputStream frame = new ByteArrayOutputStream();
+        new DataOutputStream(frame).writeInt(content.size());
+        content.writeTo(frame);
+        readFrame(frame.toByteArray());
+    }
+
+    @Test
+    public void encodesObjectHandles() throws Exception {
+        ObjectHandle handle = (ObjectHandle) roundTrip(new ObjectHandle("objecthandle-1", "java.lang.Object"));
+        assertEquals("objecthandle-1", handle.getId());
+        assertEquals("java.lang.Object", handle.getClassName());
+    }
+
+    @Test
+    public void encodesKeywordCalls() throws Exception {
+        KeywordCall call = (KeywordCall) roundTrip(new KeywordCall("keyword", new Object[] { "arg" }));
+        assertEquals("keyword", call.getKeywordName());
+        assertEquals(Arrays.asList("arg"), Arrays.asList(call.getKeywordArguments()));
+    }
+
+    @Test
+    public void encodesTestFailures() throws Exception {
+        TestFailedException exception = (TestFailedException) roundTrip(new TestFailedException(new IllegalStateException("failure")));
+        assertEquals(IllegalStateException.class.getName(), exception.getSourceExceptionClassName());
+        assertEquals("caused by: java.lang.IllegalStateException: failure", exception.getMessage());
+        assertTrue(exception.getStackTraceAsString().contains("encodesTestFailures"));
+    }
+
+    @Test
+    public void runsKeywordsOverTransport() {
+        KeywordExecutionResult result = service.runKeyword(libraryName, "concatenatingKeyword", new Object[] { "one", "two" });
+        assertTrue(result.keywordPassed());
+        assertEquals("onetwo", result.getResult());
+    }
+
+    @Test
+    public void returnsKeywordFailuresOverTransport() {
+        KeywordExecutionResult result = service.runKeyword(libraryName, ExceptionThrowingKeyword.KEYWORD_NAME, new Object[0]);
+        assertFalse(result.keywordPassed());
+        assertEquals(MockException.class.getName(), result.getTestFailedException().getSourceExceptionClassName());
+    }
+
+    @Test
+    public void runsKeywordsInBatchOverTransport() {
+        KeywordCall[] calls = new KeywordCall[] { new KeywordCall("concatenatingKeyword", new Object[] { "a" }),
+                new KeywordCall("concatenatingKeyword", new Object[] { "b" }) };
+        assertEquals(2, service.runKeywords(libraryName, calls, true).length);
+    }
+
+    @Test
+    public void retriesKeywordsOverTransport() {
+        KeywordExecutionResult result = service.runKeywordUntilSucceeds(libraryName, ExceptionThrowingKeyword.KEYWORD_NAME,
+            new Object[0], 30, 10);
+        assertFalse(result.keywordPassed());
+        assertTrue(result.getAttempts() > 1);
+    }
+
+    @Test
+    public void servesOnlyLoopbackWhenStartedLocally() {
+        RemoteLibraryImporter importer = new RemoteLibraryImporter(new FreePortFinder().findFreePort(), new RmiServicePublisher());
+        String url = new BinaryTransportServer(importer).startOnLoopback(0);
+        assertTrue(url.startsWith("binary://127.0.0.1:"));
+        LibraryImporter localService = BinaryTransportClient.connect(url);
+        localService.registerLibrary(libraryName);
+        assertTrue(localService.runKeyword(libraryName, "concatenatingKeyword", new Object[] { "a" }).keywordPassed());
+    }
+
+    @Test
+    public void downloadsByteArrayReturnedByKeyword() {
+        service.registerLibrary(ByteArrayLibrary.class.getName());
+        KeywordExecutionResult result = service.runKeywordForPayload(ByteArrayLibrary.class.getName(), "screenshot",
+            new Object[0]);
+        ObjectHandle handle = (ObjectHandle) result.getResult();
+        assertEquals(3, service.getPayloadSize(handle));
+        assertArrayEquals(new byte[] { 1, 2 }, service.readPayloadChunk(handle, 0, 2));
+        assertArrayEquals(new byte[] { 3 }, service.readPayloadChunk(handle, 2, 2));
+        assertArrayEquals(new byte[0], service.readPayloadChunk(handle, 3, 2));
+    }
+
+    @Test
+    public void invokesOnlyMethodsOfLibraryImporter() {
+        RemoteLibraryImporter importer = new RemoteLibraryImporter(new FreePortFinder().findFreePort(), new RmiServicePublisher());
+        Object[] response = new BinaryTransportServer(importer).invoke("toString", new String[0], new Object[0]);
+        assertEquals(Boolean.FALSE, response[0]);
+        assertTrue(response[1] instanceof NoSuchMethodException);
+    }
+
+    @Test
+    public void invokesMethodsMatchingParameterTypes() {
+        RemoteLibraryImporter importer = new RemoteLibraryImporter(new FreePortFinder().findFreePort(), new RmiServicePublisher());
+        Object[] response = new BinaryTransportServer(importer).invoke("registerLibrary", new String[] { "java.lang.Object" },
+            new Object[] { libraryName });
+        assertTrue(response[1] instanceof NoSuchMethodException);
+    }
+
+    @Test
+    public void advertisesHostNameWhenServingAllInterfaces() throws Exception {
+        RemoteLibraryImporter importer = new RemoteLibraryImporter(new FreePortFinder().findFreePort(), new RmiServicePublisher());
+        String url = new BinaryTransportServer(importer).start(0);
+        assertTrue(url.startsWith("binary://" + InetAddress.getLocalHost().getHostName() + ":"));
+    }
+
+    @Test(expected=RemoteConnectFailureException.class)
+    public void reportsFailingToConnectAsConnectFailure() {
+        BinaryTransportClient.connect("binary://127.0.0.1:" + new FreePortFinder().findFreePort()).ping();
+    }
+
+    @Test(expected=IllegalArgumentException.class)
+    public void throwsServiceExceptionsOnClient() {
+        service.getKeywordNames("not.registered.Library");
+    }
+
+    private Object readFrame(byte[] bytes) throws Exception {
+        return new BinaryCodec().readFrame(new DataInputStream(new ByteArrayInputStream(bytes)));
+    }
+
+    private Object roundTrip(Object value) throws Exception {
+        BinaryCodec codec = new BinaryCodec();
+        ByteArrayOutputStream bytes = new ByteArrayOutputStream();
+        codec.writeFrame(new DataOutputStream(bytes), value);
+        return codec.readFrame(new DataInputStream(new ByteArrayInputStream(bytes.toByteArray())));
+    }
+
+    public static class ByteArrayLibrary implements RobotJavaLibrary {
+        public String[] getKeywordNames() {
+            return new String[] { "screenshot" };
+        }
+
+        public Object runKeyword(String keywordName, Object[] args) {
+            return new byte[] { 1, 2, 3 };
+        }
+    }
+}
@@ -6,6 +6,7 @@ import jdave.junit4.JDaveRunner;
 import org.jmock.Expectations;
 import org.junit.runner.RunWith;
 import org.laughingpanda.beaninject.Inject;
+import org.robotframework.jvmconnector.common.KeywordCall;
 import org.robotframework.jvmconnector.common.KeywordExecutionResult;
 
 @RunWith(JDaveRunner.class)
@@ -42,6 +43,17 @@ public class CloseableRobotRmiServiceSpec extends Specification<CloseableRobotRm
             
             specify(context.runKeyword("someKeyword", new Object[] {"one", "two"}), results);
         }
+
+        public void runsKeywordsInBatch() {
+            final KeywordCall[] calls = new KeywordCall[] { new KeywordCall("someKeyword", new Object[0]) };
+            final KeywordExecutionResult[] results = new KeywordExecutionResult[0];
+            checking(new Expectations() {{
+                one(wrappedService).runKeywords(calls, true);
+                will(returnValue(results));
+             }});
+
+            specify(context.runKeywords(calls, true), results);
+        }
     }
     
     public class Exiting {
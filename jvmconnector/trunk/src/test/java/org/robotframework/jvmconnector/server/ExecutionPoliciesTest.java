@@ -0,0 +1,89 @@
+package org.robotframework.jvmconnector.server;
+
+import static org.junit.Assert.assertEquals;
+import static org.junit.Assert.assertSame;
+import static org.junit.Assert.assertTrue;
+
+import java.util.HashMap;
+import java.util.Map;
+import java.util.concurrent.Callable;
+import java.util.concurrent.CountDownLatch;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicInteger;
+
+import org.junit.Test;
+import org.robotframework.jvmconnector.common.KeywordExecutionResult;
+
+public class ExecutionPoliciesTest {
+    private Map<String, String> policies = new HashMap<String, String>();
+
+    @Test
+    public void librariesWithoutPolicyAreRunDirectly() {
+        assertTrue(new ExecutionPolicies(policies).createExecutor("SomeLib") instanceof DirectKeywordExecutor);
+    }
+
+    @Test
+    public void defaultPolicyIsUsedForLibrariesWithoutPolicy() {
+        policies.put(ExecutionPolicies.DEFAULT, "serial");
+        assertTrue(new ExecutionPolicies(policies).createExecutor("SomeLib") instanceof LimitedKeywordExecutor);
+    }
+
+    @Test
+    public void libraryPolicyOverridesDefault() {
+        policies.put(ExecutionPolicies.DEFAULT, "serial");
+        policies.put("SomeLib", "direct");
+        assertTrue(new ExecutionPolicies(policies).createExecutor("SomeLib") instanceof DirectKeywordExecutor);
+    }
+
+    @Test(expected=IllegalArgumentException.class)
+    public void unknownPoliciesAreRejected() {
+        policies.put("SomeLib", "parallel-many");
+        new ExecutionPolicies(policies);
+    }
+
+    @Test
+    public void librariesWithSameThreadNameShareTheThread() throws Exception {
+        policies.put("Lib1", "thread-swing");
+        policies.put("Lib2", "thread-swing");
+        ExecutionPolicies executionPolicies = new ExecutionPolicies(policies);
+        KeywordExecutor executor = executionPolicies.createExecutor("Lib1");
+        assertSame(executor, executionPolicies.createExecutor("Lib2"));
+        final String[] threadName = new String[1];
+        executor.execute(new Callable<KeywordExecutionResult>() {
+            public KeywordExecutionResult call() {
+                threadName[0] = Thread.currentThread().getName();
+                return null;
+            }
+        });
+        assertEquals("swing", threadName[0]);
+    }
+
+    @Test
+    public void parallelPolicyLimitsConcurrentKeywords() throws Exception {
+        policies.put("SomeLib", "parallel-2");
+        final KeywordExecutor executor = new ExecutionPolicies(policies).createExecutor("SomeLib");
+        final AtomicInteger running = new AtomicInteger();
+        final AtomicInteger maxRunning = new AtomicInteger();
+        final CountDownLatch done = new CountDownLatch(5);
+        for (int i = 0; i < 5; i++) {
+            new Thread() {
+                public void run() {
+                    executor.execute(new Callable<KeywordExecutionResult>() {
+                        public KeywordExecutionResult call() throws Exception {
+                            int current = running.incrementAndGet();
+                            synchronized (maxRunning) {
+                                maxRunning.set(Math.max(maxRunning.get(), current));
+                            }
+                            Thread.sleep(20);
+                            running.decrementAndGet();
+                            return null;
+                        }
+                    });
+                    done.countDown();
+                }
+            }.start();
+        }
+        assertTrue(done.await(5, TimeUnit.SECONDS));
+        assertTrue(maxRunning.get() <= 2);
+    }
+}
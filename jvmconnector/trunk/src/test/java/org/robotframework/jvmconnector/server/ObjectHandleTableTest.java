@@ -0,0 +1,126 @@
+package org.robotframework.jvmconnector.server;
+
+import static org.junit.Assert.assertArrayEquals;
+import static org.junit.Assert.assertEquals;
+import static org.junit.Assert.assertSame;
+import static org.junit.Assert.assertFalse;
+import static org.junit.Assert.assertTrue;
+import static org.junit.Assert.fail;
+
+import java.util.Arrays;
+
+import org.junit.Test;
+import org.robotframework.jvmconnector.common.ObjectHandle;
+
+public class ObjectHandleTableTest {
+    private ObjectHandleTable table = new ObjectHandleTable("all", 2);
+
+    @Test
+    public void simpleValuesAreReturnedAsTheyAre() {
+        assertEquals("value", table.toReturnValue("value"));
+        assertEquals(new Integer(1), table.toReturnValue(new Integer(1)));
+        assertTrue(table.toReturnValue(new String[] { "a" }) instanceof String[]);
+        assertEquals(null, table.toReturnValue(null));
+    }
+
+    @Test
+    public void valuesAreNotKeptByDefault() {
+        ObjectHandleTable defaultTable = new ObjectHandleTable();
+        Object value = new Object();
+        assertSame(value, defaultTable.toReturnValue(value));
+    }
+
+    @Test
+    public void onlyNonSerializableValuesAreKeptWithNonSerializablePolicy() {
+        ObjectHandleTable nonSerializableTable = new ObjectHandleTable("nonserializable");
+        assertTrue(nonSerializableTable.toReturnValue(new StringBuilder()) instanceof StringBuilder);
+        assertTrue(nonSerializableTable.toReturnValue(new Object()) instanceof ObjectHandle);
+    }
+
+    @Test
+    public void onlyHandlesAreResolvedInArguments() {
+        Object value = new Object();
+        ObjectHandle handle = (ObjectHandle) table.toReturnValue(value);
+        Object[] resolved = table.resolveArguments(new Object[] { handle, handle.getId(), "other" });
+        assertSame(value, resolved[0]);
+        assertEquals(handle.getId(), resolved[1]);
+        assertEquals("other", resolved[2]);
+    }
+
+    @Test(expected=IllegalArgumentException.class)
+    public void leastRecentlyUsedObjectsAreEvicted() {
+        ObjectHandle first = (ObjectHandle) table.toReturnValue(new Object());
+        table.toReturnValue(new Object());
+        table.toReturnValue(new Object());
+        table.get(first);
+    }
+
+    @Test
+    public void fieldsAreReadWithGettersAndPublicFields() {
+        ObjectHandle handle = (ObjectHandle) table.toReturnValue(new Bean());
+        assertEquals("bean", table.getField(handle, "name"));
+        assertEquals(Boolean.TRUE, table.getField(handle, "visible"));
+        assertEquals(new Integer(3), table.getField(handle, "count"));
+    }
+
+    @Test
+    public void otherMethodsAreNotCalledAsFields() {
+        Bean bean = new Bean();
+        ObjectHandle handle = (ObjectHandle) table.toReturnValue(bean);
+        try {
+            table.getField(handle, "close");
+            fail();
+        } catch (IllegalArgumentException e) {
+            assertFalse(bean.closed);
+        }
+    }
+
+    @Test(expected=IllegalArgumentException.class)
+    public void emptyFieldNamesAreRejected() {
+        table.getField((ObjectHandle) table.toReturnValue(new Bean()), "");
+    }
+
+    @Test
+    public void handleIdsAreResolvedWhenAskedExplicitly() {
+        Object value = new Object();
+        ObjectHandle handle = (ObjectHandle) table.toReturnValue(value);
+        Object[] resolved = table.resolveHandleIds(new Object[] { handle.getId(), "other" });
+        assertSame(value, resolved[0]);
+        assertEquals("other", resolved[1]);
+    }
+
+    @Test
+    public void slicesAreReturnedFromLists() {
+        ObjectHandle handle = (ObjectHandle) table.toReturnValue(Arrays.asList("a", "b", "c"));
+        assertArrayEquals(new Object[] { "b", "c" }, table.getSlice(handle, 1, 5));
+    }
+
+    @Test(expected=IllegalArgumentException.class)
+    public void slicesWithNegativeStartAreRejected() {
+        ObjectHandle handle = (ObjectHandle) table.toReturnValue(Arrays.asList("a", "b", "c"));
+        table.getSlice(handle, -1, 2);
+    }
+
+    @Test
+    public void handlesAreFoundByTheirId() {
+        ObjectHandle handle = (ObjectHandle) table.toReturnValue(Arrays.asList("a", "b", "c"));
+        assertEquals(Boolean.FALSE, table.getField(new ObjectHandle(handle.getId(), null), "empty"));
+    }
+
+    public static class Bean {
+        public int count = 3;
+        boolean closed = false;
+
+        public String getName() {
+            return "bean";
+        }
+
+        public boolean isVisible() {
+            return true;
+        }
+
+        public void close() {
+            closed = true;
+        }
+    }
+}
@@ -0,0 +1,90 @@
+package org.robotframework.jvmconnector.server;
+
+import static org.junit.Assert.assertArrayEquals;
+import static org.junit.Assert.assertEquals;
+import static org.junit.Assert.assertFalse;
+import static org.junit.Assert.assertTrue;
+
+import java.io.File;
+
+import org.junit.Test;
+import org.robotframework.jvmconnector.common.ObjectHandle;
+
+public class PayloadStoreTest {
+    private ObjectHandleTable objectHandles = new ObjectHandleTable("all", 2);
+    private PayloadStore payloads = new PayloadStore(objectHandles);
+
+    @Test
+    public void uploadedChunksAreReadBack() {
+        ObjectHandle handle = payloads.createPayload(null);
+        payloads.appendChunk(handle, new byte[] { 1, 2, 3 });
+        payloads.appendChunk(handle, new byte[] { 4, 5 });
+        assertEquals(5, payloads.getSize(handle));
+        assertArrayEquals(new byte[] { 2, 3, 4 }, payloads.readChunk(handle, 1, 3));
+        assertArrayEquals(new byte[] { 5 }, payloads.readChunk(handle, 4, 3));
+        assertArrayEquals(new byte[0], payloads.readChunk(handle, 5, 3));
+    }
+
+    @Test
+    public void uploadedPayloadIsGivenToKeywordsAsFile() {
+        ObjectHandle handle = payloads.createPayload(null);
+        Object argument = objectHandles.resolveArguments(new Object[] { handle })[0];
+        assertTrue(argument instanceof File);
+    }
+
+    @Test
+    public void byteArraysAreReadInChunksAndWrittenToFileForPath() {
+        ObjectHandle handle = objectHandles.keep(new byte[] { 1, 2, 3 });
+        assertArrayEquals(new byte[] { 1, 2 }, payloads.readChunk(handle, 0, 2));
+        assertEquals(3, new File(payloads.getPath(handle)).length());
+    }
+
+    @Test
+    public void releasingDeletesTemporaryFile() {
+        ObjectHandle handle = payloads.createPayload(null);
+        File file = new File(payloads.getPath(handle));
+        payloads.release(handle);
+        assertFalse(file.exists());
+    }
+
+    @Test
+    public void uploadedPayloadsAreNotEvicted() {
+        ObjectHandle handle = payloads.createPayload(null);
+        for (int i = 0; i < 3; i++)
+            objectHandles.toReturnValue(new Object());
+        payloads.appendChunk(handle, new byte[] { 1 });
+        assertEquals(1, payloads.getSize(handle));
+    }
+
+    @Test
+    public void pathOfByteArrayIsReusedAndDeletedOnRelease() {
+        ObjectHandle handle = payloads.keepResult(new byte[] { 1, 2, 3 });
+        String path = payloads.getPath(handle);
+        assertEquals(path, payloads.getPath(handle));
+        payloads.release(handle);
+        assertFalse(new File(path).exists());
+    }
+
+    @Test
+    public void pathOfEvictedByteArrayIsDeleted() {
+        ObjectHandle handle = objectHandles.keep(new byte[] { 1, 2, 3 });
+        File file = new File(payloads.getPath(handle));
+        for (int i = 0; i < 3; i++)
+            objectHandles.toReturnValue(new Object());
+        payloads.createPayload(null);
+        assertFalse(file.exists());
+    }
+
+    @Test
+    public void keptResultsAreMovedToPayloads() {
+        ObjectHandle kept = objectHandles.keep(new byte[] { 1, 2, 3 });
+        ObjectHandle handle = payloads.keepResult(kept);
+        assertFalse(objectHandles.contains(kept));
+        assertEquals(3, payloads.getSize(handle));
+    }
+
+    @Test(expected=IllegalArgumentException.class)
+    public void onlyFilesAndByteArraysAreKeptAsPayloads() {
+        payloads.keepResult("not a payload");
+    }
+}
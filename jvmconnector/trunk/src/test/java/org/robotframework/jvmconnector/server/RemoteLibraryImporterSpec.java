@@ -0,0 +1,89 @@
+package org.robotframework.jvmconnector.server;
+
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.atomic.AtomicInteger;
+
+import jdave.Specification;
+import jdave.junit4.JDaveRunner;
+
+import org.junit.runner.RunWith;
+import org.robotframework.jvmconnector.common.KeywordCall;
+import org.robotframework.jvmconnector.common.KeywordExecutionResult;
+import org.robotframework.javalib.library.RobotJavaLibrary;
+import org.robotframework.jvmconnector.mocks.MockJavaLibrary;
+
+@RunWith(JDaveRunner.class)
+public class RemoteLibraryImporterSpec extends Specification<RemoteLibraryImporter> {
+    private String libraryName = MockJavaLibrary.class.getName();
+
+    public class WithRegisteredLibrary {
+        public RemoteLibraryImporter create() {
+            RemoteLibraryImporter importer = new RemoteLibraryImporter(1099, new RmiServicePublisher());
+            importer.registerLibrary(libraryName);
+            return importer;
+        }
+
+        public void hasKeywordsOfRegisteredLibrary() {
+            specify(context.getKeywordNames(libraryName), containsAll("concatenatingKeyword", "systemexit"));
+        }
+
+        public void runsKeywordOfRegisteredLibrary() {
+            KeywordExecutionResult result = context.runKeyword(libraryName, "concatenatingKeyword", new Object[] { "one", "two" });
+            specify(result.getResult(), "onetwo");
+        }
+
+        public void runsKeywordsOfRegisteredLibraryInBatch() {
+            KeywordCall[] calls = new KeywordCall[] {
+                new KeywordCall("concatenatingKeyword", new Object[] { "one", "two" }),
+                new KeywordCall("concatenatingKeyword", new Object[] { "three" }) };
+            specify(context.runKeywords(libraryName, calls, true).length, 2);
+        }
+
+        public void doesNotReplaceLibraryWhenRegisteredAgain() {
+            String[] keywordNames = context.getKeywordNames(libraryName);
+            context.registerLibrary(libraryName);
+            specify(context.getKeywordNames(libraryName), containsExactly((Object[]) keywordNames));
+        }
+    }
+
+    public class WhenRegisteredConcurrently {
+        public RemoteLibraryImporter create() {
+            CountingLibrary.instances.set(0);
+            return new RemoteLibraryImporter(1099, new RmiServicePublisher());
+        }
+
+        public void instantiatesLibraryOnlyOnce() throws InterruptedException {
+            List<Thread> threads = new ArrayList<Thread>();
+            for (int i = 0; i < 5; i++) {
+                threads.add(new Thread() {
+                    public void run() {
+                        context.registerLibrary(CountingLibrary.class.getName());
+                    }
+                });
+            }
+            for (Thread thread : threads)
+                thread.start();
+            for (Thread thread : threads)
+                thread.join();
+            specify(CountingLibrary.instances.get(), 1);
+        }
+    }
+
+    public static class CountingLibrary implements RobotJavaLibrary {
+        static final AtomicInteger instances = new AtomicInteger();
+
+        public CountingLibrary() throws InterruptedException {
+            instances.incrementAndGet();
+            Thread.sleep(50);
+        }
+
+        public String[] getKeywordNames() {
+            return new String[0];
+        }
+
+        public Object runKeyword(String keywordName, Object[] args) {
+            return null;
+        }
+    }
+}
@@ -1,9 +1,19 @@
 package org.robotframework.jvmconnector.server;
 
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Collections;
+import java.util.List;
+import java.util.concurrent.CountDownLatch;
+import java.util.concurrent.TimeUnit;
+
 import org.jmock.Mock;
+import org.jmock.core.Invocation;
+import org.jmock.core.stub.CustomStub;
 import org.jmock.cglib.MockObjectTestCase;
 import org.robotframework.javalib.library.RobotJavaLibrary;
 import org.robotframework.javalib.util.StdStreamRedirecter;
+import org.robotframework.jvmconnector.common.KeywordCall;
 import org.robotframework.jvmconnector.common.KeywordExecutionResult;
 import org.robotframework.jvmconnector.mocks.ExceptionThrowingKeyword;
 import org.robotframework.jvmconnector.mocks.LoggingKeyword;
@@ -129,6 +139,200 @@ public class SimpleRobotRmiServerTest extends MockObjectTestCase {
 		assertEquals(MockException.class.getName(), executionResult.getTestFailedException().getSourceExceptionClassName());
 	}
 	
+	public void testRunsKeywordsInBatch() {
+		mockJavaLibrary.expects(exactly(2)).method("runKeyword")
+			.with(same(keywordName), same(keywordArguments))
+			.will(returnValue(keywordReturnValue));
+
+		KeywordExecutionResult[] results = robotRmiService.runKeywords(createKeywordCalls(2), true);
+		assertEquals(2, results.length);
+		assertEquals(keywordReturnValue, results[1].getResult());
+	}
+
+	public void testStopsBatchOnFirstFailureWhenRequested() {
+		mockJavaLibrary.expects(once()).method("runKeyword")
+			.will(throwException(new RuntimeException()));
+
+		KeywordExecutionResult[] results = robotRmiService.runKeywords(createKeywordCalls(3), true);
+		assertEquals(1, results.length);
+		assertFalse(results[0].keywordPassed());
+	}
+
+	public void testContinuesBatchAfterFailureWhenRequested() {
+		mockJavaLibrary.expects(exactly(3)).method("runKeyword")
+			.will(throwException(new RuntimeException()));
+
+		KeywordExecutionResult[] results = robotRmiService.runKeywords(createKeywordCalls(3), false);
+		assertEquals(3, results.length);
+	}
+
+	public void testInterruptsKeywordThatDoesNotFinishInTime() {
+		mockJavaLibrary.expects(once()).method("runKeyword")
+			.will(new CustomStub("sleeps") {
+				public Object invoke(Invocation invocation) throws Throwable {
+					Thread.sleep(10000);
+					return null;
+				}
+			});
+
+		KeywordExecutionResult result = robotRmiService.runKeywordWithTimeout(keywordName, keywordArguments, 100);
+		assertTrue(result.keywordTimedOut());
+		assertEquals(KeywordTimeoutException.class.getName(), result.getTestFailedException().getSourceExceptionClassName());
+		assertTrue(result.getTestFailedException().getStackTraceAsString().indexOf("sleep") > 0);
+	}
+
+	public void testTimedOutKeywordContainsOutputPrintedBeforeTimeout() {
+		SimpleRobotRmiService service = new SimpleRobotRmiService();
+		service.setLibrary(new RobotJavaLibrary() {
+			public String[] getKeywordNames() {
+				return new String[0];
+			}
+
+			public Object runKeyword(String name, Object[] args) {
+				System.out.print("before hang");
+				System.err.print("error before hang");
+				try {
+					Thread.sleep(10000);
+				} catch (InterruptedException e) {
+					throw new RuntimeException(e);
+				}
+				return null;
+			}
+		});
+
+		KeywordExecutionResult result = service.runKeywordWithTimeout(keywordName, keywordArguments, 500);
+		assertTrue(result.keywordTimedOut());
+		assertEquals("before hang", result.getStdOutAsString());
+		assertEquals("error before hang", result.getStdErrAsString());
+	}
+
+	public void testKeywordQueuedPastItsTimeoutIsNeverRunInLimitedExecutor() throws Exception {
+		assertQueuedKeywordIsNotRunAfterTimeout(new LimitedKeywordExecutor(1));
+	}
+
+	public void testKeywordQueuedPastItsTimeoutIsNeverRunInThreadExecutor() throws Exception {
+		assertQueuedKeywordIsNotRunAfterTimeout(new ThreadKeywordExecutor("keyword thread"));
+	}
+
+	private void assertQueuedKeywordIsNotRunAfterTimeout(KeywordExecutor executor) throws Exception {
+		final CountDownLatch blocked = new CountDownLatch(1);
+		final CountDownLatch release = new CountDownLatch(1);
+		final List<String> executed = Collections.synchronizedList(new ArrayList<String>());
+		robotRmiService.setKeywordExecutor(executor);
+		robotRmiService.setLibrary(new RobotJavaLibrary() {
+			public String[] getKeywordNames() {
+				return new String[0];
+			}
+
+			public Object runKeyword(String name, Object[] args) {
+				executed.add(name);
+				if ("blocking".equals(name)) {
+					blocked.countDown();
+					try {
+						release.await();
+					} catch (InterruptedException e) {
+						throw new RuntimeException(e);
+					}
+				}
+				return null;
+			}
+		});
+
+		String handle = robotRmiService.startKeyword("blocking", keywordArguments);
+		assertTrue(blocked.await(5, TimeUnit.SECONDS));
+		assertTrue(robotRmiService.runKeywordWithTimeout("queued", keywordArguments, 100).keywordTimedOut());
+		release.countDown();
+		assertTrue(robotRmiService.waitForKeyword(handle, 5000).keywordPassed());
+		Thread.sleep(200);
+		assertEquals(Arrays.asList("blocking"), executed);
+	}
+
+	public void testReturnsResultOfKeywordFinishingInTime() {
+		mockJavaLibrary.expects(once()).method("runKeyword")
+			.will(returnValue(keywordReturnValue));
+
+		KeywordExecutionResult result = robotRmiService.runKeywordWithTimeout(keywordName, keywordArguments, 5000);
+		assertFalse(result.keywordTimedOut());
+		assertEquals(keywordReturnValue, result.getResult());
+	}
+
+	public void testRetriesKeywordUntilItSucceeds() {
+		mockJavaLibrary.expects(exactly(3)).method("runKeyword")
+			.will(onConsecutiveCalls(throwException(new RuntimeException()),
+			                         throwException(new RuntimeException()),
+			                         returnValue(keywordReturnValue)));
+
+		KeywordExecutionResult result = robotRmiService.runKeywordUntilSucceeds(keywordName, keywordArguments, 5000, 1);
+		assertTrue(result.keywordPassed());
+		assertEquals(keywordReturnValue, result.getResult());
+		assertEquals(3, result.getAttempts());
+	}
+
+	public void testReturnsLastFailureWhenTimeoutIsExceeded() {
+		mockJavaLibrary.stubs().method("runKeyword")
+			.will(throwException(new MockException()));
+
+		KeywordExecutionResult result = robotRmiService.runKeywordUntilSucceeds(keywordName, keywordArguments, 50, 10);
+		assertFalse(result.keywordPassed());
+		assertTrue(result.getAttempts() > 1);
+	}
+
+	public void testStartedKeywordsCanBeWaitedFor() {
+		mockJavaLibrary.expects(once()).method("runKeyword")
+			.with(same(keywordName), same(keywordArguments))
+			.will(returnValue(keywordReturnValue));
+
+		String handle = robotRmiService.startKeyword(keywordName, keywordArguments);
+		assertEquals(keywordReturnValue, robotRmiService.waitForKeyword(handle, 5000).getResult());
+	}
+
+	public void testWaitingForUnknownKeywordFails() {
+		try {
+			robotRmiService.waitForKeyword("unknown", 0);
+			fail();
+		} catch (IllegalArgumentException e) {
+			assertEquals("No started keyword with handle 'unknown'", e.getMessage());
+		}
+	}
+
+	public void testReleasedKeywordIsInterruptedAndCannotBeWaitedFor() throws Exception {
+		final CountDownLatch started = new CountDownLatch(1);
+		final CountDownLatch interrupted = new CountDownLatch(1);
+		robotRmiService.setLibrary(new RobotJavaLibrary() {
+			public String[] getKeywordNames() {
+				return new String[0];
+			}
+
+			public Object runKeyword(String name, Object[] args) {
+				started.countDown();
+				try {
+					Thread.sleep(10000);
+				} catch (InterruptedException e) {
+					interrupted.countDown();
+				}
+				return null;
+			}
+		});
+
+		String handle = robotRmiService.startKeyword(keywordName, keywordArguments);
+		assertTrue(started.await(5, TimeUnit.SECONDS));
+		robotRmiService.releaseKeyword(handle);
+		assertTrue(interrupted.await(5, TimeUnit.SECONDS));
+		try {
+			robotRmiService.waitForKeyword(handle, 0);
+			fail();
+		} catch (IllegalArgumentException e) {
+			assertEquals("No started keyword with handle '" + handle + "'", e.getMessage());
+		}
+	}
+
+	private KeywordCall[] createKeywordCalls(int count) {
+		KeywordCall[] calls = new KeywordCall[count];
+		for (int i = 0; i < count; i++)
+			calls[i] = new KeywordCall(keywordName, keywordArguments);
+		return calls;
+	}
+
 	private KeywordExecutionResult executeMockKeyword(String mockKeywordName) {
 		SimpleRobotRmiService tmpRmiService = new SimpleRobotRmiService();
 		tmpRmiService.setLibrary(new MockJavaLibrary());
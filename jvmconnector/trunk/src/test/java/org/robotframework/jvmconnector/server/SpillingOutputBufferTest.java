@@ -0,0 +1,50 @@
+package org.robotframework.jvmconnector.server;
+
+import static org.junit.Assert.assertEquals;
+
+import org.junit.After;
+import org.junit.Test;
+
+public class SpillingOutputBufferTest {
+    private SpillingOutputBuffer buffer = new SpillingOutputBuffer(8);
+
+    @After
+    public void closeBuffer() {
+        buffer.close();
+    }
+
+    @Test
+    public void readsOnlyNewOutput() throws Exception {
+        buffer.write("foo".getBytes("utf-8"));
+        assertEquals("foo", buffer.readNew());
+        buffer.write("bar".getBytes("utf-8"));
+        assertEquals("bar", buffer.readNew());
+        assertEquals("", buffer.readNew());
+    }
+
+    @Test
+    public void outputOverMemoryLimitIsSpilledToFile() throws Exception {
+        buffer.write("1234".getBytes("utf-8"));
+        buffer.write("5678".getBytes("utf-8"));
+        buffer.write("9abc".getBytes("utf-8"));
+        buffer.write("def".getBytes("utf-8"));
+        assertEquals("12345678", buffer.readNew());
+        assertEquals("9abcdef", buffer.readNew());
+        buffer.write("after".getBytes("utf-8"));
+        assertEquals("after", buffer.readNew());
+    }
+
+    @Test
+    public void readsDoNotSplitCharacters() throws Exception {
+        buffer.write("1234567\u00e4\u00e4".getBytes("utf-8"));
+        assertEquals("1234567", buffer.readNew());
+        assertEquals("\u00e4\u00e4", buffer.readNew());
+    }
+
+    @Test
+    public void outputOverLimitIsTruncatedWhenReadingTheRest() throws Exception {
+        buffer.write("123456789abcdef".getBytes("utf-8"));
+        assertEquals("12345678\n[7 bytes of output truncated]\n", buffer.readRest());
+        assertEquals("", buffer.readNew());
+    }
+}
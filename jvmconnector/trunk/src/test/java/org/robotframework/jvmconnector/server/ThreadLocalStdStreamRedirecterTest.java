@@ -0,0 +1,174 @@
+package org.robotframework.jvmconnector.server;
+
+import static org.junit.Assert.assertEquals;
+import static org.junit.Assert.assertNull;
+
+import java.io.ByteArrayOutputStream;
+import java.io.PrintStream;
+import java.util.concurrent.CountDownLatch;
+
+import org.junit.After;
+import org.junit.Test;
+
+public class ThreadLocalStdStreamRedirecterTest {
+    private ThreadLocalStdStreamRedirecter redirecter = new ThreadLocalStdStreamRedirecter();
+
+    @After
+    public void resetStreams() {
+        redirecter.resetStdStreams();
+    }
+
+    @Test
+    public void capturesOutputOfCurrentThread() {
+        redirecter.redirectStdStreams();
+        System.out.println("out");
+        System.err.print("err");
+        assertEquals("out\n", redirecter.getStdOutAsString().replace("\r\n", "\n"));
+        assertEquals("err", redirecter.getStdErrAsString());
+        assertEquals("", redirecter.getStdOutAsString());
+    }
+
+    @Test
+    public void concurrentThreadsGetTheirOwnOutput() throws Exception {
+        final CountDownLatch bothRedirected = new CountDownLatch(2);
+        final String[] outputs = new String[2];
+        Thread[] threads = new Thread[2];
+        for (int i = 0; i < threads.length; i++) {
+            final int index = i;
+            threads[i] = new Thread() {
+                public void run() {
+                    redirecter.redirectStdStreams();
+                    bothRedirected.countDown();
+                    try {
+                        bothRedirected.await();
+                    } catch (InterruptedException e) {
+                        throw new RuntimeException(e);
+                    }
+                    for (int j = 0; j < 100; j++)
+                        System.out.print(index);
+                    outputs[index] = redirecter.getStdOutAsString();
+                    redirecter.resetStdStreams();
+                }
+            };
+            threads[i].start();
+        }
+        for (Thread thread : threads)
+            thread.join();
+        assertEquals(repeat("0", 100), outputs[0]);
+        assertEquals(repeat("1", 100), outputs[1]);
+    }
+
+    @Test
+    public void otherThreadsWriteToOriginalStreams() throws Exception {
+        Thread other = new Thread() {
+            public void run() {
+                System.out.print("not captured");
+            }
+        };
+        redirecter.redirectStdStreams();
+        other.start();
+        other.join();
+        assertEquals("", redirecter.getStdOutAsString());
+    }
+
+    @Test
+    public void outputOfRunningThreadCanBeReadFromOtherThreads() throws Exception {
+        final CountDownLatch written = new CountDownLatch(1);
+        final CountDownLatch read = new CountDownLatch(1);
+        final String[] remaining = new String[1];
+        Thread keyword = new Thread() {
+            public void run() {
+                redirecter.redirectStdStreams();
+                System.out.print("first");
+                written.countDown();
+                try {
+                    read.await();
+                } catch (InterruptedException e) {
+                    throw new RuntimeException(e);
+                }
+                System.out.print("second");
+                remaining[0] = redirecter.getStdOutAsString();
+                redirecter.resetStdStreams();
+            }
+        };
+        keyword.start();
+        written.await();
+        assertEquals("first", redirecter.readNewOutput(keyword)[0]);
+        read.countDown();
+        keyword.join();
+        assertEquals("second", remaining[0]);
+        assertNull(redirecter.readNewOutput(keyword));
+    }
+
+    @Test
+    public void threadsStartedWhileCapturingAreCapturedUntilReset() throws Exception {
+        ByteArrayOutputStream original = new ByteArrayOutputStream();
+        PrintStream systemOut = replaceSystemOut(original);
+        try {
+            final CountDownLatch written = new CountDownLatch(1);
+            final CountDownLatch reset = new CountDownLatch(1);
+            redirecter.redirectStdStreams();
+            Thread child = new Thread() {
+                public void run() {
+                    System.out.print("during");
+                    written.countDown();
+                    try {
+                        reset.await();
+                    } catch (InterruptedException e) {
+                        throw new RuntimeException(e);
+                    }
+                    System.out.print("after");
+                }
+            };
+            child.start();
+            written.await();
+            assertEquals("during", redirecter.getStdOutAsString());
+            redirecter.resetStdStreams();
+            reset.countDown();
+            child.join();
+            assertEquals("after", original.toString());
+        } finally {
+            System.setOut(systemOut);
+        }
+    }
+
+    @Test
+    public void captureContinuesWhenSystemOutIsReplaced() throws Exception {
+        ByteArrayOutputStream replacement = new ByteArrayOutputStream();
+        redirecter.redirectStdStreams();
+        PrintStream systemOut = replaceSystemOut(replacement);
+        try {
+            Thread other = new Thread() {
+                public void run() {
+                    redirecter.redirectStdStreams();
+                    redirecter.resetStdStreams();
+                }
+            };
+            other.start();
+            other.join();
+            System.out.print("captured");
+            assertEquals("captured", redirecter.getStdOutAsString());
+            redirecter.resetStdStreams();
+            System.out.print("not captured");
+            assertEquals("not captured", replacement.toString());
+        } finally {
+            System.setOut(systemOut);
+        }
+    }
+
+    // Returns the stream to restore, which is never the dispatcher itself
+    private PrintStream replaceSystemOut(ByteArrayOutputStream output) {
+        PrintStream systemOut = System.out;
+        if (systemOut instanceof ThreadDispatchingPrintStream)
+            systemOut = ((ThreadDispatchingPrintStream) systemOut).getDefaultStream();
+        System.setOut(new PrintStream(output, true));
+        return systemOut;
+    }
+
+    private String repeat(String value, int times) {
+        StringBuilder result = new StringBuilder();
+        for (int i = 0; i < times; i++)
+            result.append(value);
+        return result.toString();
+    }
+}
@@ -3,6 +3,8 @@ package org.robotframework.jvmconnector.xmlrpc;
 import static org.junit.Assert.assertEquals;
 import static org.junit.Assert.assertTrue;
 
+import java.util.Map;
+
 import org.junit.Test;
 import org.robotframework.javalib.library.RobotJavaLibrary;
 
@@ -19,4 +21,50 @@ public class CloseableLibraryDecoratorTest {
                      keywordNames[0]);
         assertTrue("There should be only 1 keyword!", keywordNames.length == 1);
     }
+
+    @Test
+    public void keywordMetadataIsReadOnce() {
+        DocumentedLibrary library = new DocumentedLibrary();
+        CloseableLibraryDecorator libDecor = new CloseableLibraryDecorator(library);
+        libDecor.getKeywordArguments("foo");
+        libDecor.getKeywordDocumentation("foo");
+        assertEquals("arg", libDecor.getKeywordArguments("foo")[0]);
+        assertEquals("Does foo.", libDecor.getKeywordDocumentation("foo"));
+        assertEquals(1, library.queries);
+    }
+
+    @Test
+    public void librarySpecContainsAllKeywords() {
+        Object[] spec = new CloseableLibraryDecorator(new DocumentedLibrary()).getLibrarySpec();
+        assertEquals(2, spec.length);
+        Map<?, ?> foo = (Map<?, ?>) spec[0];
+        assertEquals("foo", foo.get("name"));
+        assertEquals("arg", ((String[]) foo.get("args"))[0]);
+        assertEquals("Does foo.", foo.get("doc"));
+        Map<?, ?> close = (Map<?, ?>) spec[1];
+        assertEquals(CloseableLibraryDecorator.KEYWORD_CLOSE_APPLICATION, close.get("name"));
+        assertEquals(0, ((String[]) close.get("args")).length);
+        assertEquals("", close.get("doc"));
+    }
+
+    public static class DocumentedLibrary implements RobotLibrary {
+        private int queries;
+
+        public Object runKeyword(String keywordName, Object[] args) {
+            return null;
+        }
+
+        public String[] getKeywordNames() {
+            return new String[] { "foo" };
+        }
+
+        public String[] getKeywordArguments(String keywordName) {
+            queries++;
+            return new String[] { "arg" };
+        }
+
+        public String getKeywordDocumentation(String keywordName) {
+            return "Does " + keywordName + ".";
+        }
+    }
 }
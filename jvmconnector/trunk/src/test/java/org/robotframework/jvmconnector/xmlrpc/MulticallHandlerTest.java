@@ -0,0 +1,70 @@
+package org.robotframework.jvmconnector.xmlrpc;
+
+import static org.junit.Assert.assertEquals;
+
+import java.util.HashMap;
+import java.util.Map;
+
+import org.apache.xmlrpc.XmlRpcException;
+import org.apache.xmlrpc.XmlRpcHandler;
+import org.apache.xmlrpc.XmlRpcRequest;
+import org.apache.xmlrpc.XmlRpcRequestConfig;
+import org.junit.Test;
+
+public class MulticallHandlerTest {
+    private Map<String, XmlRpcHandler> handlers = new HashMap<String, XmlRpcHandler>();
+    private MulticallHandler multicall = new MulticallHandler(handlers);
+
+    @Test
+    public void resultsAreReturnedInOrder() throws Exception {
+        handlers.put("echo", new XmlRpcHandler() {
+            public Object execute(XmlRpcRequest req) {
+                return req.getParameter(0);
+            }
+        });
+        Object[] results = (Object[]) multicall.execute(request(call("echo", "first"), call("echo", "second")));
+        assertEquals("first", ((Object[]) results[0])[0]);
+        assertEquals("second", ((Object[]) results[1])[0]);
+    }
+
+    @Test
+    public void failuresAreReturnedAsFaults() throws Exception {
+        handlers.put("fail", new XmlRpcHandler() {
+            public Object execute(XmlRpcRequest req) throws XmlRpcException {
+                throw new XmlRpcException(42, "failed");
+            }
+        });
+        Object[] results = (Object[]) multicall.execute(request(call("fail"), call("unknown")));
+        assertEquals(42, ((Map<?, ?>) results[0]).get("faultCode"));
+        assertEquals("failed", ((Map<?, ?>) results[0]).get("faultString"));
+        assertEquals("Method 'unknown' cannot be called with system.multicall",
+            ((Map<?, ?>) results[1]).get("faultString"));
+    }
+
+    private Map<String, Object> call(String methodName, Object... params) {
+        Map<String, Object> call = new HashMap<String, Object>();
+        call.put("methodName", methodName);
+        call.put("params", params);
+        return call;
+    }
+
+    private XmlRpcRequest request(final Object... calls) {
+        return new XmlRpcRequest() {
+            public XmlRpcRequestConfig getConfig() {
+                return null;
+            }
+
+            public String getMethodName() {
+                return "system.multicall";
+            }
+
+            public int getParameterCount() {
+                return 1;
+            }
+
+            public Object getParameter(int index) {
+                return calls;
+            }
+        };
+    }
+}
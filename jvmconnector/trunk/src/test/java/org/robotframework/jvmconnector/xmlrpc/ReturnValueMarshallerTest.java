@@ -0,0 +1,57 @@
+package org.robotframework.jvmconnector.xmlrpc;
+
+import static org.junit.Assert.assertArrayEquals;
+import static org.junit.Assert.assertEquals;
+import static org.junit.Assert.assertSame;
+
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Collections;
+import java.util.List;
+import java.util.Map;
+
+import org.junit.Test;
+
+public class ReturnValueMarshallerTest {
+    private ReturnValueMarshaller marshaller = new ReturnValueMarshaller(10);
+
+    @Test
+    public void nativeValuesAreReturnedAsTheyAre() {
+        byte[] bytes = new byte[] { 1, 2 };
+        assertSame(bytes, marshaller.marshal(bytes));
+        assertEquals(Boolean.TRUE, marshaller.marshal(true));
+        assertEquals("", marshaller.marshal(null));
+    }
+
+    @Test
+    public void numbersAreWidenedOrConvertedToStrings() {
+        assertEquals(3, marshaller.marshal((short) 3));
+        assertEquals(3, marshaller.marshal(3L));
+        assertEquals("9999999999", marshaller.marshal(9999999999L));
+        assertEquals(1.5, marshaller.marshal(1.5f));
+    }
+
+    @Test
+    public void containersAreConverted() {
+        assertArrayEquals(new Object[] { 1, 2 }, (Object[]) marshaller.marshal(new int[] { 1, 2 }));
+        assertArrayEquals(new Object[] { "a", "" }, (Object[]) marshaller.marshal(Arrays.asList("a", null)));
+        Map<?, ?> struct = (Map<?, ?>) marshaller.marshal(Collections.singletonMap(1, 2L));
+        assertEquals(2, struct.get("1"));
+    }
+
+    @Test
+    public void recursionIsReplacedWithString() {
+        List<Object> list = new ArrayList<Object>();
+        list.add("item");
+        list.add(list);
+        Object[] result = (Object[]) marshaller.marshal(list);
+        assertEquals("item", result[0]);
+        assertEquals("<recursive java.util.ArrayList>", result[1]);
+    }
+
+    @Test
+    public void valuesWithTooManyElementsAreReturnedAsStrings() {
+        assertEquals("[1, 2, 3, 4, 5, 6, 7, 8, 9, 10]",
+            marshaller.marshal(Arrays.asList(1, 2, 3, 4, 5, 6, 7, 8, 9, 10)));
+    }
+}
@@ -23,12 +23,19 @@ class TestApplicationLauncherStartingApplication(unittest.TestCase):
         self.rmi_launcher.application_started = self._fake_application_started
         self.os_library = _FakeOperatingSystemLibrary()
         self.rmi_launcher.operating_system = self.os_library
+        self.listener = _FakeRmiInfoListener()
+        self.rmi_launcher._create_rmi_info_listener = lambda: self.listener
 
     def test_starts_application(self):
         self.rmi_launcher.start_application()
         assert_equals(self._get_expected_command(), self.os_library.command)
         assert_true(self.application_started)
 
+    def test_waits_for_announced_rmi_url(self):
+        self.rmi_launcher.start_application()
+        assert_equals(60000, self.listener.timeout)
+        assert_equals('rmi://someservice', self.rmi_launcher._announced_rmi_url)
+
     def tests_passes_arguments(self):
         self.rmi_launcher.start_application('one two three', '-Done=two -Dthree=four')
         expected_command = self._get_expected_command('one two three', '-Done=two -Dthree=four')
@@ -37,7 +44,7 @@ class TestApplicationLauncherStartingApplication(unittest.TestCase):
     def _get_expected_command(self, args='', jvm_args=''):
         current_pythonpath = self._get_current_pythonpath()
         script_path = self._get_path_to_script()
-        template = 'jython -Dpython.path="%s" %s "%s" %s %s 1>out 2>err'
+        template = 'jython -Dpython.path="%s" -Drobot.jvmconnector.notify=12345 %s "%s" %s %s 1>out 2>err'
         return template % (current_pythonpath, jvm_args, script_path,
                            application, args)
 
@@ -122,9 +129,18 @@ class _FakeOperatingSystemLibrary:
     def start_process(self, command):
         self.command = command
 
+class _FakeRmiInfoListener:
+    def getPort(self):
+        return 12345
+
+    def waitForRmiInfo(self, timeout):
+        self.timeout = timeout
+        return 'rmi://someservice'
+
 class _FakePublisher:
     def start(self, rmi_info_storage):
         self.rmi_info_storage = rmi_info_storage
+        return 'rmi://someservice'
 
 class _FakeClassLoader:
     def __init__(self, class_=None):
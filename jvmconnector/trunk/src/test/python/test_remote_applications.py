@@ -1,8 +1,10 @@
+import time
 import unittest
 
-from robot.utils.asserts import assert_raises_with_msg
+from robot.utils.asserts import assert_equals, assert_raises_with_msg
 
 import RemoteApplications
+from RemoteApplications import RemoteAccessException, RemoteConnectFailureException
 
 
 class TestMultipleKeywordsWithSameName(unittest.TestCase):
@@ -21,7 +23,8 @@ class TestMultipleKeywordsWithSameName(unittest.TestCase):
 
     def _test_returned_kw_names(self, libs, expected):
         remote_app = RemoteApplications.RemoteApplication()
-        remote_app._libs = libs
+        for lib in libs:
+            remote_app.add_library(lib)
         self.assertEquals(expected, remote_app.get_keyword_names())
 
 
@@ -31,8 +34,8 @@ class TestRunningMultipleKeywordsWithSameName(unittest.TestCase):
         self._remote_app = RemoteApplications.RemoteApplication()
         lib1 = Library('lib1', ['foo', 'bar'])
         lib2 = Library('lib2', ['foo', 'zap'])
-        self._remote_app._libs = [lib1, lib2]
-        self._remote_app.get_keyword_names()
+        self._remote_app.add_library(lib1)
+        self._remote_app.add_library(lib2)
 
     def test_running_kw_with_single_kw(self):
         self._remote_app.run_keyword('bar', [])
@@ -47,18 +50,640 @@ class TestRunningMultipleKeywordsWithSameName(unittest.TestCase):
         self._remote_app.run_keyword('lib1.foo', [])
         self._remote_app.run_keyword('lib2.foo', [])
 
+    def test_long_name_runs_keyword_with_short_name(self):
+        self._remote_app.run_keyword('Lib1.Foo', [])
+        self.assertEquals(['foo'], self._remote_app._libs[0].executed)
+
+    def test_keyword_names_are_matched_normalized(self):
+        self._remote_app.run_keyword('Z A P', [])
+        self.assertEquals(['zap'], self._remote_app._libs[1].executed)
+
+    def test_keyword_names_are_updated_when_library_is_added(self):
+        self._remote_app.get_keyword_names()
+        self._remote_app.add_library(Library('lib3', ['new']))
+        self.assertEquals(['bar', 'foo', 'lib1.foo', 'lib2.foo', 'new', 'zap'],
+                          self._remote_app.get_keyword_names())
+
+
+class TestRunningKeywordsInBatch(unittest.TestCase):
+
+    def setUp(self):
+        self._remote_app = RemoteApplications.RemoteApplication()
+        self._lib1 = Library('lib1', ['foo', 'bar'])
+        self._lib2 = Library('lib2', ['zap', 'fail'])
+        self._remote_app.add_library(self._lib1)
+        self._remote_app.add_library(self._lib2)
+
+    def test_consecutive_keywords_from_same_library_are_sent_together(self):
+        calls = [('foo', ['a']), ('bar', []), ('zap', ['b']), ('foo', [])]
+        results = self._remote_app.run_keywords(calls, True)
+        self.assertEquals(4, len(results))
+        self.assertEquals([[('foo', ['a']), ('bar', [])], [('foo', [])]],
+                          self._lib1.batches)
+        self.assertEquals([[('zap', ['b'])]], self._lib2.batches)
+
+    def test_stops_after_failing_batch(self):
+        calls = [('fail', []), ('foo', [])]
+        results = self._remote_app.run_keywords(calls, True)
+        self.assertEquals(1, len(results))
+        self.assertEquals([], self._lib1.batches)
+
+    def test_continues_after_failing_batch(self):
+        calls = [('fail', []), ('foo', [])]
+        results = self._remote_app.run_keywords(calls, False)
+        self.assertEquals(2, len(results))
+        self.assertEquals([[('foo', [])]], self._lib1.batches)
+
+
+class TestReconnecting(unittest.TestCase):
+
+    def test_reconnects_and_retries_once_when_connecting_fails(self):
+        lib = _ReconnectingLibrary([RemoteConnectFailureException('connection lost'), 'ok'])
+        self.assertEquals('ok', lib.run_keyword('foo', []))
+        self.assertEquals(2, lib.connections)
+
+    def test_does_not_retry_more_than_once(self):
+        lib = _ReconnectingLibrary([RemoteConnectFailureException('lost'),
+                                    RemoteConnectFailureException('still lost')])
+        self.assertRaises(RemoteConnectFailureException, lib.run_keyword, 'foo', [])
+
+    def test_does_not_retry_when_call_fails_after_connecting(self):
+        lib = _ReconnectingLibrary([RemoteAccessException('lost'), 'ok'])
+        self.assertRaises(RemoteAccessException, lib.run_keyword, 'foo', [])
+        self.assertEquals(1, lib.connections)
+
+    def test_reconnects_libraries_when_heartbeat_has_lost_connection(self):
+        remote_app = RemoteApplications.RemoteApplication()
+        lib = Library('lib1', ['foo'])
+        remote_app.add_library(lib)
+        remote_app._heartbeat = _LostHeartbeat()
+        remote_app.run_keyword('foo', [])
+        self.assertEquals(1, lib.reconnects)
+        self.assertFalse(remote_app._heartbeat.connection_lost)
+
+    def test_service_is_created_again_only_when_connection_is_dead(self):
+        remote_app = RemoteApplications.RemoteApplication()
+        remote_app._create_service = lambda url: _Service(alive=True)
+        remote_app._service = _Service(alive=False)
+        remote_app._reconnect_service()
+        new_service = remote_app._service
+        self.assertTrue(new_service.alive)
+        remote_app._reconnect_service()
+        self.assertEquals(new_service, remote_app._service)
+
+
+class _ActiveApplicationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.connector = RemoteApplications.RemoteApplicationsConnector()
+        self.lib = self._create_library()
+        app = RemoteApplications.RemoteApplication()
+        app.add_library(self.lib)
+        self.connector._active_app = app
+
+    def _create_library(self):
+        return Library('lib1', ['foo'])
+
+
+class TestAsynchronousKeywords(_ActiveApplicationTestCase):
+
+    def _create_library(self):
+        return _AsynchronousLibrary('lib1', ['foo'])
+
+    def test_started_keyword_is_waited_for(self):
+        handle = self.connector.start_keyword_asynchronously('foo', 'arg')
+        assert_equals(['foo'], self.lib.started)
+        assert_equals('result of foo', self.connector.wait_for_keyword(handle))
+        assert_raises_with_msg(RuntimeError, "No started keyword with handle '%s'" % handle,
+                               self.connector.wait_for_keyword, handle)
+
+    def test_keyword_can_be_waited_for_again_after_timeout(self):
+        handle = self.connector.start_keyword_asynchronously('foo')
+        self.lib.finished = False
+        assert_raises_with_msg(RuntimeError, "Keyword 'foo' did not finish in 1 seconds",
+                               self.connector.wait_for_keyword, handle, '1 second')
+        self.lib.finished = True
+        assert_equals('result of foo', self.connector.wait_for_keyword(handle))
+
+    def test_output_is_read_while_keyword_runs(self):
+        handle = self.connector.start_keyword_asynchronously('foo')
+        self.connector._output_poll_interval = 0.01
+        self.lib.finished = False
+        self.lib.output = [('first\n', ''), ('second\n', 'error\n')]
+        written = []
+        self.connector._write_keyword_output = written.append
+        assert_raises_with_msg(RuntimeError, "Keyword 'foo' did not finish in 1 seconds",
+                               self.connector.wait_for_keyword, handle, '1 second')
+        assert_equals(('first\n', ''), written[0])
+        assert_equals(('second\n', 'error\n'), written[1])
+
+    def test_stopped_keyword_is_released(self):
+        handle = self.connector.start_keyword_asynchronously('foo')
+        self.connector.stop_keyword(handle)
+        assert_equals(['foo'], self.lib.released)
+        assert_raises_with_msg(RuntimeError, "No started keyword with handle '%s'" % handle,
+                               self.connector.wait_for_keyword, handle)
+
+    def test_keywords_of_closed_application_are_forgotten(self):
+        app = self.connector._active_app
+        app.close_application = lambda: None
+        self.connector._apps = _FakeApplications(connected={'App1': app})
+        handle = self.connector.start_keyword_asynchronously('foo')
+        self.connector.close_application('App1')
+        assert_equals({}, self.connector._started_keywords)
+        assert_raises_with_msg(RuntimeError, "No started keyword with handle '%s'" % handle,
+                               self.connector.wait_for_keyword, handle)
+
+
+class TestWaitingUntilRemoteKeywordSucceeds(_ActiveApplicationTestCase):
+
+    def test_retrying_is_done_in_one_remote_call(self):
+        result = self.connector.wait_until_remote_keyword_succeeds('2 seconds', '0.1',
+                                                                   'foo', 'arg')
+        assert_equals('result of foo', result)
+        assert_equals([('run_keyword_until_succeeds', 'foo', ['arg'], 2000, 100)],
+                      self.lib.calls)
+
+
+class TestRemoteKeywordTimeout(_ActiveApplicationTestCase):
+
+    def test_timeout_is_given_to_remote_keywords(self):
+        self.connector.set_remote_keyword_timeout('2 minutes')
+        self.connector.run_keyword('foo', [])
+        self.connector.set_remote_keyword_timeout()
+        self.connector.run_keyword('foo', [])
+        assert_equals([('run_keyword', 'foo', 120000), ('run_keyword', 'foo', None)],
+                      self.lib.calls)
+
+
+class TestPayloads(unittest.TestCase):
+
+    def setUp(self):
+        self.app = RemoteApplications.RemoteApplication()
+        self.app._service = _FakePayloadService()
+
+    def test_only_path_is_transferred_on_same_host(self):
+        self.app.rmi_url = 'binary://127.0.0.1:1234'
+        assert_equals('handle', self.app.upload_payload('/tmp/data.csv'))
+        assert_equals([('createPayload', '/tmp/data.csv')], self.app._service.calls)
+        assert_equals('/remote/payload', self.app.download_payload('handle'))
+
+    def test_keyword_result_is_kept_as_payload(self):
+        connector = RemoteApplications.RemoteApplicationsConnector()
+        connector._active_app = self.app
+        self.app.add_library(Library('lib1', ['Take Screenshot']))
+        assert_equals('payload handle', connector.get_payload_from_keyword('Take Screenshot'))
+        assert_equals([('runKeywordForPayload', 'lib1', 'Take Screenshot')], self.app._service.calls)
+
+    def test_target_path_is_needed_from_other_hosts(self):
+        self.app.rmi_url = 'rmi://testhost:1099/robotrmiservice'
+        assert_raises_with_msg(RuntimeError, "Target path must be given when the application is on another host",
+                               self.app.download_payload, 'handle')
+
+
+class TestObjectHandles(unittest.TestCase):
+
+    def test_handle_ids_are_given_to_service_as_handles(self):
+        app = RemoteApplications.RemoteApplication()
+        app._service = _FakeObjectService()
+        app.get_object_field('objecthandle-1', 'size')
+        handle = app._service.handles[0]
+        self.assertTrue(isinstance(handle, RemoteApplications.ObjectHandle))
+        app.release_object(handle)
+        self.assertTrue(app._service.handles[1] is handle)
+
+
+class TestJavaAgentArguments(unittest.TestCase):
+
+    def setUp(self):
+        self.connector = RemoteApplications.RemoteApplicationsConnector()
+        self.connector._get_jvm_connector_jar = lambda: '/lib/jvmconnector.jar'
+
+    def test_launch_options_are_passed_to_agent(self):
+        agent = self.connector._get_java_agent('/libs', None, 1234, 'abc')
+        assert_equals('-javaagent:"/lib/jvmconnector.jar"="NOTIFY=1234:TOKEN=abc:/libs"',
+                      agent)
+
+    def test_transport_is_passed_to_agent(self):
+        self.connector.set_transport('Binary')
+        agent = self.connector._get_java_agent('/libs', None, 1234, 'abc',
+                                               self.connector._transport)
+        assert_equals('-javaagent:"/lib/jvmconnector.jar"="NOTIFY=1234:TOKEN=abc:TRANSPORT=binary:/libs"',
+                      agent)
+
+    def test_rmi_is_used_by_default(self):
+        assert_equals(None, self.connector._get_transport(None))
+        assert_equals(None, self.connector._get_transport('5000'))
+
+    def test_local_transport_is_used_with_auto_when_port_is_not_given(self):
+        self.connector.set_transport('AUTO')
+        assert_equals('local', self.connector._get_transport(None))
+        assert_equals(None, self.connector._get_transport('5000'))
+
+    def test_transport_set_explicitly_is_always_used(self):
+        self.connector.set_transport('Local')
+        assert_equals('local', self.connector._get_transport('5000'))
+        self.connector.set_transport()
+        assert_equals(None, self.connector._get_transport(None))
+
+    def test_execution_policies_are_passed_to_agent(self):
+        self.connector.set_execution_policy('PARALLEL-4')
+        self.connector.set_execution_policy('Thread-Swing', 'org.example.SwingLib')
+        agent = self.connector._get_java_agent('/libs', None)
+        assert_equals('-javaagent:"/lib/jvmconnector.jar"="POLICY=parallel-4:POLICY=org.example.SwingLib=thread-swing:/libs"',
+                      agent)
+
+    def test_object_handle_policy_is_passed_to_agent(self):
+        self.connector.set_object_handles('ALL')
+        agent = self.connector._get_java_agent('/libs', None)
+        assert_equals('-javaagent:"/lib/jvmconnector.jar"="HANDLES=all:/libs"', agent)
+
+    def test_port_is_passed_to_agent(self):
+        agent = self.connector._get_java_agent(None, 5000)
+        assert_equals('-javaagent:"/lib/jvmconnector.jar"="PORT=5000:"', agent)
+
+
+class TestStartingApplications(unittest.TestCase):
+
+    def setUp(self):
+        self.connector = RemoteApplications.RemoteApplicationsConnector()
+        self.connector._apps = _FakeApplications()
+        self.connector._launch = self._fake_launch
+        self.connector._connect_to_launched_application = self._fake_connect
+        self.launched = []
+
+    def test_all_applications_are_launched_before_connecting(self):
+        self.connector.start_applications('1 min', '', 'App1', 'cmd1', 'App2', 'cmd2')
+        assert_equals(['App1', 'App2'], self.connector._apps.added)
+        assert_equals('App2 connected', self.connector._active_app)
+
+    def test_connected_applications_are_registered_when_one_fails(self):
+        assert_raises_with_msg(RuntimeError, "Could not connect to application Broken",
+                               self.connector.start_applications, '1 min', '',
+                               'Broken', 'cmd1', 'App2', 'cmd2')
+        assert_equals(['App2'], self.connector._apps.added)
+
+    def test_launched_applications_are_registered_when_launching_fails(self):
+        def launch(command, lib_dir, port):
+            if command == 'broken':
+                raise RuntimeError('Could not start broken')
+            self.launched.append(command)
+            return 'listener', 'token'
+        self.connector._launch = launch
+        self.connector._connect_to_launched_application = \
+            lambda alias, end_time, rmi_url, listener, token: '%s connected' % alias
+        assert_raises_with_msg(RuntimeError, 'Could not start broken',
+                               self.connector.start_applications, '1 min', '',
+                               'App1', 'cmd1', 'Broken', 'broken', 'App3', 'cmd3')
+        assert_equals(['cmd1'], self.launched)
+        assert_equals(['App1'], self.connector._apps.added)
+
+    def test_listener_is_closed_when_command_cannot_be_run(self):
+        listeners = []
+        class Listener:
+            closed = False
+            def __init__(self):
+                listeners.append(self)
+            def getPort(self):
+                return 1234
+            def close(self):
+                self.closed = True
+        def fail(*args):
+            raise RuntimeError('Could not run command')
+        orig_listener = RemoteApplications.RmiInfoListener
+        RemoteApplications.RmiInfoListener = Listener
+        connector = RemoteApplications.RemoteApplicationsConnector()
+        connector._run_command_with_java_tool_options = fail
+        try:
+            assert_raises_with_msg(RuntimeError, 'Could not run command',
+                                   connector._launch, 'cmd', None, None)
+        finally:
+            RemoteApplications.RmiInfoListener = orig_listener
+        self.assertTrue(listeners[0].closed)
+
+    def test_aliases_and_commands_must_be_given_in_pairs(self):
+        assert_raises_with_msg(RuntimeError, "Applications must be given as alias and command pairs",
+                               self.connector.start_applications, '1 min', '',
+                               'App1', 'cmd1', 'App2')
+
+    def test_same_alias_cannot_be_given_twice(self):
+        assert_raises_with_msg(RuntimeError, "Alias 'app 1' given more than once",
+                               self.connector.start_applications, '1 min', '',
+                               'App1', 'cmd1', 'app 1', 'cmd2')
+
+    def test_waiting_for_announcement_and_connecting_share_timeout(self):
+        self.connector._launch = lambda command, lib_dir, port: (_SilentListener(), 'token')
+        self.connector._retrieve_launched_url = lambda token: None
+        start = time.time()
+        assert_raises_with_msg(RuntimeError, "Could not connect to application App1",
+                               self.connector.start_application, 'App1', 'cmd', '1 second')
+        self.assertTrue(time.time() - start < 1.5)
+
+    def test_connecting_is_tried_once_when_timeout_is_used_up(self):
+        app = RemoteApplications.RemoteApplication()
+        attempts = []
+        def fail(url):
+            attempts.append(url)
+            raise RemoteAccessException('not yet')
+        app._create_service = fail
+        assert_raises_with_msg(RuntimeError, "Could not connect to application App1",
+                               app.connect, 'App1', time.time(), 'rmi://host:1099/service')
+        assert_equals(['rmi://host:1099/service'], attempts)
+
+    def _fake_launch(self, command, lib_dir, port):
+        self.launched.append(command)
+        return 'listener', 'token'
+
+    def _fake_connect(self, alias, end_time, rmi_url, listener, token):
+        assert_equals(['cmd1', 'cmd2'], self.launched)
+        if alias == 'Broken':
+            raise RuntimeError("Could not connect to application %s" % alias)
+        return '%s connected' % alias
+
+
+class TestTakingLibrariesIntoUse(unittest.TestCase):
+
+    def setUp(self):
+        self.app = RemoteApplications.RemoteApplication()
+        self.app._service = 'connected'
+        self.app.add_library(Library('lib1', ['foo']))
+        self.app._create_library = self._fake_create_library
+
+    def test_libraries_are_taken_into_use_in_given_order(self):
+        self.app.take_libraries_into_use('lib2', 'lib3')
+        assert_equals(['lib1', 'lib2', 'lib3'], [lib.name for lib in self.app._libs])
+
+    def test_libraries_already_in_use_are_not_imported_again(self):
+        self.app.take_libraries_into_use('lib1', 'lib2', 'lib2')
+        assert_equals(['lib1', 'lib2'], [lib.name for lib in self.app._libs])
+
+    def test_other_libraries_are_taken_into_use_when_one_fails(self):
+        assert_raises_with_msg(RuntimeError, "Importing 'broken' failed",
+                               self.app.take_libraries_into_use, 'broken', 'lib2')
+        assert_equals(['lib1', 'lib2'], [lib.name for lib in self.app._libs])
+
+    def test_keywords_are_updated_to_robot_when_one_fails(self):
+        connector = RemoteApplications.RemoteApplicationsConnector()
+        connector._active_app = self.app
+        updates = []
+        connector._update_keywords_to_robot = lambda: updates.append(True)
+        assert_raises_with_msg(RuntimeError, "Importing 'broken' failed",
+                               connector.take_libraries_into_use, 'broken', 'lib2')
+        assert_equals([True], updates)
+
+    def _fake_create_library(self, name):
+        if name == 'broken':
+            raise RuntimeError("Importing '%s' failed" % name)
+        return Library(name, [])
+
+
+class TestUpdatingKeywordsToRobot(unittest.TestCase):
+
+    def setUp(self):
+        self.connector = RemoteApplications.RemoteApplicationsConnector()
+        self.connector._kws = {'start_application': None}
+        app = RemoteApplications.RemoteApplication()
+        app.add_library(Library('lib1', ['foo']))
+        self.connector._apps = _FakeApplications([app])
+        self.robot_lib = _FakeRobotLibrary(['start_application'])
+        self._orig_namespaces = RemoteApplications.NAMESPACES
+        self._orig_importer = RemoteApplications.IMPORTER
+        RemoteApplications.NAMESPACES = _FakeNamespaces(self.robot_lib)
+        RemoteApplications.IMPORTER = _FakeImporter()
+
+    def tearDown(self):
+        RemoteApplications.NAMESPACES = self._orig_namespaces
+        RemoteApplications.IMPORTER = self._orig_importer
+
+    def test_only_new_keywords_are_added_to_existing_library(self):
+        original_handler = self.robot_lib.handlers['start_application']
+        self.connector._update_keywords_to_robot()
+        assert_equals(['foo'], self.robot_lib.created)
+        assert_equals(original_handler, self.robot_lib.handlers['start_application'])
+
+    def test_library_is_reimported_when_handlers_cannot_be_added(self):
+        del self.robot_lib.handlers
+        reimports = []
+        self.connector._reimport_library_to_robot = lambda: reimports.append(True)
+        self.connector._update_keywords_to_robot()
+        assert_equals([True], reimports)
+
+    def test_errors_adding_handlers_are_not_hidden(self):
+        def fail(name, method):
+            raise AttributeError('bug')
+        self.robot_lib._create_handler = fail
+        assert_raises_with_msg(AttributeError, 'bug',
+                               self.connector._update_keywords_to_robot)
+
+
+class _FakePayloadService:
+
+    def __init__(self):
+        self.calls = []
+
+    def createPayload(self, path):
+        self.calls.append(('createPayload', path))
+        return 'handle'
+
+    def getPayloadPath(self, handle):
+        return '/remote/payload'
+
+    def runKeywordForPayload(self, library_name, name, args):
+        self.calls.append(('runKeywordForPayload', library_name, name))
+        return Result(True, 'payload handle')
+
+
+class _FakeObjectService:
+
+    def __init__(self):
+        self.handles = []
+
+    def getObjectField(self, handle, name):
+        self.handles.append(handle)
+
+    def releaseObject(self, handle):
+        self.handles.append(handle)
+
+
+class _FakeRobotLibrary:
+    name = 'RemoteApplications'
+
+    def __init__(self, keyword_names):
+        self.handlers = {}
+        for name in keyword_names:
+            self.handlers[name] = 'handler for %s' % name
+        self.created = []
+
+    def get_instance(self):
+        return self
+
+    def _get_handler_method(self, instance, name):
+        return instance.run_keyword
+
+    def _create_handler(self, name, method):
+        self.created.append(name)
+        return 'handler for %s' % name
+
+    def run_keyword(self, name, args):
+        pass
+
+
+class _FakeNamespaces:
+
+    def __init__(self, lib):
+        self.current = self
+        self._testlibs = {'RemoteApplications': lib}
+
+
+class _FakeImporter:
+    _libraries = {}
+
+
+class _FakeApplications:
+
+    def __init__(self, apps=None, connected=None):
+        self.added = []
+        self._apps = apps or []
+        self._connected = connected or {}
+
+    def get_applications(self):
+        return self._apps
+
+    def has_connected_to_application(self, alias):
+        return self._connected.has_key(alias)
+
+    def get_application(self, alias):
+        return self._connected[alias]
+
+    def delete(self, alias):
+        del self._connected[alias]
+
+    def get_url(self, alias):
+        return None
+
+    def add(self, alias, app):
+        self.added.append(alias)
+
+
+class _ReconnectingLibrary(RemoteApplications.RemoteLibrary):
+
+    def __init__(self, responses):
+        self.connections = 0
+        self._responses = responses
+        RemoteApplications.RemoteLibrary.__init__(self, 'lib', lambda: self)
+
+    def _open_connection(self):
+        self.connections += 1
+        RemoteApplications.RemoteLibrary._open_connection(self)
+
+    def runKeyword(self, name, args):
+        response = self._responses.pop(0)
+        if response == 'ok':
+            return response
+        raise response
+
+
+class _Service:
+
+    def __init__(self, alive):
+        self.alive = alive
+
+    def ping(self):
+        if not self.alive:
+            raise RemoteAccessException('connection lost')
+        return True
+
+
+class _SilentListener:
+
+    def waitForRmiInfo(self, timeout_millis):
+        time.sleep(timeout_millis / 1000.0)
+        return None
+
+
+class _LostHeartbeat:
+    connection_lost = True
+
 
 class Library:
 
     def __init__(self, name, keyword_names):
         self.keyword_names = keyword_names
         self.name = name
+        self.batches = []
+        self.executed = []
+        self.calls = []
+        self.reconnects = 0
 
     def get_keyword_names(self):
         return self.keyword_names
 
-    def run_keyword(self, name, args):
-        pass
+    def run_keyword(self, name, args, timeout_millis=None):
+        self.executed.append(name)
+        self.calls.append(('run_keyword', name, timeout_millis))
+
+    def reconnect(self):
+        self.reconnects += 1
+
+    def run_keyword_until_succeeds(self, name, args, timeout_millis,
+                                   retry_interval_millis):
+        self.calls.append(('run_keyword_until_succeeds', name, list(args),
+                           timeout_millis, retry_interval_millis))
+        return Result(True, 'result of %s' % name)
+
+    def run_keywords(self, calls, stop_on_failure):
+        self.batches.append(calls)
+        return [Result(name != 'fail') for name, args in calls]
+
+
+class _AsynchronousLibrary(Library):
+
+    def __init__(self, name, keyword_names):
+        Library.__init__(self, name, keyword_names)
+        self.started = []
+        self.finished = True
+        self.output = []
+        self.released = []
+
+    def start_keyword(self, name, args):
+        self.started.append(name)
+        return name
+
+    def wait_for_keyword(self, handle, timeout_millis):
+        if not self.finished:
+            time.sleep(timeout_millis / 1000.0)
+            return None
+        return Result(True, 'result of %s' % handle)
+
+    def read_keyword_output(self, handle):
+        if self.output:
+            return self.output.pop(0)
+        return ('', '')
+
+    def release_keyword(self, handle):
+        self.released.append(handle)
+
+
+class Result:
+
+    def __init__(self, passed, result=None):
+        self._passed = passed
+        self._result = result
+
+    def keywordPassed(self):
+        return self._passed
+
+    def getResult(self):
+        return self._result
+
+    def getAttempts(self):
+        return 1
+
+    def getStdOutAsString(self):
+        return ''
+
+    def getStdErrAsString(self):
+        return ''
 
 if __name__ == '__main__':
     unittest.main()